@@ -0,0 +1,187 @@
+"""
+Throughput of the A2A server as the number of worker processes grows.
+
+For each worker count the benchmark starts `run_a2a.py` with A2A_WORKERS set,
+on its own port and with a temporary state database. It seeds the shared task
+store with a finished task (carrying a ~150 KB transcript artifact) and a
+running one, then has several client processes poll `tasks/get` for both as
+fast as they can. Each request can be served by any worker. No MCP server,
+backend or Gemini key is needed.
+
+    python benchmarks/a2a_worker_bench.py --workers 1 2 4 8 --duration 15
+
+Pass `--query` to also send one `message/send` per `--send-every` requests.
+That needs the MCP server and backend running, e.g.
+`--query "Get Microsoft's Q4 2023 earnings call"` for fast-path fetches.
+
+It reports requests/s, p50/p95 latency and the speedup over the smallest
+worker count. Client processes (`--clients`) should outnumber the server's
+workers so that the clients are not the bottleneck.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from typing import Any, Dict, List
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+
+def seed_tasks(db_path: str) -> List[str]:
+    """Writes a completed and a working task to the shared store and returns their ids."""
+    from a2a.types import Artifact, Part, Task, TaskState, TaskStatus, TextPart
+    from earnings_call_transcript_agent.task_store import SQLiteTaskStore
+
+    store = SQLiteTaskStore(db_path)
+    transcript = "Operator: Good afternoon and welcome to the call. " * 3000
+    tasks = []
+    for state, artifacts in ((TaskState.completed, [transcript]), (TaskState.working, [])):
+        task = Task(
+            id=uuid.uuid4().hex,
+            contextId=uuid.uuid4().hex,
+            status=TaskStatus(state=state),
+            artifacts=[
+                Artifact(artifactId=uuid.uuid4().hex, name="bench_transcript.md", parts=[Part(root=TextPart(text=text))])
+                for text in artifacts
+            ],
+        )
+        asyncio.run(store.save(task))
+        tasks.append(task.id)
+    store.close()
+    return tasks
+
+
+def start_server(workers: int, port: int, db_path: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "A2A_WORKERS": str(workers),
+        "EARNINGS_CALL_TRANSCRIPT_A2A_PORT_INTERNAL": str(port),
+        "A2A_STATE_DB_PATH": db_path,
+        "LOG_LEVEL": "warning",
+    }
+    return subprocess.Popen([sys.executable, os.path.join(ROOT, "run_a2a.py")], env=env)
+
+
+def wait_until_ready(url: str, timeout: float = 120) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{url}/health", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"A2A server at {url} did not become ready")
+
+
+def rpc(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": uuid.uuid4().hex, "method": method, "params": params}
+
+
+def send_params(query: str) -> Dict[str, Any]:
+    return {"message": {
+        "role": "user",
+        "messageId": uuid.uuid4().hex,
+        "parts": [{"kind": "text", "text": query}],
+        "metadata": {"user_id": f"bench_{uuid.uuid4().hex[:6]}"},
+    }}
+
+
+async def drive(url: str, task_ids: List[str], concurrency: int, duration: float, query: str, send_every: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, timeout=300, limits=limits) as client:
+        async def worker(offset: int) -> None:
+            nonlocal errors
+            n = offset
+            while time.monotonic() < deadline:
+                n += 1
+                if query and n % send_every == 0:
+                    body = rpc("message/send", send_params(query))
+                else:
+                    body = rpc("tasks/get", {"id": task_ids[n % len(task_ids)]})
+                started = time.perf_counter()
+                response = await client.post("/", json=body)
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - started) * 1000)
+                # JSON-RPC errors (e.g. task not found) come back with HTTP 200
+                if "result" not in response.json():
+                    errors += 1
+
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return {"latencies": latencies, "errors": errors}
+
+
+def client_process(args: tuple) -> Dict[str, Any]:
+    return asyncio.run(drive(*args))
+
+
+def bench(workers: int, port: int, clients: int, concurrency: int, duration: float, query: str, send_every: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "a2a_state.db")
+        task_ids = seed_tasks(db_path)
+        server = start_server(workers, port, db_path)
+        url = f"http://127.0.0.1:{port}"
+        try:
+            wait_until_ready(url)
+            # Warm every worker's memory tier and connections before measuring
+            asyncio.run(drive(url, task_ids, concurrency, 2, "", send_every))
+            per_client = max(concurrency // clients, 1)
+            with multiprocessing.get_context("spawn").Pool(clients) as pool:
+                started = time.perf_counter()
+                results = pool.map(client_process, [(url, task_ids, per_client, duration, query, send_every)] * clients)
+                elapsed = time.perf_counter() - started
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+    latencies = sorted(latency for result in results for latency in result["latencies"])
+    return {
+        "requests": len(latencies),
+        "errors": sum(result["errors"] for result in results),
+        "throughput": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--clients", type=int, default=max(os.cpu_count() // 2, 2), help="client processes")
+    parser.add_argument("--concurrency", type=int, default=64, help="requests in flight, across all clients")
+    parser.add_argument("--duration", type=float, default=10, help="seconds per worker count")
+    parser.add_argument("--query", default="", help="also send this message every --send-every requests")
+    parser.add_argument("--send-every", type=int, default=50)
+    args = parser.parse_args()
+
+    results = {}
+    for workers in args.workers:
+        print(f"Benchmarking {workers} worker(s) ...")
+        results[workers] = bench(workers, args.port, args.clients, args.concurrency, args.duration, args.query, args.send_every)
+
+    baseline = results[args.workers[0]]["throughput"]
+    print()
+    print(f"CPU cores: {os.cpu_count()}")
+    print(f"  {'workers':<10}{'requests':>10}{'errors':>8}{'req/s':>10}{'speedup':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for workers, result in results.items():
+        print(
+            f"  {workers:<10}{result['requests']:>10}{result['errors']:>8}{result['throughput']:>10.1f}"
+            f"{result['throughput'] / baseline:>9.2f}x{result['p50']:>10.2f}{result['p95']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
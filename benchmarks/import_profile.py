@@ -0,0 +1,117 @@
+"""
+Import-time profile for the three services.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter for each
+service entry module and reports the total import cost plus the heaviest
+imports. Use `--history` to append one JSON line per run so cold start can be
+tracked over time.
+
+    python benchmarks/import_profile.py
+    python benchmarks/import_profile.py --top 15 --history cache/import_profile.jsonl
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Any, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_PATH = os.path.join(PROJECT_ROOT, "src")
+
+SERVICE_MODULES = {
+    "backend": "backend_api.earnings_call_api",
+    "mcp": "mcp_server.server",
+    "a2a": "earnings_call_transcript_agent.server",
+}
+
+
+def profile_module(module: str) -> Dict[str, Any]:
+    """Imports `module` in a fresh interpreter and parses its -X importtime output."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_PATH, env.get("PYTHONPATH")]))
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    imports: List[Dict[str, Any]] = []
+    errors: List[str] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            errors.append(line)
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()
+        imports.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+            "self_us": int(fields[0]),
+            "cumulative_us": int(fields[1]),
+        })
+
+    top_level = [i for i in imports if i["depth"] == 0]
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "wall_ms": round(wall_ms, 1),
+        "import_ms": round(sum(i["cumulative_us"] for i in top_level) / 1000, 1),
+        "modules_loaded": len(imports),
+        "imports": imports,
+        "error": "\n".join(errors[-5:]) if proc.returncode else None,
+    }
+
+
+def print_report(service: str, profile: Dict[str, Any], top: int) -> None:
+    status = "ok" if profile["ok"] else "FAILED"
+    print(f"\n== {service}: {profile['module']} [{status}]")
+    print(f"   wall {profile['wall_ms']} ms | imports {profile['import_ms']} ms | "
+          f"{profile['modules_loaded']} modules")
+    if profile["error"]:
+        print(f"   error: {profile['error']}")
+
+    heaviest = sorted(
+        (i for i in profile["imports"] if i["depth"] == 0),
+        key=lambda i: i["cumulative_us"], reverse=True,
+    )[:top]
+    for item in heaviest:
+        print(f"   {item['cumulative_us'] / 1000:9.1f} ms  {item['module']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=10, help="Number of heaviest imports to list per service.")
+    parser.add_argument("--history", help="Append a JSON summary line to this file.")
+    parser.add_argument("services", nargs="*", help=f"Services to profile (default: all of {', '.join(SERVICE_MODULES)}).")
+    args = parser.parse_args()
+    unknown = set(args.services) - set(SERVICE_MODULES)
+    if unknown:
+        parser.error(f"unknown services: {', '.join(sorted(unknown))}")
+
+    summary = {"timestamp": datetime.utcnow().isoformat(), "python": sys.version.split()[0], "services": {}}
+    for service in args.services or SERVICE_MODULES:
+        profile = profile_module(SERVICE_MODULES[service])
+        print_report(service, profile, args.top)
+        summary["services"][service] = {
+            "ok": profile["ok"],
+            "wall_ms": profile["wall_ms"],
+            "import_ms": profile["import_ms"],
+            "modules_loaded": profile["modules_loaded"],
+        }
+
+    if args.history:
+        with open(args.history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(summary) + "\n")
+        print(f"\nAppended summary to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Tool-call latency benchmark for the MCP server's SSE and streamable-HTTP transports.
+
+Start one MCP server per transport, then point the benchmark at them:
+
+    MCP_TRANSPORT=sse EARNINGS_CALL_MCP_PORT_INTERNAL=8081 python run_mcp.py
+    MCP_TRANSPORT=streamable-http EARNINGS_CALL_MCP_PORT_INTERNAL=8083 python run_mcp.py
+
+    python benchmarks/mcp_transport_bench.py \\
+        --sse-url http://127.0.0.1:8081/mcp --http-url http://127.0.0.1:8083/mcp
+
+For each transport it reports session setup time (connect + initialize), and
+p50/p95/mean latency of a local tool call (`resolve_ticker`, no backend needed)
+on one reused session, with `--concurrency` calls in flight, and with a new
+session per call (what a client without connection reuse pays).
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List
+
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
+
+TOOL = "resolve_ticker"
+TOOL_ARGS = {"query": "Microsoft", "limit": 3}
+
+
+@asynccontextmanager
+async def open_session(transport: str, url: str):
+    if transport == "sse":
+        async with sse_client(url) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session
+    else:
+        async with streamablehttp_client(url) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50": statistics.median(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "mean": statistics.fmean(ordered),
+    }
+
+
+async def timed_call(session: ClientSession) -> float:
+    started = time.perf_counter()
+    await session.call_tool(TOOL, TOOL_ARGS)
+    return (time.perf_counter() - started) * 1000
+
+
+async def bench_transport(transport: str, url: str, calls: int, concurrency: int, fresh_calls: int) -> Dict[str, Any]:
+    setup = []
+    for _ in range(3):
+        started = time.perf_counter()
+        async with open_session(transport, url):
+            setup.append((time.perf_counter() - started) * 1000)
+
+    async with open_session(transport, url) as session:
+        await timed_call(session)
+        sequential = [await timed_call(session) for _ in range(calls)]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited() -> float:
+            async with semaphore:
+                return await timed_call(session)
+
+        started = time.perf_counter()
+        concurrent = await asyncio.gather(*(limited() for _ in range(calls)))
+        throughput = calls / (time.perf_counter() - started)
+
+    fresh = []
+    for _ in range(fresh_calls):
+        started = time.perf_counter()
+        async with open_session(transport, url) as session:
+            await session.call_tool(TOOL, TOOL_ARGS)
+        fresh.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "setup": summarize(setup),
+        "sequential": summarize(sequential),
+        "concurrent": summarize(list(concurrent)),
+        "throughput": throughput,
+        "fresh_session": summarize(fresh),
+    }
+
+
+def print_report(results: Dict[str, Dict[str, Any]], concurrency: int) -> None:
+    print(f"  {'transport':<17}{'measure':<22}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+    for transport, result in results.items():
+        for measure, label in (
+            ("setup", "session setup"),
+            ("sequential", "call, reused session"),
+            ("concurrent", f"call, {concurrency} in flight"),
+            ("fresh_session", "call, new session"),
+        ):
+            stats = result[measure]
+            print(f"  {transport:<17}{label:<22}{stats['p50']:>10.2f}{stats['p95']:>10.2f}{stats['mean']:>10.2f}")
+        print(f"  {transport:<17}{'throughput':<22}{result['throughput']:>10.1f} calls/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sse-url", help="MCP endpoint of a server running with MCP_TRANSPORT=sse")
+    parser.add_argument("--http-url", help="MCP endpoint of a server running with MCP_TRANSPORT=streamable-http")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--fresh-calls", type=int, default=20)
+    args = parser.parse_args()
+
+    targets = {"sse": args.sse_url, "streamable-http": args.http_url}
+    results = {}
+    for transport, url in targets.items():
+        if not url:
+            continue
+        print(f"Benchmarking {transport} at {url} ...")
+        results[transport] = await bench_transport(transport, url, args.calls, args.concurrency, args.fresh_calls)
+
+    if not results:
+        parser.error("pass --sse-url and/or --http-url")
+    print()
+    print_report(results, args.concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
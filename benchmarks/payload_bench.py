@@ -0,0 +1,117 @@
+"""
+Serialization and compression benchmark for a ~150 KB transcript payload.
+
+Measures encode/decode CPU time for the stdlib json module and orjson, and the
+bytes on the wire plus compression time for identity, gzip and zstd encodings.
+orjson and zstandard are optional; missing ones are reported as skipped.
+
+    python benchmarks/payload_bench.py
+    python benchmarks/payload_bench.py --size-kb 300 --rounds 200
+"""
+
+import argparse
+import gzip
+import json
+import random
+import time
+from typing import Any, Callable, Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+SPEAKERS = [
+    ("Operator", None),
+    ("Satya Nadella", "Chief Executive Officer"),
+    ("Amy Hood", "Chief Financial Officer"),
+    ("Keith Weiss", "Morgan Stanley"),
+    ("Brent Thill", "Jefferies"),
+]
+WORDS = (
+    "revenue growth cloud margin guidance quarter customers demand pricing capacity "
+    "investment operating expenses AI workloads consumption bookings backlog currency "
+    "we expect continued strength across our commercial business and the year ahead"
+).split()
+
+
+def make_transcript_payload(size_kb: int, seed: int = 7) -> Dict[str, Any]:
+    """Builds a backend-shaped /get-transcript response with a transcript of roughly `size_kb`."""
+    rng = random.Random(seed)
+    turns, size = [], 0
+    while size < size_kb * 1024:
+        name, title = rng.choice(SPEAKERS)
+        header = f"{name} -- {title}" if title else name
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 220))).capitalize() + "."
+        turns.append(f"{header}\n\n{text}")
+        size += len(turns[-1]) + 2
+    return {
+        "success": True,
+        "source": "Motley Fool",
+        "source_url": "https://www.fool.com/earnings/call-transcripts/2023/07/25/microsoft-msft-q4-2023-earnings-call-transcript/",
+        "title": "Microsoft (MSFT) Q4 2023 Earnings Call Transcript",
+        "transcript": "\n\n".join(turns),
+        "search_method": "pattern_matching",
+        "message": "Retrieved from Motley Fool (pattern_matching)",
+    }
+
+
+def time_it(fn: Callable[[], Any], rounds: int) -> float:
+    """Returns the mean wall time of `fn` in milliseconds."""
+    fn()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) * 1000 / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-kb", type=int, default=150)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+
+    payload = make_transcript_payload(args.size_kb)
+    std_bytes = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    print(f"Payload: {len(std_bytes) / 1024:.1f} KB JSON, {len(payload['transcript']) / 1024:.1f} KB transcript\n")
+
+    print("Serialization (mean per call)")
+    print(f"  {'codec':<10}{'encode ms':>12}{'decode ms':>12}")
+    enc = time_it(lambda: json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), args.rounds)
+    dec = time_it(lambda: json.loads(std_bytes), args.rounds)
+    print(f"  {'json':<10}{enc:>12.3f}{dec:>12.3f}")
+    if orjson is not None:
+        or_bytes = orjson.dumps(payload)
+        enc = time_it(lambda: orjson.dumps(payload), args.rounds)
+        dec = time_it(lambda: orjson.loads(or_bytes), args.rounds)
+        print(f"  {'orjson':<10}{enc:>12.3f}{dec:>12.3f}")
+    else:
+        print(f"  {'orjson':<10}{'skipped (not installed)':>24}")
+
+    print("\nCompression on the wire")
+    print(f"  {'encoding':<12}{'bytes':>10}{'ratio':>8}{'compress ms':>14}{'decompress ms':>16}")
+    print(f"  {'identity':<12}{len(std_bytes):>10}{1.0:>8.2f}{0.0:>14.3f}{0.0:>16.3f}")
+    for level in (1, 6):
+        body = gzip.compress(std_bytes, compresslevel=level)
+        c = time_it(lambda: gzip.compress(std_bytes, compresslevel=level), args.rounds)
+        d = time_it(lambda: gzip.decompress(body), args.rounds)
+        print(f"  {f'gzip-{level}':<12}{len(body):>10}{len(std_bytes) / len(body):>8.2f}{c:>14.3f}{d:>16.3f}")
+    if zstandard is not None:
+        for level in (3, 9):
+            compressor = zstandard.ZstdCompressor(level=level)
+            decompressor = zstandard.ZstdDecompressor()
+            body = compressor.compress(std_bytes)
+            c = time_it(lambda: compressor.compress(std_bytes), args.rounds)
+            d = time_it(lambda: decompressor.decompress(body), args.rounds)
+            print(f"  {f'zstd-{level}':<12}{len(body):>10}{len(std_bytes) / len(body):>8.2f}{c:>14.3f}{d:>16.3f}")
+    else:
+        print(f"  {'zstd':<12}skipped (zstandard not installed)")
+
+
+if __name__ == "__main__":
+    main()
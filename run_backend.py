@@ -1,5 +1,7 @@
 import sys
 import os
+import argparse
+import importlib.util
 import uvicorn
 from dotenv import load_dotenv
 
@@ -9,6 +11,20 @@ load_dotenv(dotenv_path=dotenv_path)
 
 # The rest of the original script content (e.g., import sys, import uvicorn...) goes below this.
 
+def parse_args(settings) -> argparse.Namespace:
+    """Command-line overrides for the serving mode configured in settings."""
+    parser = argparse.ArgumentParser(description="Run the earnings call transcript backend API.")
+    parser.add_argument(
+        "--production", action="store_true",
+        default=settings.BACKEND_SERVING_MODE == "production",
+        help="Run multiple worker processes without auto-reload."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=settings.BACKEND_WORKERS,
+        help="Number of worker processes in production mode."
+    )
+    return parser.parse_args()
+
 def main():
     """Launcher for the Backend API server."""
     project_root = os.path.dirname(os.path.abspath(__file__))
@@ -16,13 +32,35 @@ def main():
     if src_path not in sys.path:
         sys.path.insert(0, src_path)
 
+    from config.config import settings
+    args = parse_args(settings)
+
+    if not args.production:
+        uvicorn.run(
+            "backend_api.earnings_call_api:app",
+            host="127.0.0.1",
+            port=8082,
+            reload=True,
+            reload_dirs=[src_path]
+        )
+        return
+
+    # Worker processes are spawned fresh and need 'src' on their import path too
+    os.environ["PYTHONPATH"] = os.pathsep.join(filter(None, [src_path, os.environ.get("PYTHONPATH")]))
+
+    use_fast_loop = settings.BACKEND_USE_UVLOOP and importlib.util.find_spec("uvloop") is not None
+    use_httptools = settings.BACKEND_USE_UVLOOP and importlib.util.find_spec("httptools") is not None
+
     uvicorn.run(
         "backend_api.earnings_call_api:app",
-        host="127.0.0.1",
-        port=8082,
-        reload=True,
-        reload_dirs=[src_path]
+        host="0.0.0.0" if settings.APP_ENVIRONMENT == "docker" else "127.0.0.1",
+        port=settings.EARNINGS_CALL_BACKEND_PORT_INTERNAL,
+        workers=max(1, args.workers),
+        loop="uvloop" if use_fast_loop else "asyncio",
+        http="httptools" if use_httptools else "h11",
+        timeout_graceful_shutdown=settings.BACKEND_GRACEFUL_SHUTDOWN_SECONDS,
+        log_level=settings.LOG_LEVEL.lower(),
     )
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
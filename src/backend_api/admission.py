@@ -0,0 +1,184 @@
+"""
+Admission control, request deadlines and load shedding for the backend.
+
+Each worker admits at most `BACKEND_MAX_IN_FLIGHT` transcript fetches at once
+and queues up to `BACKEND_MAX_QUEUE` more. Beyond that, requests are rejected
+immediately instead of piling up. Every admitted request runs under a deadline
+taken from the caller's `X-Request-Timeout` header (seconds). When the deadline
+expires or the client disconnects, the fetch task is cancelled, and source calls
+running in worker threads stop at their next `check_deadline()`.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, Awaitable, TypeVar
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEADLINE_HEADER = "X-Request-Timeout"
+
+
+class Overloaded(Exception):
+    """Raised when the worker cannot admit a request."""
+
+    def __init__(self, message: str, status_code: int = 503, retry_after: int = 1):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a request runs past its deadline."""
+
+
+class ClientDisconnected(Exception):
+    """Raised when the caller goes away before the response is ready."""
+
+
+class RequestDeadline:
+    """Absolute deadline for one request, shared with the threads doing its source calls."""
+
+    def __init__(self, timeout: float):
+        self.expires_at = time.monotonic() + timeout
+        self.cancel_reason: Optional[str] = None
+
+    @classmethod
+    def from_headers(cls, headers: Headers, default: float, maximum: float) -> "RequestDeadline":
+        """Builds the deadline from the caller's timeout header, clamped to `maximum`."""
+        try:
+            timeout = float(headers.get(DEADLINE_HEADER, default))
+        except ValueError:
+            timeout = default
+        return cls(max(0.0, min(timeout, maximum)))
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.cancel_reason is not None or self.remaining() <= 0
+
+    def cancel(self, reason: str) -> None:
+        self.cancel_reason = reason
+
+
+current_deadline: contextvars.ContextVar[Optional[RequestDeadline]] = contextvars.ContextVar(
+    "current_deadline", default=None
+)
+
+
+def check_deadline() -> None:
+    """Raises DeadlineExceeded if the current request was cancelled or ran out of time."""
+    deadline = current_deadline.get()
+    if deadline is not None and deadline.expired():
+        raise DeadlineExceeded(deadline.cancel_reason or "deadline exceeded")
+
+
+def call_timeout(default: float) -> float:
+    """Per-call timeout: `default`, shortened to what is left of the request deadline."""
+    deadline = current_deadline.get()
+    if deadline is None:
+        return default
+    check_deadline()
+    return max(0.1, min(default, deadline.remaining()))
+
+
+class AdmissionController:
+    """Bounded in-flight limit with a bounded wait queue."""
+
+    def __init__(self, max_in_flight: int, max_queue: int, queue_timeout: float):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted_total = 0
+        self.rejected_total = 0
+        self.expired_total = 0
+
+    @asynccontextmanager
+    async def admit(self, deadline: RequestDeadline):
+        """
+        Holds an execution slot for the duration of the block.
+
+        Raises:
+            DeadlineExceeded: The deadline was spent before a slot was free.
+            Overloaded: The queue is full, or no slot freed up within `queue_timeout`.
+        """
+        if deadline.remaining() <= 0:
+            self.expired_total += 1
+            raise DeadlineExceeded("deadline exceeded before admission")
+
+        if self.in_flight >= self.max_in_flight and self.queued >= self.max_queue:
+            self.rejected_total += 1
+            raise Overloaded("Backend is saturated; retry shortly", status_code=429)
+
+        self.queued += 1
+        try:
+            wait = min(self.queue_timeout, deadline.remaining())
+            await asyncio.wait_for(self._slots.acquire(), timeout=max(0.0, wait))
+        except asyncio.TimeoutError:
+            if deadline.remaining() <= 0:
+                self.expired_total += 1
+                raise DeadlineExceeded("deadline exceeded while queued for a backend slot")
+            self.rejected_total += 1
+            raise Overloaded("Timed out waiting for a free backend slot", status_code=503)
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        self.admitted_total += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "admitted_total": self.admitted_total,
+            "rejected_total": self.rejected_total,
+            "expired_total": self.expired_total,
+        }
+
+    async def run(self, coro: Awaitable[T], deadline: RequestDeadline, request: Optional[Request] = None) -> T:
+        """
+        Runs `coro` under `deadline`, cancelling it if the deadline passes or
+        the client disconnects.
+        """
+        token = current_deadline.set(deadline)
+        try:
+            task = asyncio.ensure_future(coro)
+        finally:
+            current_deadline.reset(token)
+
+        try:
+            while True:
+                remaining = deadline.remaining()
+                if remaining <= 0:
+                    deadline.cancel("deadline exceeded")
+                    self.expired_total += 1
+                    raise DeadlineExceeded("deadline exceeded")
+
+                done, _ = await asyncio.wait({task}, timeout=min(0.5, remaining))
+                if done:
+                    return task.result()
+
+                if request is not None and await request.is_disconnected():
+                    deadline.cancel("client disconnected")
+                    raise ClientDisconnected("client disconnected")
+        finally:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,188 @@
+"""
+Transcript availability index: which (year, quarter) transcripts exist for a
+ticker, from which sources, and whether they are already cached.
+
+The index lives next to the transcript cache in the shared SQLite store and is
+populated from three places:
+    - transcripts written to the cache,
+    - transcript URLs seen while searching sources ("learned" URLs),
+    - background discovery runs that list a ticker's transcripts on Motley Fool.
+Lookups are answered by a single query on the (ticker, year, quarter) index.
+Whether a period is cached is checked against the unexpired rows of the
+transcript cache at lookup time. The stored `cached` flag only records that a
+transcript was cached once, and cache entries expire without telling the index.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcript_availability (
+    ticker TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    quarter INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    url TEXT,
+    cached INTEGER NOT NULL DEFAULT 0,
+    discovered_at TEXT,
+    PRIMARY KEY (ticker, year, quarter, source)
+);
+CREATE INDEX IF NOT EXISTS idx_availability_ticker_period
+    ON transcript_availability (ticker, year, quarter);
+CREATE TABLE IF NOT EXISTS availability_discovery (
+    ticker TEXT PRIMARY KEY,
+    discovered_at TEXT
+);
+"""
+
+# Motley Fool slugs look like ".../microsoft-msft-q4-2021-earnings-call-transcript/"
+_FOOL_SLUG_RE = re.compile(r"(?:^|-)([a-z0-9.]+)-q([1-4])-(\d{4})(?:-|$)")
+
+Availability = Tuple[str, int, int, str, Optional[str]]
+
+
+def parse_transcript_url(url: str) -> Optional[Tuple[str, int, int]]:
+    """
+    Extracts (ticker, fiscal year, quarter) from a Motley Fool transcript URL.
+
+    Returns:
+        The parsed tuple, or None if the URL is not a recognizable transcript link.
+    """
+    if "/earnings/call-transcripts/" not in url:
+        return None
+    slug = url.rstrip("/").rsplit("/", 1)[-1].lower()
+    match = _FOOL_SLUG_RE.search(slug)
+    if not match:
+        return None
+    return match.group(1).upper(), int(match.group(3)), int(match.group(2))
+
+
+class AvailabilityIndex:
+    """SQLite-backed index of known transcripts per ticker and quarter."""
+
+    def __init__(self, db_path: str, discovery_interval_hours: int = 24):
+        self.db_path = db_path
+        self.discovery_interval = timedelta(hours=discovery_interval_hours)
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def record(self, ticker: str, year: int, quarter: int, source: str,
+               url: Optional[str] = None, cached: bool = False) -> None:
+        """Marks a transcript as available from `source` (and cached, if so)."""
+        self.record_many([(ticker, year, quarter, source, url)], cached=cached)
+
+    def record_many(self, entries: Iterable[Availability], cached: bool = False) -> None:
+        """Upserts several availability entries; never downgrades a cached entry."""
+        now = datetime.utcnow().isoformat()
+        rows = [(t.upper(), y, q, s, u, int(cached), now) for t, y, q, s, u in entries]
+        if not rows:
+            return
+        try:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT INTO transcript_availability (ticker, year, quarter, source, url, cached, discovered_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (ticker, year, quarter, source) DO UPDATE SET "
+                "url = COALESCE(excluded.url, url), cached = MAX(cached, excluded.cached)",
+                rows,
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Availability index write failed: {e}")
+
+    def backfill_from_cache(self) -> int:
+        """Indexes every transcript already in the cache table."""
+        try:
+            conn = self._connect()
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO transcript_availability "
+                "(ticker, year, quarter, source, url, cached, discovered_at) "
+                "SELECT ticker, year, CAST(SUBSTR(quarter, 2) AS INTEGER), COALESCE(source, 'cache'), url, 1, cached_at "
+                "FROM transcript_cache WHERE ticker IS NOT NULL AND year IS NOT NULL AND quarter IS NOT NULL"
+            )
+            conn.commit()
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Availability index backfill failed: {e}")
+            return 0
+
+    def lookup(self, ticker: str, start_year: Optional[int] = None,
+               end_year: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Lists known transcripts for a ticker, newest first.
+
+        Returns:
+            One entry per (year, quarter) with its sources, URLs and whether an
+            unexpired copy is in the transcript cache.
+        """
+        rows = self._connect().execute(
+            "SELECT a.year, a.quarter, a.source, a.url, EXISTS ("
+            "    SELECT 1 FROM transcript_cache c WHERE c.ticker = a.ticker AND c.year = a.year "
+            "    AND c.quarter = 'Q' || a.quarter AND c.expires_at > ?"
+            ") AS cached FROM transcript_availability a "
+            "WHERE a.ticker = ? AND a.year BETWEEN ? AND ? ORDER BY a.year DESC, a.quarter DESC",
+            (datetime.utcnow().isoformat(), ticker.upper(), start_year or 0, end_year or 9999),
+        ).fetchall()
+
+        periods: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        for row in rows:
+            period = periods.setdefault((row["year"], row["quarter"]), {
+                "year": row["year"],
+                "quarter": row["quarter"],
+                "sources": [],
+                "urls": [],
+                "cached": False,
+            })
+            period["sources"].append(row["source"])
+            if row["url"]:
+                period["urls"].append(row["url"])
+            period["cached"] = period["cached"] or bool(row["cached"])
+        return list(periods.values())
+
+    def claim_discovery(self, ticker: str) -> bool:
+        """
+        Returns True if discovery for `ticker` is due, and marks it as started so
+        other workers do not run it concurrently.
+        """
+        now = datetime.utcnow()
+        cutoff = (now - self.discovery_interval).isoformat()
+        try:
+            conn = self._connect()
+            cursor = conn.execute(
+                "INSERT INTO availability_discovery (ticker, discovered_at) VALUES (?, ?) "
+                "ON CONFLICT (ticker) DO UPDATE SET discovered_at = excluded.discovered_at "
+                "WHERE availability_discovery.discovered_at < ?",
+                (ticker.upper(), now.isoformat(), cutoff),
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            logger.error(f"Availability discovery claim failed for {ticker}: {e}")
+            return False
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -459,13 +459,30 @@ import os
 from datetime import datetime
 import json
 import traceback
+import asyncio
+from contextlib import asynccontextmanager
 
-import requests
-import yfinance as yf
-from bs4 import BeautifulSoup
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
+from config.config import settings
+from backend_api.http_pool import get_http_session, prewarm_http_pool, close_http_session
+from backend_api.transcript_cache import TranscriptCache, make_cache_key, make_url_cache_key
+from backend_api.page_verifier import fetch_page, PageRejected
+from backend_api.availability_index import AvailabilityIndex, parse_transcript_url
+from backend_api.transcript_search import TranscriptSearcher
+from backend_api.term_trends import TermTrendAnalyzer
+from backend_api.roster import extract_roster
+from backend_api.progress import EVENT_STREAM, wants_progress, report_progress, stream_with_progress
+from backend_api.admission import (
+    AdmissionController, RequestDeadline, Overloaded, DeadlineExceeded, ClientDisconnected,
+    check_deadline, call_timeout,
+)
+from utils.json_codec import FastJSONResponse
+from utils.compression import CompressionMiddleware
+from utils.ticker_master import get_ticker_master, normalize_name
+
 # Configure logging with more detail
 logging.basicConfig(
     level=logging.DEBUG,
@@ -474,21 +491,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Configure Gemini
+# The SDK (and yfinance/bs4 below) are imported on first use or by the
+# background warm-up after startup, so importing this module stays cheap.
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 logger.info(f"Google API Key configured: {bool(GOOGLE_API_KEY)}")
 
-if GOOGLE_API_KEY:
-    try:
-        import google.generativeai as genai
-        genai.configure(api_key=GOOGLE_API_KEY)
-        model = genai.GenerativeModel('gemini-2.0-flash-exp')
-        logger.info("Gemini model initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize Gemini: {e}")
-        GOOGLE_API_KEY = None
-else:
+if not GOOGLE_API_KEY:
     logger.warning("No Google API key found - LLM features disabled")
 
+_gemini_model = None
+
+def get_gemini_model():
+    """Initializes the Gemini model on first use. Returns None when LLM features are disabled."""
+    global _gemini_model, GOOGLE_API_KEY
+    if _gemini_model is None and GOOGLE_API_KEY:
+        try:
+            import google.generativeai as genai
+            genai.configure(api_key=GOOGLE_API_KEY)
+            _gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+            logger.info("Gemini model initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize Gemini: {e}")
+            GOOGLE_API_KEY = None
+    return _gemini_model
+
+
+def warm_heavy_imports() -> None:
+    """Loads the scraping and LLM dependencies ahead of the first request."""
+    import bs4  # noqa: F401
+    import yfinance  # noqa: F401
+    get_gemini_model()
+
 # --- Pydantic Models ---
 class GetTranscriptRequest(BaseModel):
     url: Optional[str] = None
@@ -496,13 +529,137 @@ class GetTranscriptRequest(BaseModel):
     year: Optional[int] = None
     quarter: Optional[int] = None
 
+class SearchTranscriptRequest(GetTranscriptRequest):
+    terms: List[str]
+    stem: bool = False
+    case_sensitive: bool = False
+    window: int = 150
+    max_snippets: int = 20
+
+class TermTrendRequest(BaseModel):
+    ticker: str
+    terms: List[str]
+    quarters: int = 8
+    stem: bool = True
+
+# --- Shared Transcript Cache ---
+# Every worker opens the same on-disk store, so a transcript fetched by one
+# worker is served from cache by all the others.
+transcript_cache = TranscriptCache(
+    settings.TRANSCRIPT_CACHE_PATH,
+    ttl_hours=settings.TRANSCRIPT_CACHE_TTL_HOURS,
+    memory_entries=settings.TRANSCRIPT_CACHE_MEMORY_ENTRIES,
+)
+
+availability_index = AvailabilityIndex(
+    settings.TRANSCRIPT_CACHE_PATH,
+    discovery_interval_hours=settings.AVAILABILITY_DISCOVERY_INTERVAL_HOURS,
+)
+
+# Positional indexes for mention search, built once per cached transcript
+transcript_searcher = TranscriptSearcher(max_indexes=settings.TRANSCRIPT_SEARCH_MAX_INDEXES)
+
+# Per-transcript term vectors for /analytics/term-trends, persisted next to the cache
+term_trends = TermTrendAnalyzer(settings.TRANSCRIPT_CACHE_PATH)
+
+# Background discovery tasks; referenced here so they are not garbage collected mid-run
+_discovery_tasks = set()
+
+
+def remember_transcript(cache_key: str, result: Dict[str, Any], ticker: Optional[str] = None,
+                        year: Optional[int] = None, quarter: Optional[int] = None) -> None:
+    """
+    Caches a successful result, with its speaker roster, and marks it as
+    available and cached in the index.
+    """
+    if result.get("transcript") and "roster" not in result:
+        result["roster"] = extract_roster(result["transcript"])
+    if not (ticker and year and quarter):
+        parsed = parse_transcript_url(result.get("source_url") or "")
+        if parsed:
+            ticker, year, quarter = parsed
+    transcript_cache.put(cache_key, result, ticker, year, quarter)
+    if ticker and year and quarter:
+        availability_index.record(
+            ticker, year, quarter, result.get("source", "unknown"), result.get("source_url"), cached=True
+        )
+
+# Number of /get-transcript requests currently being served by this worker
+in_flight_fetches = 0
+_fetches_drained = asyncio.Event()
+_fetches_drained.set()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prewarms caches and HTTP pools on startup; drains in-flight fetches on shutdown."""
+    get_http_session()
+    # Warm-up runs in the background so the worker starts accepting requests immediately
+    warmup_task = asyncio.create_task(_background_warmup()) if settings.BACKEND_PREWARM else None
+
+    yield
+
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+
+    if in_flight_fetches:
+        logger.info(f"Draining {in_flight_fetches} in-flight fetches before shutdown...")
+        try:
+            await asyncio.wait_for(
+                _fetches_drained.wait(), timeout=settings.BACKEND_GRACEFUL_SHUTDOWN_SECONDS
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Shutdown grace period expired with {in_flight_fetches} fetches still running")
+    close_http_session()
+    transcript_cache.close()
+    availability_index.close()
+    term_trends.close()
+
+
+async def _background_warmup() -> None:
+    """Prewarms caches, HTTP pools and heavy imports after the socket is bound."""
+    try:
+        loaded = await asyncio.to_thread(transcript_cache.prewarm)
+        logger.info(f"Prewarmed transcript cache with {loaded} entries")
+        indexed = await asyncio.to_thread(availability_index.backfill_from_cache)
+        logger.info(f"Indexed {indexed} cached transcripts for availability lookups")
+        await asyncio.to_thread(warm_heavy_imports)
+        logger.info("Loaded scraping and LLM dependencies")
+        warmed = await asyncio.to_thread(prewarm_http_pool)
+        logger.info(f"Prewarmed HTTP pool with {warmed} connections")
+    except Exception as e:
+        logger.warning(f"Background warm-up failed: {e}")
+
+
 # --- FastAPI App ---
 app = FastAPI(
     title="Fixed Earnings Transcript API",
     description="Debugged version with better error handling",
     version="5.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
+if settings.HTTP_COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.HTTP_COMPRESSION_MIN_BYTES)
+
+
+@app.middleware("http")
+async def track_in_flight_fetches(request: Request, call_next):
+    """Counts transcript fetches so shutdown can wait for them to finish."""
+    global in_flight_fetches
+    if request.url.path != "/get-transcript":
+        return await call_next(request)
+
+    in_flight_fetches += 1
+    _fetches_drained.clear()
+    try:
+        return await call_next(request)
+    finally:
+        in_flight_fetches -= 1
+        if in_flight_fetches == 0:
+            _fetches_drained.set()
+
 # --- EarningsCall API Handler ---
 class EarningsCallAPI:
     def __init__(self):
@@ -525,7 +682,9 @@ class EarningsCallAPI:
             }
             
             logger.debug(f"EarningsCall API request: {search_url} with params {params}")
-            response = requests.get(search_url, headers=self.headers, params=params, timeout=10)
+            response = await asyncio.to_thread(
+                get_http_session().get, search_url, headers=self.headers, params=params, timeout=call_timeout(10)
+            )
             logger.debug(f"EarningsCall API response status: {response.status_code}")
             
             if response.status_code != 200:
@@ -563,6 +722,8 @@ class EarningsCallAPI:
                     "transcript": transcript_text
                 }
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"EarningsCall API error: {e}")
             logger.debug(traceback.format_exc())
@@ -578,6 +739,7 @@ class MotleyFoolSearch:
     
     def get_company_info(self, ticker: str) -> Dict[str, Any]:
         try:
+            import yfinance as yf
             stock = yf.Ticker(ticker)
             info = stock.info
             return {
@@ -589,7 +751,8 @@ class MotleyFoolSearch:
     
     async def search_with_llm(self, ticker: str, year: int, quarter: int) -> Optional[Dict[str, Any]]:
         """Use LLM to find transcripts."""
-        if not GOOGLE_API_KEY:
+        model = get_gemini_model()
+        if model is None:
             logger.warning("LLM search requested but no API key")
             return await self.fallback_search(ticker, year, quarter)
         
@@ -601,15 +764,16 @@ class MotleyFoolSearch:
             direct_urls = self.construct_likely_urls(ticker, year, quarter)
             
             for url in direct_urls[:5]:
+                check_deadline()
                 logger.debug(f"Trying URL: {url}")
-                result = await self.try_url(url)
+                result = await self.try_url(url, ticker, year, quarter)
                 if result:
                     logger.info(f"Success with direct URL: {url}")
                     result["search_method"] = "pattern_matching"
                     return result
             
             # If that fails, use LLM to generate search queries
-            company_info = self.get_company_info(ticker)
+            company_info = await asyncio.to_thread(self.get_company_info, ticker)
             company_name = company_info.get('long_name', ticker)
             
             search_prompt = f"""Generate 5 search queries to find {company_name} ({ticker}) Q{quarter} {year} earnings transcript on Motley Fool.
@@ -622,13 +786,15 @@ Consider:
 Return only the queries, one per line."""
             
             logger.debug("Asking LLM for search queries...")
-            response = model.generate_content(search_prompt)
+            check_deadline()
+            response = await asyncio.to_thread(model.generate_content, search_prompt)
             queries = [q.strip() for q in response.text.strip().split('\n') if q.strip()][:5]
             
             logger.info(f"LLM generated {len(queries)} search queries")
             
             # Try each query
             for query in queries:
+                check_deadline()
                 result = await self.search_motley_fool(query, ticker, year, quarter)
                 if result:
                     return result
@@ -643,16 +809,20 @@ Generate 3 possible URLs for {company_name} ({ticker}) Q{quarter} {year}.
 Return only the complete URLs, one per line."""
             
             logger.debug("Asking LLM for direct URLs...")
-            response = model.generate_content(url_prompt)
+            check_deadline()
+            response = await asyncio.to_thread(model.generate_content, url_prompt)
             urls = [u.strip() for u in response.text.strip().split('\n') if u.strip().startswith('http')][:3]
             
             for url in urls:
-                result = await self.try_url(url)
+                check_deadline()
+                result = await self.try_url(url, ticker, year, quarter)
                 if result:
                     logger.info(f"Success with LLM-suggested URL: {url}")
                     result["search_method"] = "llm_url_suggestion"
                     return result
                     
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"LLM search error: {e}")
             logger.debug(traceback.format_exc())
@@ -679,7 +849,12 @@ Return only the complete URLs, one per line."""
             "META": ["meta-platforms", "facebook"],
             "IBM": ["ibm", "international-business-machines"],
             "NVDA": ["nvidia"]
-        }.get(ticker.upper(), [ticker.lower()])
+        }.get(ticker.upper())
+        if company_names is None:
+            # Motley Fool slugs start with the company name, e.g. "goldman-sachs-gs-q1-..."
+            entry = get_ticker_master().get(ticker)
+            slug = normalize_name(entry.name).replace(" ", "-") if entry else ""
+            company_names = [slug, ticker.lower()] if slug and slug != ticker.lower() else [ticker.lower()]
         
         for month, start, end in patterns.get(quarter, []):
             report_year = year + 1 if quarter == 4 else year
@@ -694,14 +869,20 @@ Return only the complete URLs, one per line."""
         
         return urls
     
-    async def try_url(self, url: str) -> Optional[Dict[str, Any]]:
-        """Try to fetch and validate a specific URL."""
+    async def try_url(
+        self, url: str, ticker: Optional[str] = None, year: Optional[int] = None, quarter: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Try to fetch and validate a specific URL, aborting early if the page is for another transcript."""
+        report_progress(f"Motley Fool: checking {url}")
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                result = self.scrape_fool_transcript(url, response.text)
-                if result.get("success"):
-                    return result
+            html = await asyncio.to_thread(fetch_page, url, self.headers, ticker, year, quarter, call_timeout(10))
+            result = await asyncio.to_thread(self.scrape_fool_transcript, url, html)
+            if result.get("success"):
+                return result
+        except PageRejected as e:
+            logger.debug(f"Aborted {url}: {e}")
+        except (DeadlineExceeded, asyncio.CancelledError):
+            raise
         except:
             pass
         return None
@@ -713,39 +894,79 @@ Return only the complete URLs, one per line."""
             search_url = f"https://www.fool.com/search/?q={encoded_query}"
             
             logger.debug(f"Searching: {query}")
-            response = requests.get(search_url, headers=self.headers, timeout=20)
+            report_progress(f"Motley Fool: searching '{query}'")
+            response = await asyncio.to_thread(
+                get_http_session().get, search_url, headers=self.headers, timeout=call_timeout(20)
+            )
             
             if response.status_code != 200:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
             # Find all transcript links
-            for link in soup.find_all('a', href=True):
-                href = link.get('href', '')
-                if '/earnings/call-transcripts/' in href:
-                    full_url = href if href.startswith('http') else f"https://www.fool.com{href}"
+            for full_url in await asyncio.to_thread(self.learn_transcript_links, response.content):
+                check_deadline()
+                href = full_url
+                
+                # Quick validation
+                if (ticker.lower() in href.lower() and 
+                    str(year) in href and 
+                    f'q{quarter}' in href.lower()):
                     
-                    # Quick validation
-                    if (ticker.lower() in href.lower() and 
-                        str(year) in href and 
-                        f'q{quarter}' in href.lower()):
-                        
-                        result = await self.try_url(full_url)
-                        if result:
-                            result["search_method"] = "search"
-                            return result
+                    result = await self.try_url(full_url, ticker, year, quarter)
+                    if result:
+                        result["search_method"] = "search"
+                        return result
                             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Search error: {e}")
         
         return None
     
+    def learn_transcript_links(self, html: bytes) -> List[str]:
+        """
+        Extracts transcript links from a search results page and records every
+        one that names its ticker/quarter in the availability index.
+        """
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        links, learned = [], []
+        for link in soup.find_all('a', href=True):
+            href = link.get('href', '')
+            if '/earnings/call-transcripts/' in href:
+                full_url = href if href.startswith('http') else f"https://www.fool.com{href}"
+                links.append(full_url)
+                parsed = parse_transcript_url(full_url)
+                if parsed:
+                    learned.append((*parsed, "Motley Fool", full_url))
+        
+        availability_index.record_many(learned)
+        return links
+    
+    async def discover_transcripts(self, ticker: str) -> int:
+        """Lists a ticker's transcripts from Motley Fool search into the availability index."""
+        query = urllib.parse.quote_plus(f"{ticker} earnings call transcript")
+        try:
+            response = await asyncio.to_thread(
+                get_http_session().get, f"https://www.fool.com/search/?q={query}",
+                headers=self.headers, timeout=20
+            )
+            if response.status_code != 200:
+                return 0
+            links = await asyncio.to_thread(self.learn_transcript_links, response.content)
+            logger.info(f"Discovery for {ticker} found {len(links)} transcript links")
+            return len(links)
+        except Exception as e:
+            logger.warning(f"Transcript discovery failed for {ticker}: {e}")
+            return 0
+    
     async def fallback_search(self, ticker: str, year: int, quarter: int) -> Optional[Dict[str, Any]]:
         """Traditional search without LLM."""
         logger.info(f"Using fallback search for {ticker} Q{quarter} {year}")
         
-        company_info = self.get_company_info(ticker)
+        company_info = await asyncio.to_thread(self.get_company_info, ticker)
         queries = [
             f"{ticker} Q{quarter} {year} earnings transcript",
             f'"{ticker}" "Q{quarter}" "{year}" site:fool.com',
@@ -753,6 +974,7 @@ Return only the complete URLs, one per line."""
         ]
         
         for query in queries:
+            check_deadline()
             result = await self.search_motley_fool(query, ticker, year, quarter)
             if result:
                 return result
@@ -763,10 +985,9 @@ Return only the complete URLs, one per line."""
         """Scrape Motley Fool transcript."""
         try:
             if not html:
-                response = requests.get(url, headers=self.headers, timeout=20)
-                response.raise_for_status()
-                html = response.text
+                html = fetch_page(url, self.headers, timeout=20)
             
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(html, 'html.parser')
             
             # Find content
@@ -801,16 +1022,133 @@ Return only the complete URLs, one per line."""
 # Initialize services
 earnings_call_api = EarningsCallAPI()
 motley_fool = MotleyFoolSearch()
+admission = AdmissionController(
+    max_in_flight=settings.BACKEND_MAX_IN_FLIGHT,
+    max_queue=settings.BACKEND_MAX_QUEUE,
+    queue_timeout=settings.BACKEND_QUEUE_TIMEOUT_SECONDS,
+)
+
+
+@app.exception_handler(Overloaded)
+async def overloaded_handler(request: Request, exc: Overloaded):
+    """Sheds load with a fast 429/503 instead of queueing without bound."""
+    return FastJSONResponse(
+        {"success": False, "error": str(exc), "retryable": True},
+        status_code=exc.status_code,
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded):
+    return FastJSONResponse(
+        {"success": False, "error": f"Transcript search did not finish in time: {exc}", "retryable": True},
+        status_code=504,
+    )
+
+
+@app.exception_handler(ClientDisconnected)
+async def client_disconnected_handler(request: Request, exc: ClientDisconnected):
+    # Nobody is listening any more; 499 only shows up in access logs
+    return Response(status_code=499)
+
+
+def request_cache_key(request: GetTranscriptRequest) -> Optional[str]:
+    """Transcript cache key for a request, or None if the request is incomplete."""
+    if request.url:
+        return make_url_cache_key(request.url)
+    if request.company_ticker and request.year and request.quarter:
+        return make_cache_key(request.company_ticker, request.year, request.quarter)
+    return None
+
+
+def cached_transcript(request: GetTranscriptRequest) -> Optional[Dict[str, Any]]:
+    """Returns the cached result for a request without taking an admission slot."""
+    cache_key = request_cache_key(request)
+    if cache_key is None:
+        return None
+
+    cached = transcript_cache.get(cache_key)
+    if cached:
+        cached["message"] = "Retrieved from cache"
+    return cached
+
+
+def request_deadline(request: Request) -> RequestDeadline:
+    """The caller's deadline (X-Request-Timeout, in seconds), within the configured bounds."""
+    return RequestDeadline.from_headers(
+        request.headers,
+        default=settings.BACKEND_DEFAULT_DEADLINE_SECONDS,
+        maximum=settings.BACKEND_MAX_DEADLINE_SECONDS,
+    )
+
+
+async def transcript_result(body: GetTranscriptRequest, request: Request) -> Dict[str, Any]:
+    """
+    Result dict for a transcript request: from cache, or fetched under admission
+    control and the caller's deadline. Never streams, whatever the Accept header,
+    so endpoints that post-process the transcript can always use it.
+    """
+    cached = cached_transcript(body)
+    if cached:
+        return cached
+
+    deadline = request_deadline(request)
+    async with admission.admit(deadline):
+        return await admission.run(fetch_transcript(body), deadline, request)
+
 
 @app.post("/get-transcript")
-async def get_transcript(request: GetTranscriptRequest):
+async def get_transcript(body: GetTranscriptRequest, request: Request):
+    """
+    Get transcript from cache, or fetch it under admission control and the
+    caller's deadline (X-Request-Timeout, in seconds). A caller that accepts
+    text/event-stream gets a fetch as a progress stream.
+    """
+    if wants_progress(request.headers.get("accept")):
+        cached = cached_transcript(body)
+        if cached:
+            return cached
+        deadline = request_deadline(request)
+        return StreamingResponse(
+            stream_with_progress(lambda: fetch_with_status(body, deadline)),
+            media_type=EVENT_STREAM,
+            headers={"Cache-Control": "no-cache"},
+        )
+    return await transcript_result(body, request)
+
+
+async def fetch_with_status(body: GetTranscriptRequest, deadline: RequestDeadline) -> Dict[str, Any]:
+    """
+    Fetch for a progress stream. The response status is already sent, so
+    rejections and timeouts are returned in the result with their status code;
+    a client disconnect cancels the stream and with it the fetch.
+    """
+    try:
+        async with admission.admit(deadline):
+            return await admission.run(fetch_transcript(body), deadline)
+    except Overloaded as e:
+        return {"success": False, "error": str(e), "retryable": True, "status_code": e.status_code}
+    except DeadlineExceeded as e:
+        return {
+            "success": False,
+            "error": f"Transcript search did not finish in time: {e}",
+            "retryable": True,
+            "status_code": 504,
+        }
+
+
+async def fetch_transcript(request: GetTranscriptRequest) -> Dict[str, Any]:
     """Get transcript with better error handling."""
     
     # Direct URL provided
     if request.url:
         logger.info(f"Using provided URL: {request.url}")
-        result = motley_fool.scrape_fool_transcript(request.url)
+        report_progress(f"Fetching {request.url}")
+        cache_key = make_url_cache_key(request.url)
+        result = await asyncio.to_thread(motley_fool.scrape_fool_transcript, request.url)
         if result.get("success"):
+            remember_transcript(cache_key, result)
             result["message"] = "Retrieved from provided URL"
         return result
     
@@ -827,12 +1165,16 @@ async def get_transcript(request: GetTranscriptRequest):
     
     logger.info(f"=== Starting search for {ticker} Q{quarter} {year} ===")
     
+    cache_key = make_cache_key(ticker, year, quarter)
+    
     # Step 1: EarningsCall API
     logger.info("Step 1: Checking EarningsCall API...")
+    report_progress("Checking EarningsCall API", 1, 2)
     ec_result = await earnings_call_api.get_transcript(ticker, year, quarter)
     
     if ec_result and ec_result.get("success"):
         logger.info("✓ Found on EarningsCall API")
+        remember_transcript(cache_key, ec_result, ticker, year, quarter)
         ec_result["message"] = "Retrieved from EarningsCall API"
         return ec_result
     else:
@@ -840,10 +1182,12 @@ async def get_transcript(request: GetTranscriptRequest):
     
     # Step 2: Motley Fool search
     logger.info("Step 2: Searching Motley Fool...")
+    report_progress("Searching Motley Fool", 2, 2)
     mf_result = await motley_fool.search_with_llm(ticker, year, quarter)
     
     if mf_result and mf_result.get("success"):
         logger.info(f"✓ Found on Motley Fool via {mf_result.get('search_method')}")
+        remember_transcript(cache_key, mf_result, ticker, year, quarter)
         mf_result["message"] = f"Retrieved from Motley Fool ({mf_result.get('search_method', 'search')})"
         return mf_result
     else:
@@ -867,6 +1211,152 @@ async def get_transcript(request: GetTranscriptRequest):
     }
 
 
+@app.get("/transcripts/available")
+async def available_transcripts(ticker: str, start_year: Optional[int] = None, end_year: Optional[int] = None):
+    """
+    Lists which quarters have transcripts for a ticker, from which sources and
+    whether they are cached. Schedules a background discovery run when the
+    ticker has not been discovered recently.
+    """
+    ticker = ticker.upper()
+    available = await asyncio.to_thread(availability_index.lookup, ticker, start_year, end_year)
+
+    discovery = "recent"
+    if settings.AVAILABILITY_DISCOVERY_ENABLED and availability_index.claim_discovery(ticker):
+        task = asyncio.create_task(motley_fool.discover_transcripts(ticker))
+        _discovery_tasks.add(task)
+        task.add_done_callback(_discovery_tasks.discard)
+        discovery = "scheduled"
+
+    return {
+        "success": True,
+        "ticker": ticker,
+        "count": len(available),
+        "latest": available[0] if available else None,
+        "transcripts": available,
+        "discovery": discovery,
+        "message": (
+            f"Found {len(available)} known transcripts for {ticker}."
+            if available else
+            f"No transcripts indexed for {ticker} yet; discovery has been {discovery}. "
+            "You can still call get_transcript with a specific year and quarter."
+        )
+    }
+
+
+@app.post("/transcripts/search")
+async def search_transcript(body: SearchTranscriptRequest, request: Request):
+    """
+    Finds mentions of terms or phrases in one transcript, with counts per
+    speaker and section and context snippets. The transcript is served from
+    cache (or fetched like /get-transcript) and searched via its positional index.
+    """
+    terms = [term.strip() for term in body.terms if term.strip()][:20]
+    if not terms:
+        return {"success": False, "error": "Please provide at least one search term"}
+
+    result = await transcript_result(body, request)
+    if not result.get("success"):
+        return result
+
+    matches = await asyncio.to_thread(
+        transcript_searcher.search,
+        request_cache_key(body),
+        result["transcript"],
+        terms,
+        use_stems=body.stem,
+        case_sensitive=body.case_sensitive,
+        window=max(0, min(body.window, 1000)),
+        max_snippets=max(0, min(body.max_snippets, 100)),
+    )
+    return {
+        "success": True,
+        "title": result.get("title"),
+        "source": result.get("source"),
+        "source_url": result.get("source_url"),
+        "stem": body.stem,
+        "case_sensitive": body.case_sensitive,
+        **matches
+    }
+
+
+@app.post("/transcripts/roster")
+async def transcript_roster(body: GetTranscriptRequest, request: Request):
+    """
+    Speaker roster of one transcript: executives with titles, analysts with firms
+    and question counts, and words spoken per speaker. The roster is extracted
+    when a transcript is cached; older cache entries get theirs on first request.
+    """
+    result = await transcript_result(body, request)
+    if not result.get("success"):
+        return result
+
+    roster = result.get("roster")
+    if roster is None:
+        roster = await asyncio.to_thread(extract_roster, result["transcript"])
+        cache_key = request_cache_key(body)
+        if cache_key:
+            await asyncio.to_thread(transcript_cache.update_metadata, cache_key, {"roster": roster})
+
+    return {
+        "success": True,
+        "title": result.get("title"),
+        "source": result.get("source"),
+        "source_url": result.get("source_url"),
+        **roster
+    }
+
+
+def compute_term_trends(body: TermTrendRequest, terms: List[str]) -> Dict[str, Any]:
+    """Builds the trend table over the ticker's most recent known quarters that are cached."""
+    ticker = body.ticker.upper()
+    quarters = max(1, min(body.quarters, 40))
+    cached = {(entry["year"], entry["quarter"]): entry for entry in transcript_cache.list_cached(ticker)}
+    known = {(entry["year"], entry["quarter"]) for entry in availability_index.lookup(ticker)}
+    window = sorted(known | set(cached), reverse=True)[:quarters]
+
+    periods = []
+    for year, quarter in reversed(window):
+        entry = cached.get((year, quarter))
+        if entry is None:
+            continue
+        cache_id = entry["id"]
+
+        def load_text(cache_id=cache_id) -> Optional[str]:
+            result = transcript_cache.get(cache_id)
+            return result.get("transcript") if result else None
+
+        vector = term_trends.vector_for(cache_id, entry["cached_at"], load_text)
+        if vector is not None:
+            periods.append((f"Q{quarter} {year}", vector, load_text))
+
+    table = term_trends.trend(periods, terms, use_stems=body.stem)
+    table["not_cached"] = [f"Q{quarter} {year}" for year, quarter in reversed(window) if (year, quarter) not in cached]
+    return table
+
+
+@app.post("/analytics/term-trends")
+async def term_trends_endpoint(body: TermTrendRequest):
+    """
+    Frequency of terms and phrases per 1,000 words across a ticker's recent
+    cached transcripts, oldest quarter first. Known quarters that are not cached
+    yet are listed in `not_cached` (fetch them with /get-transcript to include them).
+    """
+    terms = [term.strip() for term in body.terms if term.strip()][:20]
+    if not terms:
+        return {"success": False, "error": "Please provide at least one term"}
+
+    table = await asyncio.to_thread(compute_term_trends, body, terms)
+    if not table["periods"]:
+        return {
+            "success": False,
+            "error": f"No cached transcripts for {body.ticker.upper()}",
+            "not_cached": table["not_cached"],
+            "message": "Fetch transcripts with get_transcript first; trends are computed from cached transcripts."
+        }
+    return {"success": True, "ticker": body.ticker.upper(), "stem": body.stem, **table}
+
+
 @app.get("/health")
 async def health_check():
     """Health check with debug info."""
@@ -877,17 +1367,26 @@ async def health_check():
             "google_api_key": bool(GOOGLE_API_KEY),
             "earningscall_api": earnings_call_api.api_key[:4] + "...",
             "debug": "Check logs for detailed information"
-        }
+        },
+        "worker": {
+            "pid": os.getpid(),
+            "in_flight_fetches": in_flight_fetches
+        },
+        "admission": admission.stats(),
+        "cache": transcript_cache.stats(),
+        "search": transcript_searcher.stats(),
+        "term_trends": term_trends.stats()
     }
 
 
 @app.get("/test/{ticker}")
-async def test_ticker(ticker: str, year: int = 2021, quarter: int = 4):
+async def test_ticker(request: Request, ticker: str, year: int = 2021, quarter: int = 4):
     """Quick test endpoint."""
     return await get_transcript(
         GetTranscriptRequest(
             company_ticker=ticker,
             year=year,
             quarter=quarter
-        )
+        ),
+        request
     )
\ No newline at end of file
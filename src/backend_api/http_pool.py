@@ -0,0 +1,63 @@
+"""
+Shared HTTP connection pool for outbound source requests.
+
+All transcript sources go through one `requests.Session` per worker so
+TCP/TLS connections to the same hosts are reused across requests.
+"""
+
+import logging
+import threading
+from typing import Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.config import settings
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Hosts every worker talks to; opened at startup when prewarming is enabled
+PREWARM_URLS = [
+    "https://www.fool.com/",
+    "https://v2.api.earningscall.biz/",
+]
+
+
+def get_http_session() -> requests.Session:
+    """Returns the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pool_size = settings.BACKEND_HTTP_POOL_SIZE
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def prewarm_http_pool(urls: Iterable[str] = PREWARM_URLS, timeout: float = 5.0) -> int:
+    """Opens a connection to each source host so the first real request skips the handshake."""
+    session = get_http_session()
+    warmed = 0
+    for url in urls:
+        try:
+            session.head(url, timeout=timeout, allow_redirects=False)
+            warmed += 1
+        except requests.RequestException as e:
+            logger.debug(f"HTTP pool prewarm failed for {url}: {e}")
+    return warmed
+
+
+def close_http_session() -> None:
+    """Closes the pooled session and its connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,135 @@
+"""
+Streaming page fetch with early verification of candidate transcript pages.
+
+Candidate URLs are read incrementally. As soon as the first few KB contain the
+page's <title>, canonical URL or og: meta tags, they are checked against the
+expected ticker, year and quarter and mismatched pages are aborted before the
+rest of the body is downloaded. A hard cap on body size bounds memory for
+pathological pages.
+"""
+
+import logging
+import re
+from typing import Optional, Dict, List
+
+from config.config import settings
+from backend_api.http_pool import get_http_session
+from backend_api.admission import check_deadline
+from utils.ticker_master import get_ticker_master
+
+logger = logging.getLogger(__name__)
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_CANONICAL_RE = re.compile(
+    r"<link[^>]+rel=[\"']canonical[\"'][^>]*href=[\"']([^\"']+)[\"']"
+    r"|<link[^>]+href=[\"']([^\"']+)[\"'][^>]*rel=[\"']canonical[\"']",
+    re.IGNORECASE,
+)
+_META_RE = re.compile(
+    r"<meta[^>]+(?:property|name)=[\"'](?:og:title|og:url|twitter:title)[\"'][^>]*content=[\"']([^\"']+)[\"']",
+    re.IGNORECASE,
+)
+_QUARTER_WORDS = {1: "first quarter", 2: "second quarter", 3: "third quarter", 4: "fourth quarter"}
+
+
+class PageRejected(Exception):
+    """Raised when a candidate page is aborted before being fully downloaded."""
+
+
+def _ticker_variants(ticker: str) -> List[str]:
+    """
+    Alphanumeric forms of a ticker and of its issuer's other share classes in the
+    ticker master (GOOGL -> googl, goog; BRK.B -> brkb, brk, brka).
+    """
+    variants: List[str] = []
+    for symbol in [ticker, *get_ticker_master().share_classes(ticker)]:
+        symbol = symbol.lower()
+        for variant in (re.sub(r"[^a-z0-9]", "", symbol), re.split(r"[.\-]", symbol)[0]):
+            if variant and variant not in variants:
+                variants.append(variant)
+    return variants
+
+
+def verify_page_head(head_html: str, ticker: str, year: int, quarter: int) -> Optional[bool]:
+    """
+    Checks the identifying tags in the start of a page against the expected transcript.
+
+    Returns:
+        True if the page identifies itself as the expected transcript, False if it
+        identifies as something else, or None if no identifying tags were found yet.
+    """
+    signals = [m.group(1) for m in _TITLE_RE.finditer(head_html)]
+    signals += [m.group(1) or m.group(2) for m in _CANONICAL_RE.finditer(head_html)]
+    signals += [m.group(1) for m in _META_RE.finditer(head_html)]
+    if not signals:
+        return None
+
+    text = " ".join(signals).lower()
+    tokens = set(re.findall(r"[a-z0-9]+", text))
+    if not any(variant in tokens for variant in _ticker_variants(ticker)):
+        return False
+    if str(year) not in text:
+        return False
+    if f"q{quarter}" not in tokens and _QUARTER_WORDS.get(quarter, "") not in text:
+        return False
+    return True
+
+
+def fetch_page(
+    url: str,
+    headers: Dict[str, str],
+    ticker: Optional[str] = None,
+    year: Optional[int] = None,
+    quarter: Optional[int] = None,
+    timeout: float = 10,
+) -> str:
+    """
+    Downloads a page incrementally, aborting early on mismatched or oversized pages.
+
+    When ticker, year and quarter are given, the page head is verified against
+    them once the first `PAGE_PROBE_BYTES` have arrived (or </head> is seen).
+
+    Returns:
+        The decoded HTML.
+
+    Raises:
+        DeadlineExceeded: If the owning request's deadline passes mid-download.
+        PageRejected: If the page is for a different transcript or exceeds `PAGE_MAX_BYTES`.
+        requests.HTTPError: For non-2xx responses.
+    """
+    probe_bytes = settings.PAGE_PROBE_BYTES
+    max_bytes = settings.PAGE_MAX_BYTES
+    verify = bool(ticker and year and quarter)
+
+    with get_http_session().get(url, headers=headers, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+
+        declared = int(response.headers.get("Content-Length") or 0)
+        if declared > max_bytes:
+            raise PageRejected(f"declared size {declared} exceeds {max_bytes} bytes")
+
+        chunks: List[bytes] = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=8192):
+            # Stops the download promptly when the owning request is cancelled
+            check_deadline()
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_bytes:
+                raise PageRejected(f"body exceeds {max_bytes} bytes")
+
+            if verify and size >= probe_bytes:
+                head = b"".join(chunks).decode(response.encoding or "utf-8", errors="ignore")
+                verdict = verify_page_head(head, ticker, year, quarter)
+                if verdict is False:
+                    raise PageRejected(f"page head does not match {ticker} Q{quarter} {year}")
+                # Stop checking once the page identified itself or the head is over
+                if verdict or "</head>" in head.lower() or size >= probe_bytes * 4:
+                    verify = False
+
+        html = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+
+    if verify and verify_page_head(html, ticker, year, quarter) is False:
+        # Short pages can end before the probe threshold is reached
+        raise PageRejected(f"page does not match {ticker} Q{quarter} {year}")
+    return html
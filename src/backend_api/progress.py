@@ -0,0 +1,78 @@
+"""
+Progress events for transcript fetches.
+
+A caller that sends `Accept: text/event-stream` to `/get-transcript` receives
+the fetch as a server-sent event stream on the same connection: `progress`
+events while the pipeline works (which source or candidate URL is being
+probed), then a single `result` event with the usual JSON body. Staying on one
+connection means progress works whichever worker or replica serves the fetch.
+
+Pipeline code calls `report_progress(...)`; the active stream's sink travels in
+a context variable, so source calls in worker threads report without extra
+arguments, and the call is a no-op for plain JSON requests.
+"""
+
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from utils.json_codec import dumps
+
+EVENT_STREAM = "text/event-stream"
+
+progress_sink: ContextVar[Optional[Callable[[Dict[str, Any]], None]]] = ContextVar("progress_sink", default=None)
+
+
+def wants_progress(accept: Optional[str]) -> bool:
+    return EVENT_STREAM in (accept or "")
+
+
+def report_progress(message: str, step: Optional[int] = None, total: Optional[int] = None) -> None:
+    """Reports the current stage of the fetch being served, if its caller streams progress."""
+    sink = progress_sink.get()
+    if sink is not None:
+        event: Dict[str, Any] = {"message": message, "at": time.time()}
+        if step is not None:
+            event.update({"step": step, "total_steps": total})
+        sink(event)
+
+
+def _sse(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+async def stream_with_progress(run: Callable[[], Awaitable[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """
+    Runs `run()` and yields its progress and result as server-sent events.
+
+    Only the latest pending progress event is sent when the client reads
+    slower than the pipeline reports. Closing the stream cancels the fetch.
+    """
+    loop = asyncio.get_running_loop()
+    queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+
+    def sink(event: Dict[str, Any]) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    token = progress_sink.set(sink)
+    try:
+        task = asyncio.ensure_future(run())
+    finally:
+        progress_sink.reset(token)
+
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({task, getter}, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                getter.cancel()
+                break
+            event = getter.result()
+            while not queue.empty():
+                event = queue.get_nowait()
+            yield _sse("progress", event)
+        yield _sse("result", task.result())
+    finally:
+        if not task.done():
+            task.cancel()
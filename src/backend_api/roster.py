@@ -0,0 +1,103 @@
+"""
+Speaker roster extraction for earnings call transcripts.
+
+The roster lists executives with their titles and analysts with their firms,
+with turn and word counts per speaker and, for analysts, the number of turns
+they took in the Q&A. Roles come from speaker header lines in the
+"Name -- Title" and "Name -- Firm -- Analyst" formats used by Motley Fool (in
+both the participant list and the body); speakers only seen inline
+("Name: ...") are listed under "other".
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, Any, List, Tuple
+
+from utils.transcript_structure import find_speaker_turns, find_sections
+
+_HEADER_RE = re.compile(r"^([A-Z][\w.'\-]*(?: [A-Z][\w.'\-]*){0,4}) -- (.{2,120})$", re.MULTILINE)
+_WORD_RE = re.compile(r"\S+")
+
+
+def _speaker_roles(text: str) -> Dict[str, Tuple[str, str]]:
+    """Maps speaker name to (role, title or firm) from header lines."""
+    roles: Dict[str, Tuple[str, str]] = {}
+    for match in _HEADER_RE.finditer(text):
+        name = match.group(1)
+        parts = [part.strip() for part in match.group(2).split(" -- ")]
+        if parts[-1].lower() == "analyst":
+            roles.setdefault(name, ("analyst", " -- ".join(parts[:-1])))
+        else:
+            roles.setdefault(name, ("executive", " -- ".join(parts)))
+    return roles
+
+
+def extract_roster(text: str) -> Dict[str, Any]:
+    """
+    Extracts the speaker roster of a transcript.
+
+    Returns:
+        Executives (name, title, turns, words), analysts (name, firm, questions,
+        turns, words) in order of first appearance, other speakers, and the
+        operator's turn count.
+    """
+    roles = _speaker_roles(text)
+    turns = find_speaker_turns(text)
+    sections = find_sections(text)
+    section_starts = [start for start, _ in sections]
+
+    stats: Dict[str, Dict[str, int]] = {}
+    order: List[str] = []
+    bounds = [start for start, _ in turns[1:]] + [len(text)]
+    for (start, speaker), end in zip(turns, bounds):
+        section = sections[bisect_right(section_starts, start) - 1][1]
+        # Lines in the participant list look like speaker headers but are not turns
+        if not speaker or section == "participants":
+            continue
+        entry = stats.get(speaker)
+        if entry is None:
+            entry = stats[speaker] = {"turns": 0, "words": 0, "qa_turns": 0}
+            order.append(speaker)
+        entry["turns"] += 1
+        # The header line itself is not part of what was said
+        body = text[start:end].partition("\n")[2] if roles.get(speaker) else text[start:end]
+        entry["words"] += len(_WORD_RE.findall(body))
+        if section == "qa":
+            entry["qa_turns"] += 1
+
+    executives, analysts, others = [], [], []
+    for name in order:
+        entry = stats[name]
+        role, detail = roles.get(name, ("other", ""))
+        if name == "Operator":
+            continue
+        if role == "executive":
+            executives.append({"name": name, "title": detail, "turns": entry["turns"], "words": entry["words"]})
+        elif role == "analyst":
+            analysts.append({
+                "name": name,
+                "firm": detail,
+                "questions": entry["qa_turns"] or entry["turns"],
+                "turns": entry["turns"],
+                "words": entry["words"],
+            })
+        else:
+            others.append({"name": name, "turns": entry["turns"], "words": entry["words"]})
+
+    # Participants listed but who never spoke still belong on the roster
+    for name, (role, detail) in roles.items():
+        if name in stats:
+            continue
+        if role == "executive":
+            executives.append({"name": name, "title": detail, "turns": 0, "words": 0})
+        else:
+            analysts.append({"name": name, "firm": detail, "questions": 0, "turns": 0, "words": 0})
+
+    executives.sort(key=lambda e: -e["words"])
+    return {
+        "executives": executives,
+        "analysts": analysts,
+        "other_speakers": others,
+        "operator_turns": stats.get("Operator", {}).get("turns", 0),
+        "speaker_count": len(executives) + len(analysts) + len(others),
+    }
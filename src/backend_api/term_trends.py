@@ -0,0 +1,300 @@
+"""
+Cross-quarter term and phrase frequency trends over cached transcripts.
+
+Each cached transcript is reduced once to a term vector (total word count plus
+unigram and bigram counts), which is stored next to the transcript in the
+shared SQLite store. Vectors are keyed by the transcript's cache id and
+`cached_at`, so a re-fetched transcript gets a new vector and a trend query
+only computes vectors for transcripts it has not seen before. Vectors built by
+an older tokenizer (see `TOKENIZER_VERSION`) are rebuilt on first use.
+
+A query stacks the vectors into a sparse (periods x vocabulary) document-term
+matrix over their shared vocabulary, sums the columns each query term matches
+into a (periods x terms) count matrix, normalizes it per 1,000 words and
+derives per-term change and slope. The matrix is reduced with NumPy when
+installed and in plain Python otherwise.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Any, List, Optional, Callable, Iterable, Tuple
+
+from backend_api.transcript_search import TOKENIZER_VERSION, tokenize, stem
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcript_term_vectors (
+    id TEXT PRIMARY KEY,
+    cached_at TEXT,
+    total_words INTEGER,
+    counts TEXT,
+    tokenizer INTEGER NOT NULL DEFAULT 1
+);
+"""
+
+# Phrases longer than this are counted from the transcript text instead of the vectors
+MAX_VECTOR_NGRAM = 2
+
+
+class TermVector:
+    """Word total and unigram/bigram counts of one transcript."""
+
+    def __init__(self, total_words: int, counts: Dict[str, int]):
+        self.total_words = total_words
+        self.counts = counts
+
+    @classmethod
+    def from_text(cls, text: str) -> "TermVector":
+        words = [word.lower() for word in tokenize(text)]
+        counts = Counter(words)
+        counts.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+        return cls(len(words), dict(counts))
+
+
+class DocumentTermMatrix:
+    """Sparse (documents x vocabulary) count matrix in CSR form over a shared vocabulary."""
+
+    def __init__(self, vectors: List[TermVector]):
+        self.vocabulary: Dict[str, int] = {}
+        self.indptr = [0]
+        self.indices: List[int] = []
+        self.data: List[int] = []
+        for vector in vectors:
+            for entry, count in vector.counts.items():
+                self.indices.append(self.vocabulary.setdefault(entry, len(self.vocabulary)))
+                self.data.append(count)
+            self.indptr.append(len(self.indices))
+
+    @property
+    def documents(self) -> int:
+        return len(self.indptr) - 1
+
+    def column_sums(self, columns: List[List[str]]) -> List[List[int]]:
+        """
+        Sums, per document, the matrix columns of each group of vocabulary entries.
+
+        Returns:
+            A (documents x groups) count matrix.
+        """
+        groups = [[self.vocabulary[entry] for entry in entries if entry in self.vocabulary] for entries in columns]
+        if np is not None:
+            indices = np.asarray(self.indices, dtype=np.int64)
+            data = np.asarray(self.data, dtype=np.int64)
+            rows = np.repeat(np.arange(self.documents), np.diff(self.indptr))
+            sums = np.zeros((self.documents, len(groups)), dtype=np.int64)
+            for j, group in enumerate(groups):
+                hit = np.isin(indices, group)
+                sums[:, j] = np.bincount(rows[hit], weights=data[hit], minlength=self.documents)
+            return sums.tolist()
+
+        sums = []
+        for i in range(self.documents):
+            row = dict(zip(self.indices[self.indptr[i]:self.indptr[i + 1]], self.data[self.indptr[i]:self.indptr[i + 1]]))
+            sums.append([sum(row.get(column, 0) for column in group) for group in groups])
+        return sums
+
+
+class TermTrendAnalyzer:
+    """Computes term trends from cached, incrementally built transcript vectors."""
+
+    def __init__(self, db_path: str, memory_entries: int = 128):
+        self.db_path = db_path
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[Tuple[str, str], TermVector]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.computed = 0
+        self.reused = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def _remember(self, key: Tuple[str, str], vector: TermVector) -> None:
+        with self._lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def vector_for(self, cache_id: str, cached_at: str, load_text: Callable[[], Optional[str]]) -> Optional[TermVector]:
+        """
+        Returns the vector of a cached transcript, computing and storing it on first use.
+
+        Args:
+            cache_id: Transcript cache id.
+            cached_at: When the transcript was cached; a newer copy gets a new vector.
+            load_text: Loads the transcript text; only called if no vector exists.
+        """
+        key = (cache_id, cached_at)
+        with self._lock:
+            vector = self._memory.get(key)
+        if vector is not None:
+            self.reused += 1
+            return vector
+
+        try:
+            row = self._connect().execute(
+                "SELECT total_words, counts FROM transcript_term_vectors "
+                "WHERE id = ? AND cached_at = ? AND tokenizer = ?",
+                (*key, TOKENIZER_VERSION),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Term vector read failed for {cache_id}: {e}")
+            row = None
+
+        if row is not None:
+            vector = TermVector(row["total_words"], json.loads(row["counts"]))
+            self.reused += 1
+        else:
+            text = load_text()
+            if not text:
+                return None
+            vector = TermVector.from_text(text)
+            self.computed += 1
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO transcript_term_vectors (id, cached_at, total_words, counts, tokenizer) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (cache_id, cached_at, vector.total_words, json.dumps(vector.counts), TOKENIZER_VERSION),
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Term vector write failed for {cache_id}: {e}")
+
+        self._remember(key, vector)
+        return vector
+
+    @staticmethod
+    def _term_columns(vocabulary: Iterable[str], terms: List[str], use_stems: bool) -> Dict[str, List[str]]:
+        """Maps each query term to the vocabulary entries it matches."""
+        columns: Dict[str, List[str]] = {}
+        if not use_stems:
+            for term in terms:
+                columns[term] = [" ".join(word.lower() for word in tokenize(term))]
+            return columns
+
+        # Inflections share a short prefix, so only nearby vocabulary entries are stemmed
+        prefixes = tuple({word.lower()[:3] for term in terms for word in tokenize(term)[:1]})
+        stemmed_vocab: Dict[str, List[str]] = {}
+        for entry in vocabulary:
+            if entry.startswith(prefixes):
+                stemmed_vocab.setdefault(" ".join(stem(word) for word in entry.split()), []).append(entry)
+        for term in terms:
+            key = " ".join(stem(word.lower()) for word in tokenize(term))
+            columns[term] = stemmed_vocab.get(key, [])
+        return columns
+
+    def trend(
+        self,
+        periods: List[Tuple[str, TermVector, Callable[[], Optional[str]]]],
+        terms: List[str],
+        use_stems: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Builds the trend table for `terms` over `periods` (oldest first).
+
+        Args:
+            periods: (label, vector, text loader) per transcript.
+            terms: Words or phrases to measure.
+            use_stems: Count inflections of each word together.
+
+        Returns:
+            Period labels and word totals, and per term its raw counts, frequency
+            per 1,000 words, change from first to last period and least-squares slope.
+        """
+        labels = [label for label, _, _ in periods]
+        totals = [vector.total_words for _, vector, _ in periods]
+        long_terms = [t for t in terms if len(tokenize(t)) > MAX_VECTOR_NGRAM]
+        short_terms = [t for t in terms if t not in long_terms]
+
+        matrix = DocumentTermMatrix([vector for _, vector, _ in periods])
+        columns = self._term_columns(matrix.vocabulary, short_terms, use_stems)
+        counts = matrix.column_sums([columns[term] for term in short_terms])
+        if long_terms:
+            for row, (_, _, load_text) in zip(counts, periods):
+                text_words = [word.lower() for word in tokenize(load_text() or "")]
+                row += [_count_phrase(text_words, term, use_stems) for term in long_terms]
+
+        ordered_terms = short_terms + long_terms
+        per_1k = _per_thousand(counts, totals)
+        rows = []
+        for j, term in enumerate(ordered_terms):
+            series = [round(per_1k[i][j], 3) for i in range(len(periods))]
+            peak = max(range(len(series)), key=series.__getitem__) if series else None
+            rows.append({
+                "term": term,
+                "counts": [counts[i][j] for i in range(len(periods))],
+                "per_1k_words": series,
+                "change": round(series[-1] - series[0], 3) if series else 0.0,
+                "slope_per_quarter": round(_slope(series), 4),
+                "peak_period": labels[peak] if peak is not None else None,
+            })
+        return {"periods": labels, "total_words": totals, "terms": rows}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "memory_vectors": len(self._memory),
+            "computed": self.computed,
+            "reused": self.reused,
+            "numpy": np is not None,
+        }
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _count_phrase(words: List[str], phrase: str, use_stems: bool) -> int:
+    target = [word.lower() for word in tokenize(phrase)]
+    if use_stems:
+        target = [stem(word) for word in target]
+        words = [stem(word) for word in words]
+    n = len(target)
+    return sum(1 for i in range(len(words) - n + 1) if words[i:i + n] == target)
+
+
+def _per_thousand(counts: List[List[int]], totals: List[int]) -> List[List[float]]:
+    if np is not None and counts:
+        matrix = np.asarray(counts, dtype=float)
+        words = np.maximum(np.asarray(totals, dtype=float), 1.0)[:, None]
+        return (matrix / words * 1000.0).tolist()
+    return [[count / max(total, 1) * 1000.0 for count in row] for row, total in zip(counts, totals)]
+
+
+def _slope(series: List[float]) -> float:
+    """Least-squares slope of the series against the period index."""
+    n = len(series)
+    if n < 2:
+        return 0.0
+    if np is not None:
+        return float(np.polyfit(np.arange(n, dtype=float), np.asarray(series, dtype=float), 1)[0])
+    mean_x = (n - 1) / 2
+    mean_y = sum(series) / n
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(series))
+    denominator = sum((x - mean_x) ** 2 for x in range(n))
+    return numerator / denominator
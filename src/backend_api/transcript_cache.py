@@ -0,0 +1,257 @@
+"""
+On-disk transcript cache shared by all backend worker processes.
+
+Transcripts are stored in the SQLite database under `cache/` (WAL mode, so
+several workers can read while one writes). A small in-process LRU sits in
+front of the database so hot transcripts skip the disk round-trip.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcript_cache (
+    id TEXT PRIMARY KEY,
+    ticker TEXT,
+    quarter TEXT,
+    year INTEGER,
+    source TEXT,
+    url TEXT,
+    content TEXT,
+    metadata TEXT,
+    cached_at TEXT,
+    expires_at TEXT
+);
+CREATE TABLE IF NOT EXISTS failed_attempts (
+    url TEXT,
+    source TEXT,
+    error TEXT,
+    attempted_at TEXT,
+    PRIMARY KEY (url, source)
+);
+"""
+
+
+def make_cache_key(ticker: str, year: int, quarter: int) -> str:
+    """Builds the cache key for a ticker/year/quarter request."""
+    return f"{ticker.upper()}:{year}:Q{quarter}"
+
+
+def make_url_cache_key(url: str) -> str:
+    """Builds the cache key for a direct-URL request."""
+    return f"url:{url.strip()}"
+
+
+class TranscriptCache:
+    """SQLite-backed transcript cache with an in-memory LRU front."""
+
+    def __init__(self, db_path: str, ttl_hours: int = 720, memory_entries: int = 64):
+        self.db_path = db_path
+        self.ttl = timedelta(hours=ttl_hours)
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Returns this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def _remember(self, key: str, result: Dict[str, Any]) -> None:
+        with self._memory_lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached transcript result for `key`, or None."""
+        with self._memory_lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+        if result is not None:
+            self.hits += 1
+            return dict(result)
+
+        try:
+            row = self._connect().execute(
+                "SELECT * FROM transcript_cache WHERE id = ? AND expires_at > ?",
+                (key, datetime.utcnow().isoformat()),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Transcript cache read failed for {key}: {e}")
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        result = self._row_to_result(row)
+        self._remember(key, result)
+        self.hits += 1
+        return dict(result)
+
+    def put(
+        self,
+        key: str,
+        result: Dict[str, Any],
+        ticker: Optional[str] = None,
+        year: Optional[int] = None,
+        quarter: Optional[int] = None,
+    ) -> None:
+        """Stores a successful transcript result under `key`."""
+        if not result.get("success") or not result.get("transcript"):
+            return
+
+        now = datetime.utcnow()
+        metadata = {k: v for k, v in result.items() if k not in ("transcript", "message")}
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO transcript_cache "
+                "(id, ticker, quarter, year, source, url, content, metadata, cached_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    ticker.upper() if ticker else None,
+                    f"Q{quarter}" if quarter else None,
+                    year,
+                    result.get("source"),
+                    result.get("source_url"),
+                    result["transcript"],
+                    json.dumps(metadata),
+                    now.isoformat(),
+                    (now + self.ttl).isoformat(),
+                ),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Transcript cache write failed for {key}: {e}")
+            return
+
+        self._remember(key, {k: v for k, v in result.items() if k != "message"})
+
+    def update_metadata(self, key: str, updates: Dict[str, Any]) -> None:
+        """Merges `updates` into a cached entry's metadata without touching its content or expiry."""
+        try:
+            conn = self._connect()
+            row = conn.execute("SELECT metadata FROM transcript_cache WHERE id = ?", (key,)).fetchone()
+            if row is None:
+                return
+            metadata = json.loads(row["metadata"] or "{}")
+            metadata.update(updates)
+            conn.execute("UPDATE transcript_cache SET metadata = ? WHERE id = ?", (json.dumps(metadata), key))
+            conn.commit()
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"Transcript cache metadata update failed for {key}: {e}")
+            return
+
+        with self._memory_lock:
+            if key in self._memory:
+                self._memory[key] = {**self._memory[key], **updates}
+
+    def list_cached(self, ticker: str) -> List[Dict[str, Any]]:
+        """Lists the unexpired cached transcripts of a ticker, newest quarter first."""
+        try:
+            rows = self._connect().execute(
+                "SELECT id, year, quarter, cached_at FROM transcript_cache "
+                "WHERE ticker = ? AND year IS NOT NULL AND quarter IS NOT NULL AND expires_at > ? "
+                "ORDER BY year DESC, quarter DESC",
+                (ticker.upper(), datetime.utcnow().isoformat()),
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Transcript cache listing failed for {ticker}: {e}")
+            return []
+        return [
+            {"id": row["id"], "year": row["year"], "quarter": int(row["quarter"][1:]), "cached_at": row["cached_at"]}
+            for row in rows
+        ]
+
+    def record_failure(self, url: str, source: str, error: str) -> None:
+        """Remembers a failed fetch so other workers can skip it."""
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO failed_attempts (url, source, error, attempted_at) VALUES (?, ?, ?, ?)",
+                (url, source, error[:500], datetime.utcnow().isoformat()),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Could not record failed attempt for {url}: {e}")
+
+    def prewarm(self, limit: Optional[int] = None) -> int:
+        """Loads the most recently cached transcripts into the in-memory LRU."""
+        limit = limit or self.memory_entries
+        try:
+            rows = self._connect().execute(
+                "SELECT * FROM transcript_cache WHERE expires_at > ? ORDER BY cached_at DESC LIMIT ?",
+                (datetime.utcnow().isoformat(), limit),
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Transcript cache prewarm failed: {e}")
+            return 0
+
+        for row in reversed(rows):
+            self._remember(row["id"], self._row_to_result(row))
+        return len(rows)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns hit/miss counters and sizes for the health endpoint."""
+        try:
+            stored = self._connect().execute("SELECT COUNT(*) FROM transcript_cache").fetchone()[0]
+        except sqlite3.Error:
+            stored = None
+        return {
+            "path": self.db_path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory),
+            "stored_entries": stored,
+        }
+
+    def close(self) -> None:
+        """Closes the calling thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @staticmethod
+    def _row_to_result(row: sqlite3.Row) -> Dict[str, Any]:
+        try:
+            metadata = json.loads(row["metadata"] or "{}")
+        except ValueError:
+            metadata = {}
+        result = dict(metadata)
+        result.update({
+            "success": True,
+            "source": row["source"] or metadata.get("source"),
+            "source_url": row["url"] or metadata.get("source_url"),
+            "transcript": row["content"],
+            "cached_at": row["cached_at"],
+        })
+        return result
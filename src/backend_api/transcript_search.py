@@ -0,0 +1,202 @@
+"""
+Keyword and phrase mention search over cached transcripts.
+
+Each transcript is tokenized once into a positional index: every token's
+character offsets, its speaker and section, and posting lists from lowercased
+word and from stem to token positions. Phrase queries intersect the posting
+lists of consecutive words. Indexes are kept in a small LRU keyed by the
+transcript cache key, so repeated queries on the same transcript only walk
+posting lists.
+
+Hyphenated compounds are split into their parts ("AI-driven" is indexed as
+"ai", "driven"), so a search for "AI" finds them and a search for "AI-driven"
+matches as a phrase. Stemming uses NLTK's Porter stemmer when it is installed
+and a light suffix stripper otherwise.
+"""
+
+import logging
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from typing import Dict, Any, List, Tuple
+
+from utils.transcript_structure import find_speaker_turns, find_sections
+
+logger = logging.getLogger(__name__)
+
+try:
+    from nltk.stem import PorterStemmer
+    _porter = PorterStemmer()
+except ImportError:
+    _porter = None
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9]+(?:['’.][A-Za-z0-9]+)*")
+# Bumped whenever tokenize() or stem() changes, so stored term vectors are rebuilt
+TOKENIZER_VERSION = 2
+_LIGHT_SUFFIXES = ("ations", "ation", "ings", "ing", "edly", "ies", "ied", "ers", "er", "ed", "es", "ly", "s")
+
+
+def stem(word: str) -> str:
+    """Stems a lowercased word."""
+    if _porter is not None:
+        return _porter.stem(word)
+    base = word
+    for suffix in _LIGHT_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            base = word[: -len(suffix)]
+            if suffix in ("ies", "ied"):
+                base += "y"
+            break
+    # "price", "prices", "priced" and "pricing" all reduce to "pric"
+    if base.endswith("e") and len(base) > 3:
+        base = base[:-1]
+    return base
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text)
+
+
+class PositionalIndex:
+    """Token positions, speakers and sections of one transcript."""
+
+    def __init__(self, text: str):
+        self.text = text
+        matches = list(_TOKEN_RE.finditer(text))
+        self.starts = [m.start() for m in matches]
+        self.ends = [m.end() for m in matches]
+        self.tokens = [m.group(0) for m in matches]
+        self.words: Dict[str, List[int]] = defaultdict(list)
+        self.stems: Dict[str, List[int]] = defaultdict(list)
+        for position, token in enumerate(self.tokens):
+            word = token.lower()
+            self.words[word].append(position)
+            self.stems[stem(word)].append(position)
+
+        turns = find_speaker_turns(text)
+        self._turn_starts = [start for start, _ in turns]
+        self._turn_speakers = [speaker for _, speaker in turns]
+        sections = find_sections(text)
+        self._section_starts = [start for start, _ in sections]
+        self._section_names = [section for _, section in sections]
+
+    def speaker_at(self, offset: int) -> str:
+        return self._turn_speakers[bisect_right(self._turn_starts, offset) - 1] or "unattributed"
+
+    def section_at(self, offset: int) -> str:
+        return self._section_names[bisect_right(self._section_starts, offset) - 1]
+
+    def find(self, query: str, use_stems: bool = False, case_sensitive: bool = False) -> List[Tuple[int, int]]:
+        """
+        Finds a term or phrase.
+
+        Returns:
+            (start, end) character offsets of each mention, in order.
+        """
+        words = [w.lower() for w in tokenize(query)]
+        if not words:
+            return []
+        keys = [stem(w) for w in words] if use_stems else words
+        postings = self.stems if use_stems else self.words
+        exact = tokenize(query) if case_sensitive else None
+
+        mentions = []
+        following = [set(postings.get(key, ())) for key in keys[1:]]
+        for position in postings.get(keys[0], ()):
+            if not all(position + i + 1 in later for i, later in enumerate(following)):
+                continue
+            if exact and self.tokens[position:position + len(exact)] != exact:
+                continue
+            mentions.append((self.starts[position], self.ends[position + len(keys) - 1]))
+        return mentions
+
+
+class TranscriptSearcher:
+    """LRU of positional indexes keyed by transcript cache key."""
+
+    def __init__(self, max_indexes: int = 32):
+        self.max_indexes = max_indexes
+        self._indexes: "OrderedDict[str, PositionalIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.reuses = 0
+
+    def index_for(self, key: str, text: str) -> PositionalIndex:
+        """Returns the index for a transcript, building it on first use."""
+        with self._lock:
+            index = self._indexes.get(key)
+            # A re-fetched transcript may have changed under the same key
+            if index is not None and index.text == text:
+                self._indexes.move_to_end(key)
+                self.reuses += 1
+                return index
+
+        index = PositionalIndex(text)
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_indexes:
+                self._indexes.popitem(last=False)
+            self.builds += 1
+        return index
+
+    def search(
+        self,
+        key: str,
+        text: str,
+        terms: List[str],
+        use_stems: bool = False,
+        case_sensitive: bool = False,
+        window: int = 150,
+        max_snippets: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        Counts mentions of each term and collects context snippets.
+
+        Args:
+            key: Transcript cache key the index is stored under.
+            text: Transcript text.
+            terms: Words or phrases to look for.
+            use_stems: Match inflections ("pricing" also finds "price", "priced").
+            case_sensitive: Match the terms' capitalization exactly.
+            window: Characters of context on each side of a mention.
+            max_snippets: Maximum number of snippets per term.
+
+        Returns:
+            Per-term totals, counts by speaker and section, and snippets with offsets.
+        """
+        index = self.index_for(key, text)
+        results = []
+        for term in terms:
+            mentions = index.find(term, use_stems=use_stems, case_sensitive=case_sensitive)
+            by_speaker: Dict[str, int] = defaultdict(int)
+            by_section: Dict[str, int] = defaultdict(int)
+            snippets = []
+            for start, end in mentions:
+                speaker = index.speaker_at(start)
+                section = index.section_at(start)
+                by_speaker[speaker] += 1
+                by_section[section] += 1
+                if len(snippets) < max_snippets:
+                    snippet_start = max(0, start - window)
+                    snippet_end = min(len(text), end + window)
+                    snippets.append({
+                        "start": start,
+                        "end": end,
+                        "speaker": speaker,
+                        "section": section,
+                        "snippet": text[snippet_start:snippet_end].replace("\n", " "),
+                        "snippet_start": snippet_start,
+                    })
+            results.append({
+                "term": term,
+                "total": len(mentions),
+                "by_speaker": dict(sorted(by_speaker.items(), key=lambda item: -item[1])),
+                "by_section": dict(by_section),
+                "snippets": snippets,
+            })
+        return {"terms": results, "total_mentions": sum(r["total"] for r in results)}
+
+    def stats(self) -> Dict[str, Any]:
+        return {"indexes": len(self._indexes), "builds": self.builds, "reuses": self.reuses}
@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from typing import List
 from dotenv import load_dotenv
 
 # --- ROBUST PATH LOGIC ---
@@ -42,6 +43,149 @@ class Settings:
     # Google API Key
     GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "your-google-api-key")
 
+    # --- Backend Serving Configuration ---
+
+    # "development" keeps the single auto-reloading process, "production" runs N workers
+    BACKEND_SERVING_MODE: str = os.getenv("BACKEND_SERVING_MODE", "development")
+    BACKEND_WORKERS: int = int(os.getenv("BACKEND_WORKERS", str(os.cpu_count() or 1)))
+    BACKEND_USE_UVLOOP: bool = os.getenv("BACKEND_USE_UVLOOP", "true").lower() == "true"
+    BACKEND_GRACEFUL_SHUTDOWN_SECONDS: int = int(os.getenv("BACKEND_GRACEFUL_SHUTDOWN_SECONDS", "30"))
+    BACKEND_PREWARM: bool = os.getenv("BACKEND_PREWARM", "true").lower() == "true"
+    BACKEND_HTTP_POOL_SIZE: int = int(os.getenv("BACKEND_HTTP_POOL_SIZE", "20"))
+
+    # Admission control per backend worker; deadlines come from the caller's X-Request-Timeout header
+    BACKEND_MAX_IN_FLIGHT: int = int(os.getenv("BACKEND_MAX_IN_FLIGHT", "8"))
+    BACKEND_MAX_QUEUE: int = int(os.getenv("BACKEND_MAX_QUEUE", "32"))
+    BACKEND_QUEUE_TIMEOUT_SECONDS: float = float(os.getenv("BACKEND_QUEUE_TIMEOUT_SECONDS", "10"))
+    BACKEND_DEFAULT_DEADLINE_SECONDS: float = float(os.getenv("BACKEND_DEFAULT_DEADLINE_SECONDS", "110"))
+    BACKEND_MAX_DEADLINE_SECONDS: float = float(os.getenv("BACKEND_MAX_DEADLINE_SECONDS", "300"))
+
+    # Transcript cache shared by all backend workers through the on-disk SQLite store
+    TRANSCRIPT_CACHE_PATH: str = os.getenv(
+        "TRANSCRIPT_CACHE_PATH", str(PROJECT_ROOT / "cache" / "transcript_cache.db")
+    )
+    TRANSCRIPT_CACHE_TTL_HOURS: int = int(os.getenv("TRANSCRIPT_CACHE_TTL_HOURS", "720"))
+    TRANSCRIPT_CACHE_MEMORY_ENTRIES: int = int(os.getenv("TRANSCRIPT_CACHE_MEMORY_ENTRIES", "64"))
+    AVAILABILITY_DISCOVERY_ENABLED: bool = os.getenv("AVAILABILITY_DISCOVERY_ENABLED", "true").lower() == "true"
+    AVAILABILITY_DISCOVERY_INTERVAL_HOURS: int = int(os.getenv("AVAILABILITY_DISCOVERY_INTERVAL_HOURS", "24"))
+
+    # Positional indexes kept in memory for /transcripts/search
+    TRANSCRIPT_SEARCH_MAX_INDEXES: int = int(os.getenv("TRANSCRIPT_SEARCH_MAX_INDEXES", "32"))
+
+    # Candidate pages are verified from their first PAGE_PROBE_BYTES and capped at PAGE_MAX_BYTES
+    PAGE_PROBE_BYTES: int = int(os.getenv("PAGE_PROBE_BYTES", "16384"))
+    PAGE_MAX_BYTES: int = int(os.getenv("PAGE_MAX_BYTES", str(5 * 1024 * 1024)))
+
+    # --- Payload Encoding ---
+    FAST_JSON_ENABLED: bool = os.getenv("FAST_JSON_ENABLED", "true").lower() == "true"
+    HTTP_COMPRESSION_ENABLED: bool = os.getenv("HTTP_COMPRESSION_ENABLED", "true").lower() == "true"
+    HTTP_COMPRESSION_MIN_BYTES: int = int(os.getenv("HTTP_COMPRESSION_MIN_BYTES", "1024"))
+
+    # --- MCP Server → Backend Client ---
+
+    # Comma-separated backend replicas; defaults to the single backend service
+    EARNINGS_CALL_BACKEND_URLS: str = os.getenv("EARNINGS_CALL_BACKEND_URLS", "")
+    MCP_BACKEND_MAX_CONNECTIONS: int = int(os.getenv("MCP_BACKEND_MAX_CONNECTIONS", "50"))
+    MCP_BACKEND_MAX_KEEPALIVE: int = int(os.getenv("MCP_BACKEND_MAX_KEEPALIVE", "20"))
+    MCP_BACKEND_KEEPALIVE_EXPIRY: float = float(os.getenv("MCP_BACKEND_KEEPALIVE_EXPIRY", "30"))
+    MCP_BACKEND_CONNECT_TIMEOUT: float = float(os.getenv("MCP_BACKEND_CONNECT_TIMEOUT", "5"))
+    MCP_BACKEND_DEFAULT_TIMEOUT: float = float(os.getenv("MCP_BACKEND_DEFAULT_TIMEOUT", "30"))
+    MCP_GET_TRANSCRIPT_TIMEOUT: float = float(os.getenv("MCP_GET_TRANSCRIPT_TIMEOUT", "120"))
+    MCP_HEALTH_TIMEOUT: float = float(os.getenv("MCP_HEALTH_TIMEOUT", "5"))
+
+    # Background backend health polling; /health serves the latest snapshot
+    MCP_HEALTH_POLL_INTERVAL: float = float(os.getenv("MCP_HEALTH_POLL_INTERVAL", "15"))
+    MCP_HEALTH_POLL_JITTER: float = float(os.getenv("MCP_HEALTH_POLL_JITTER", "0.2"))
+
+    # In-process get_transcript cache in the MCP server, bounded by total payload bytes
+    MCP_CACHE_MAX_BYTES: int = int(os.getenv("MCP_CACHE_MAX_BYTES", str(128 * 1024 * 1024)))
+    MCP_CACHE_TTL_SECONDS: float = float(os.getenv("MCP_CACHE_TTL_SECONDS", "3600"))
+
+    # Paginated transcript delivery: default and maximum page size in characters
+    MCP_PAGE_CHARS: int = int(os.getenv("MCP_PAGE_CHARS", "12000"))
+    MCP_PAGE_MAX_CHARS: int = int(os.getenv("MCP_PAGE_MAX_CHARS", "60000"))
+
+    # MCP transport: "sse" (default) or "streamable-http". Streamable HTTP is
+    # stateless by default so replicas can sit behind a plain HTTP load balancer.
+    MCP_TRANSPORT: str = os.getenv("MCP_TRANSPORT", "sse").lower()
+    MCP_STATELESS_HTTP: bool = os.getenv("MCP_STATELESS_HTTP", "true").lower() == "true"
+    MCP_SERVER_HOST: str = os.getenv("MCP_SERVER_HOST", "127.0.0.1")
+    # Full MCP endpoint URL for the agent, e.g. a load balancer in front of several replicas
+    EARNINGS_CALL_MCP_URL: str = os.getenv("EARNINGS_CALL_MCP_URL", "")
+
+    # Local ticker master used by validate_ticker/resolve_ticker (CSV, or SEC company_tickers.json)
+    TICKER_MASTER_PATH: str = os.getenv(
+        "TICKER_MASTER_PATH", str(PROJECT_ROOT / "src" / "data" / "ticker_master.csv")
+    )
+
+    # --- A2A Agent ---
+
+    # ADK sessions held in memory by the agent executor; least recently used
+    # sessions are evicted past either limit and idle sessions after the TTL
+    A2A_SESSION_MAX_SESSIONS: int = int(os.getenv("A2A_SESSION_MAX_SESSIONS", "500"))
+    A2A_SESSION_MAX_BYTES: int = int(os.getenv("A2A_SESSION_MAX_BYTES", str(256 * 1024 * 1024)))
+    A2A_SESSION_IDLE_TTL_SECONDS: float = float(os.getenv("A2A_SESSION_IDLE_TTL_SECONDS", "3600"))
+    # Optional SQLite tier that keeps evicted sessions resumable
+    A2A_SESSION_PERSIST: bool = os.getenv("A2A_SESSION_PERSIST", "false").lower() == "true"
+    A2A_STATE_DB_PATH: str = os.getenv("A2A_STATE_DB_PATH", str(PROJECT_ROOT / "cache" / "a2a_state.db"))
+    A2A_SESSION_PERSIST_TTL_HOURS: float = float(os.getenv("A2A_SESSION_PERSIST_TTL_HOURS", "72"))
+
+    # A2A tasks are written through to A2A_STATE_DB_PATH; recently used tasks are
+    # also kept in memory, and terminal tasks are dropped after the TTL / retention
+    A2A_TASK_MEMORY_TASKS: int = int(os.getenv("A2A_TASK_MEMORY_TASKS", "256"))
+    A2A_TASK_MEMORY_BYTES: int = int(os.getenv("A2A_TASK_MEMORY_BYTES", str(64 * 1024 * 1024)))
+    A2A_TASK_MEMORY_TTL_SECONDS: float = float(os.getenv("A2A_TASK_MEMORY_TTL_SECONDS", "600"))
+    A2A_TASK_RETENTION_HOURS: float = float(os.getenv("A2A_TASK_RETENTION_HOURS", "24"))
+
+    # Plain "get <company> <quarter> earnings call" requests skip the LLM and call get_transcript directly
+    A2A_FAST_PATH_ENABLED: bool = os.getenv("A2A_FAST_PATH_ENABLED", "true").lower() == "true"
+
+    # Per-session memo of read-only tool results, and the size above which tool
+    # responses and replies from earlier turns are compacted in model requests
+    A2A_TOOL_MEMO_ENTRIES_PER_SESSION: int = int(os.getenv("A2A_TOOL_MEMO_ENTRIES_PER_SESSION", "32"))
+    A2A_TOOL_MEMO_TTL_SECONDS: float = float(os.getenv("A2A_TOOL_MEMO_TTL_SECONDS", "900"))
+    A2A_COMPACT_MIN_CHARS: int = int(os.getenv("A2A_COMPACT_MIN_CHARS", "2000"))
+
+    # Runs admitted at once per agent process and per user (the `user_id` message metadata);
+    # waiting runs are served round-robin between users
+    A2A_MAX_CONCURRENT_RUNS: int = int(os.getenv("A2A_MAX_CONCURRENT_RUNS", "16"))
+    A2A_MAX_RUNS_PER_USER: int = int(os.getenv("A2A_MAX_RUNS_PER_USER", "3"))
+    A2A_MAX_QUEUED_PER_USER: int = int(os.getenv("A2A_MAX_QUEUED_PER_USER", "20"))
+    A2A_QUEUE_STATUS_INTERVAL: float = float(os.getenv("A2A_QUEUE_STATUS_INTERVAL", "2"))
+
+    # Minimum seconds between "working" status updates of one task; held-back updates are coalesced
+    A2A_PROGRESS_MIN_INTERVAL: float = float(os.getenv("A2A_PROGRESS_MIN_INTERVAL", "1.0"))
+
+    # The agent's MCP toolset connects at startup (A2A_MCP_WARMUP_ATTEMPTS tries, after
+    # which the health check keeps retrying), is pinged every A2A_MCP_HEALTH_INTERVAL
+    # seconds and reconnects with exponential backoff when the server stops answering
+    A2A_MCP_WARMUP_ATTEMPTS: int = int(os.getenv("A2A_MCP_WARMUP_ATTEMPTS", "5"))
+    A2A_MCP_HEALTH_INTERVAL: float = float(os.getenv("A2A_MCP_HEALTH_INTERVAL", "30"))
+    A2A_MCP_RECONNECT_MAX_BACKOFF: float = float(os.getenv("A2A_MCP_RECONNECT_MAX_BACKOFF", "30"))
+
+    # Worker processes serving the A2A port. With more than one, tasks and ADK sessions are
+    # shared through A2A_STATE_DB_PATH, and a task's stream or cancellation served by a worker
+    # that does not own its run follows the shared store every A2A_SHARED_POLL_INTERVAL seconds.
+    # Run limits (A2A_MAX_CONCURRENT_RUNS etc.) apply per worker.
+    A2A_WORKERS: int = int(os.getenv("A2A_WORKERS", "1"))
+    A2A_SHARED_POLL_INTERVAL: float = float(os.getenv("A2A_SHARED_POLL_INTERVAL", "0.5"))
+
+    @property
+    def earnings_call_backend_urls(self) -> List[str]:
+        """Base URLs of the backend replicas the MCP server load-balances across."""
+        if self.EARNINGS_CALL_BACKEND_URLS:
+            return [url.strip() for url in self.EARNINGS_CALL_BACKEND_URLS.split(",") if url.strip()]
+        host = self.EARNINGS_CALL_BACKEND_SERVICE_NAME if self.APP_ENVIRONMENT == "docker" else "127.0.0.1"
+        return [f"http://{host}:{self.EARNINGS_CALL_BACKEND_PORT_INTERNAL}"]
+
+    @property
+    def earnings_call_mcp_url(self) -> str:
+        """MCP endpoint the agent's toolset connects to."""
+        if self.EARNINGS_CALL_MCP_URL:
+            return self.EARNINGS_CALL_MCP_URL
+        host = self.EARNINGS_CALL_MCP_SERVICE_NAME if self.APP_ENVIRONMENT == "docker" else "127.0.0.1"
+        return f"http://{host}:{self.EARNINGS_CALL_MCP_PORT_INTERNAL}/mcp"
+
     @property
     def earnings_call_transcript_agent_a2a_url(self) -> str:
         """URL for the Earnings Call Transcript Agent A2A service."""
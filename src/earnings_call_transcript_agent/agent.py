@@ -7,11 +7,13 @@ transcripts of corporate earnings calls for any specified public company and qua
 """
 
 import logging
+from functools import lru_cache
 from google.adk.agents import LlmAgent
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
-from google.adk.tools.mcp_tool.mcp_session_manager import SseConnectionParams
+from google.adk.tools.mcp_tool.mcp_session_manager import SseConnectionParams, StreamableHTTPConnectionParams
 from config.config import settings
 from utils.prompts_loader import load_prompt_file
+from earnings_call_transcript_agent.session_context import get_session_context
+from earnings_call_transcript_agent.toolset import WarmMCPToolset
 
 logger = logging.getLogger(__name__)
 
@@ -22,26 +24,40 @@ def build_agent() -> LlmAgent:
     Returns:
         A fully configured LlmAgent instance.
     """
-    mcp_host = (
-        settings.EARNINGS_CALL_MCP_SERVICE_NAME
-        if settings.APP_ENVIRONMENT == "docker"
-        else "127.0.0.1"
-    )
-    mcp_port = settings.EARNINGS_CALL_MCP_PORT_INTERNAL
-    mcp_server_url = f"http://{mcp_host}:{mcp_port}/mcp"
+    mcp_server_url = settings.earnings_call_mcp_url
     
-    logger.info(f"Earnings Call Transcript ADK Agent will connect to its MCP tool server at: {mcp_server_url}")
+    logger.info(
+        f"Earnings Call Transcript ADK Agent will connect to its MCP tool server at: {mcp_server_url} "
+        f"({settings.MCP_TRANSPORT})"
+    )
     
     earnings_call_tool_filter = [
-        "get_transcript"
+        "get_transcript",
+        "get_transcript_page",
+        "search_transcripts",
+        "search_transcript_mentions",
+        "term_trends",
+        "get_call_roster",
+        "validate_ticker",
+        "resolve_ticker"
     ]
     
-    toolset = MCPToolset(
-        connection_params=SseConnectionParams(url=mcp_server_url),
+    if settings.MCP_TRANSPORT == "streamable-http":
+        connection_params = StreamableHTTPConnectionParams(url=mcp_server_url)
+    else:
+        connection_params = SseConnectionParams(url=mcp_server_url)
+    
+    # Connected and health-checked at server startup (see server.make_lifespan);
+    # the filtered tool schema is cached instead of listed on every model call
+    toolset = WarmMCPToolset(
+        connection_params=connection_params,
         tool_filter=earnings_call_tool_filter,
+        health_interval=settings.A2A_MCP_HEALTH_INTERVAL,
+        max_backoff=settings.A2A_MCP_RECONNECT_MAX_BACKOFF,
     )
     
     instruction_prompt = load_prompt_file("earnings_call_agent_prompt.yaml")["instruction"]
+    session_context = get_session_context()
     
     agent = LlmAgent(
         name="EarningsCallTranscriptAgent",
@@ -54,9 +70,26 @@ def build_agent() -> LlmAgent:
         ),
         instruction=instruction_prompt,
         tools=[toolset],
+        # Repeated tool calls are answered from a per-session memo, full transcripts
+        # go to the user as artifacts, and earlier turns' large results are compacted
+        before_tool_callback=session_context.before_tool,
+        after_tool_callback=session_context.after_tool,
+        before_model_callback=session_context.before_model,
     )
     
     logger.info(f"LlmAgent '{agent.name}' has been built with {len(earnings_call_tool_filter)} tools.")
     return agent
 
-earnings_call_transcript_agent: LlmAgent = build_agent()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_agent() -> LlmAgent:
+    """
+    Returns the process-wide agent, building it on first use so that importing
+    this module does not connect the MCP toolset or load the prompt.
+    """
+    return build_agent()
+
+def __getattr__(name: str):
+    # Keeps `from ...agent import earnings_call_transcript_agent` working, lazily.
+    if name == "earnings_call_transcript_agent":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,29 +4,40 @@ agents/earnings_call_transcript_agent/src/earnings_call_transcript_agent/agent_e
 Bridges A2A protocol requests to the ADK-based Earnings Call Transcript Agent.
 Manages task lifecycle, consumes the agent's event stream to send
 progress updates, and returns the final result as A2A artifacts or messages.
-This version uses in-memory storage instead of database.
+ADK sessions live in a bounded in-memory service with an optional SQLite
+tier, and A2A tasks in the SQLite task store (see session_service and
+task_store); both are shared across worker processes.
 """
 
+import asyncio
 import logging
+import os
+import threading
+import time
+from collections import deque
 from uuid import uuid4
-from typing import Optional
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.server.tasks import TaskUpdater
-from a2a.types import Task, TaskState, UnsupportedOperationError
+from a2a.types import Part, Task, TaskState, TextPart, UnsupportedOperationError
 from a2a.utils import new_agent_text_message, new_task
 from a2a.utils.errors import ServerError
 
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService  # Changed from DatabaseSessionService
-from google.adk.artifacts import InMemoryArtifactService
-from google.adk.memory import InMemoryMemoryService
-from google.genai import types as genai_types
-from google.adk.events import Event as ADKEvent
-
-from earnings_call_transcript_agent.agent import earnings_call_transcript_agent 
 from config.config import settings
+from earnings_call_transcript_agent.fast_path import FetchIntent, parse_fetch_intent
+from earnings_call_transcript_agent.mcp_client import MCPClient, MCPToolError
+from earnings_call_transcript_agent.scheduler import FairScheduler
+from earnings_call_transcript_agent.progress import ProgressReporter
+from earnings_call_transcript_agent.session_context import get_session_context
+from earnings_call_transcript_agent.transcript_artifacts import artifact_filename, render_transcript
+
+# google.adk and google.genai are heavy; they are imported when the runner is
+# first built (see `_ensure_runner`) rather than when the server starts.
+if TYPE_CHECKING:
+    from google.adk.events import Event as ADKEvent
+    from google.adk.runners import Runner
 
 logger = logging.getLogger(__name__)
 
@@ -35,18 +46,164 @@ class EarningsCallTranscriptAgentExecutor(AgentExecutor):
     A2A Executor that handles streaming and in-memory sessions for the
     Earnings Call Transcript ADK agent.
     """
-    def __init__(self) -> None:
+    def __init__(self, task_store=None) -> None:
         super().__init__()
-        self.adk_agent_instance = earnings_call_transcript_agent
-        self.session_service = InMemorySessionService()  # Changed to in-memory
-        self._runner = Runner(
-            agent=self.adk_agent_instance,
-            app_name=self.adk_agent_instance.name,
-            session_service=self.session_service,
-            memory_service=InMemoryMemoryService(),
-            artifact_service=InMemoryArtifactService(),
+        # Shared task store; with several workers it is how a run learns it was canceled elsewhere
+        self.task_store = task_store
+        self.adk_agent_instance = None
+        self.session_service = None
+        self._runner: Optional["Runner"] = None
+        self._runner_lock = threading.Lock()
+        # Direct MCP session for fetch requests that do not need the model
+        self.mcp_client = MCPClient(
+            settings.earnings_call_mcp_url,
+            transport=settings.MCP_TRANSPORT,
+            timeout=settings.MCP_GET_TRANSCRIPT_TIMEOUT + 10,
         )
-        logger.info("EarningsCallTranscriptAgentExecutor initialized with in-memory ADK Runner.")
+        self.fast_path_stats = {"requests": 0, "parsed": 0, "hits": 0, "fallbacks": 0}
+        # asyncio task running each A2A task, so cancel() and client disconnects can stop the run
+        self._running: Dict[str, asyncio.Task] = {}
+        self._cancel_reasons: Dict[str, str] = {}
+        self.run_stats = {"canceled": 0, "aborted": 0}
+        self.progress_stats = {"sent": 0, "coalesced": 0, "duplicates": 0}
+        # Seconds from admission to the first tool result of each run
+        self._first_tool_call: deque = deque(maxlen=512)
+        self._first_tool_call_cold: Optional[float] = None
+        self._mcp_keepalive: Optional[asyncio.Task] = None
+        self.scheduler = FairScheduler(
+            max_concurrent=settings.A2A_MAX_CONCURRENT_RUNS,
+            per_user=settings.A2A_MAX_RUNS_PER_USER,
+            max_queued_per_user=settings.A2A_MAX_QUEUED_PER_USER,
+            status_interval=settings.A2A_QUEUE_STATUS_INTERVAL,
+        )
+        logger.info("EarningsCallTranscriptAgentExecutor initialized; ADK Runner will be built on first use.")
+
+    def _ensure_runner(self) -> "Runner":
+        """
+        Builds the ADK agent and Runner on first call. Safe to call from a
+        background thread at startup so the first request finds it ready.
+
+        Returns:
+            The shared ADK Runner.
+        """
+        if self._runner is not None:
+            return self._runner
+        with self._runner_lock:
+            if self._runner is None:
+                from google.adk.runners import Runner
+                from google.adk.artifacts import InMemoryArtifactService
+                from google.adk.memory import InMemoryMemoryService
+                from earnings_call_transcript_agent.agent import get_agent
+                from earnings_call_transcript_agent.session_service import BoundedSessionService, SessionStore
+
+                self.adk_agent_instance = get_agent()
+                store = None
+                shared = settings.A2A_WORKERS > 1
+                if settings.A2A_SESSION_PERSIST or shared:
+                    store = SessionStore(settings.A2A_STATE_DB_PATH, settings.A2A_SESSION_PERSIST_TTL_HOURS)
+                    store.purge_expired()
+                self.session_service = BoundedSessionService(
+                    max_sessions=settings.A2A_SESSION_MAX_SESSIONS,
+                    max_bytes=settings.A2A_SESSION_MAX_BYTES,
+                    idle_ttl_seconds=settings.A2A_SESSION_IDLE_TTL_SECONDS,
+                    store=store,
+                    shared=shared,
+                )
+                self._runner = Runner(
+                    agent=self.adk_agent_instance,
+                    app_name=self.adk_agent_instance.name,
+                    session_service=self.session_service,
+                    memory_service=InMemoryMemoryService(),
+                    artifact_service=InMemoryArtifactService(),
+                )
+                logger.info("ADK Runner built with in-memory services.")
+        return self._runner
+
+    def warm_up(self) -> None:
+        """Builds the runner ahead of the first request (called after the server is listening)."""
+        try:
+            self._ensure_runner()
+        except Exception as e:
+            logger.warning(f"Background warm-up of the ADK Runner failed: {e}")
+
+    @property
+    def toolset(self):
+        """The agent's MCP toolset, once the runner is built."""
+        if self.adk_agent_instance is None:
+            return None
+        from earnings_call_transcript_agent.toolset import WarmMCPToolset
+
+        return next((tool for tool in self.adk_agent_instance.tools if isinstance(tool, WarmMCPToolset)), None)
+
+    async def connect_mcp(self) -> None:
+        """
+        Connects the agent's MCP toolset and the fast-path client at startup,
+        then keeps the toolset health-checked. Runs on the server's event loop,
+        which owns the MCP sessions.
+        """
+        await asyncio.to_thread(self.warm_up)
+        toolset = self.toolset
+        if toolset is not None:
+            await toolset.connect(attempts=settings.A2A_MCP_WARMUP_ATTEMPTS)
+            self._mcp_keepalive = asyncio.create_task(toolset.keep_alive())
+        try:
+            await self.mcp_client.session()
+        except Exception as e:
+            logger.warning(f"Fast-path MCP client could not connect at startup: {e}")
+
+    async def close_mcp(self) -> None:
+        """Stops the health check and closes the MCP connections."""
+        if self._mcp_keepalive is not None:
+            self._mcp_keepalive.cancel()
+            self._mcp_keepalive = None
+        toolset = self.toolset
+        if toolset is not None:
+            try:
+                await toolset.close()
+            except Exception as e:
+                logger.debug(f"Closing the MCP toolset failed: {e}")
+        await self.mcp_client.close()
+
+    def _record_first_tool_call(self, admitted_at: float) -> None:
+        elapsed = time.monotonic() - admitted_at
+        if self._first_tool_call_cold is None:
+            self._first_tool_call_cold = round(elapsed, 3)
+        self._first_tool_call.append(elapsed)
+
+    def _first_tool_call_metrics(self) -> Dict[str, Any]:
+        samples = sorted(self._first_tool_call)
+        if not samples:
+            return {"samples": 0, "process_first": None}
+        return {
+            "samples": len(samples),
+            "process_first": self._first_tool_call_cold,
+            "p50": round(samples[len(samples) // 2], 3),
+            "p95": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+            "max": round(samples[-1], 3),
+        }
+
+    def metrics(self) -> Dict[str, Any]:
+        """Session metrics for the /metrics endpoint."""
+        toolset = self.toolset
+        return {
+            "worker_pid": os.getpid(),
+            "runner_ready": self._runner is not None,
+            "sessions": self.session_service.metrics() if self.session_service is not None else None,
+            "context": get_session_context().stats() if self._runner is not None else None,
+            "runs": {"running": len(self._running), **self.run_stats},
+            "scheduler": self.scheduler.stats(),
+            "progress": dict(self.progress_stats),
+            "mcp": {
+                "toolset": toolset.metrics() if toolset is not None else None,
+                "fast_path_client": {"connected": self.mcp_client._session is not None,
+                                     "connects": self.mcp_client.connects, "calls": self.mcp_client.calls},
+                "time_to_first_tool_call_seconds": self._first_tool_call_metrics(),
+            },
+            "fast_path": {
+                **self.fast_path_stats,
+                "hit_rate": round(self.fast_path_stats["hits"] / max(self.fast_path_stats["requests"], 1), 3),
+            },
+        }
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         """
@@ -75,18 +232,41 @@ class EarningsCallTranscriptAgentExecutor(AgentExecutor):
             f"Executing A2A Task {a2a_task.id} for Earnings Call Transcript. "
             f"ADK Session: {adk_session_id}, User: {user_id}"
         )
+        progress = ProgressReporter(
+            updater, adk_session_id, a2a_task.id, settings.A2A_PROGRESS_MIN_INTERVAL, self.progress_stats
+        )
+        self._running[a2a_task.id] = asyncio.current_task()
+        admitted = False
+        watcher = None
+        pinned_session = None
+        if self.task_store is not None and settings.A2A_WORKERS > 1:
+            watcher = asyncio.create_task(self._watch_for_cancel(a2a_task.id))
         try:
-            # Create session if it doesn't exist (in-memory)
-            adk_session = await self._runner.session_service.get_session(
-                app_name=self.adk_agent_instance.name, user_id=user_id, session_id=adk_session_id
-            )
-            if not adk_session:
-                await self._runner.session_service.create_session(
-                    app_name=self.adk_agent_instance.name, user_id=user_id, session_id=adk_session_id, state={}
-                )
+            async def report_position(position: int) -> None:
+                await progress.report(f"Queued: position {position}. Your request will start shortly.")
+
+            await self.scheduler.acquire(user_id, on_queued=report_position)
+            admitted = True
+            admitted_at = time.monotonic()
+            self.fast_path_stats["requests"] += 1
+            if settings.A2A_FAST_PATH_ENABLED:
+                intent = parse_fetch_intent(query)
+                if intent and await self._serve_fast_path(
+                    intent, query, user_id, adk_session_id, a2a_task.id, updater, progress, admitted_at
+                ):
+                    return
+
+            from google.genai import types as genai_types
+
+            if self._runner is None:
+                await asyncio.to_thread(self._ensure_runner)
+            # Load (or create) the session, then keep it in memory until the run has appended its final response
+            await self.session_service.pin_session(self.adk_agent_instance.name, user_id, adk_session_id)
+            pinned_session = (self.adk_agent_instance.name, user_id, adk_session_id)
 
             genai_user_message = genai_types.Content(role="user", parts=[genai_types.Part.from_text(text=query)])
-            final_adk_event: Optional[ADKEvent] = None
+            final_adk_event: Optional["ADKEvent"] = None
+            tool_called = False
             
             async for adk_event in self._runner.run_async(user_id=user_id, session_id=adk_session_id, new_message=genai_user_message):
                 if adk_event.is_final_response():
@@ -99,33 +279,182 @@ class EarningsCallTranscriptAgentExecutor(AgentExecutor):
                     if part.function_call:
                         tool_name = part.function_call.name
                         if tool_name == "get_transcript":
-                            thought_text = "Fetching earnings call transcript from the provided URL..."
+                            thought_text = "Fetching the earnings call transcript..."
                         else:
                             thought_text = f"Calling tool: `{tool_name}`..."
                     elif part.function_response:
                         thought_text = f"Tool `{part.function_response.name}` completed."
+                        if not tool_called:
+                            tool_called = True
+                            self._record_first_tool_call(admitted_at)
 
                     if thought_text:
-                        await updater.update_status(
-                            TaskState.working,
-                            new_agent_text_message(thought_text, adk_session_id, a2a_task.id)
-                        )
+                        await progress.report(thought_text)
+
+                if adk_event.actions and adk_event.actions.artifact_delta:
+                    await self._forward_artifacts(adk_event.actions.artifact_delta, user_id, adk_session_id, updater)
             
             if not final_adk_event or not final_adk_event.content or not final_adk_event.content.parts:
                 raise RuntimeError("Agent workflow completed without a final response.")
             
             final_text = final_adk_event.content.parts[0].text
-            await updater.update_status(
-                TaskState.completed,
-                new_agent_text_message(final_text, adk_session_id, a2a_task.id),
-                final=True
-            )
+            await progress.finish(TaskState.completed, final_text)
             logger.info(f"Task {a2a_task.id} completed successfully.")
 
+        except asyncio.CancelledError:
+            # Cancelling the run also cancels the in-flight Gemini request and MCP tool call
+            reason = self._cancel_reasons.pop(a2a_task.id, "server shutdown")
+            logger.info(f"A2A Task {a2a_task.id} stopped: {reason}.")
+            raise
         except Exception as e:
             logger.exception(f"Earnings Call Transcript workflow failed for A2A Task {a2a_task.id}: {e}")
-            error_message = new_agent_text_message(f"I encountered an error: {str(e)}", adk_session_id, a2a_task.id)
-            await updater.update_status(TaskState.failed, error_message, final=True)
+            await progress.finish(TaskState.failed, f"I encountered an error: {str(e)}")
+        finally:
+            progress.close()
+            if watcher is not None:
+                watcher.cancel()
+            if pinned_session is not None:
+                self.session_service.unpin(pinned_session)
+            if admitted:
+                self.scheduler.release(user_id)
+            self._running.pop(a2a_task.id, None)
+            self._cancel_reasons.pop(a2a_task.id, None)
+
+    async def _serve_fast_path(
+        self,
+        intent: FetchIntent,
+        query: str,
+        user_id: str,
+        session_id: str,
+        task_id: str,
+        updater: TaskUpdater,
+        progress: ProgressReporter,
+        admitted_at: float,
+    ) -> bool:
+        """
+        Serves a plain fetch request with direct MCP tool calls.
+
+        Returns:
+            True if the task was completed; False to fall back to the agent
+            (e.g. the transcript was not found and the user needs to be asked for a URL).
+        """
+        self.fast_path_stats["parsed"] += 1
+        await progress.report(f"Fetching the {intent.label} earnings call transcript...")
+
+        async def relay_progress(message: Optional[str]) -> None:
+            # Backend progress, e.g. which source or candidate URL is being checked
+            if message:
+                await progress.report(f"Fetching the {intent.label} transcript: {message}")
+        try:
+            if intent.url:
+                arguments = {"url": intent.url}
+            else:
+                year, quarter = intent.year, intent.quarter
+                if intent.latest:
+                    listing = await self.mcp_client.call_tool("search_transcripts", {"company_ticker": intent.ticker})
+                    self._record_first_tool_call(admitted_at)
+                    latest = listing.get("latest")
+                    if not latest:
+                        self.fast_path_stats["fallbacks"] += 1
+                        return False
+                    year, quarter = latest["year"], latest["quarter"]
+                arguments = {"company_ticker": intent.ticker, "year": year, "quarter": quarter}
+            result = await self.mcp_client.call_tool("get_transcript", arguments, on_progress=relay_progress)
+            if not intent.latest:
+                self._record_first_tool_call(admitted_at)
+        except MCPToolError as e:
+            logger.warning(f"Fast path for '{intent.label}' failed, falling back to the agent: {e}")
+            self.fast_path_stats["fallbacks"] += 1
+            return False
+        if not result.get("success") or not result.get("transcript"):
+            self.fast_path_stats["fallbacks"] += 1
+            return False
+
+        filename = artifact_filename(result)
+        await updater.add_artifact([Part(root=TextPart(text=render_transcript(result)))], name=filename)
+        words = len(result["transcript"].split())
+        source = result.get("source_info") or f"Retrieved from {result.get('source', 'the transcript sources')}"
+        reply = f"{source}: **{result.get('title') or intent.label}** ({words:,} words) is attached."
+        await progress.finish(TaskState.completed, reply)
+        self.fast_path_stats["hits"] += 1
+        logger.info(f"Task {task_id} served by the fast path ({intent.label}).")
+
+        try:
+            await self._record_turn(user_id, session_id, query, f"{reply} Transcript handle: {result.get('handle')}")
+        except Exception as e:
+            logger.warning(f"Could not record fast-path turn in ADK session {session_id}: {e}")
+        return True
+
+    async def _record_turn(self, user_id: str, session_id: str, query: str, reply: str) -> None:
+        """Adds a fast-path exchange to the ADK session so follow-up questions have its context."""
+        from google.adk.events import Event
+        from google.genai import types as genai_types
+
+        if self._runner is None:
+            await asyncio.to_thread(self._ensure_runner)
+        app_name = self.adk_agent_instance.name
+        session = await self.session_service.pin_session(app_name, user_id, session_id)
+        try:
+            invocation_id = f"fast-{uuid4().hex[:12]}"
+            for author, role, text in (("user", "user", query), (app_name, "model", reply)):
+                await self.session_service.append_event(session, Event(
+                    invocation_id=invocation_id,
+                    author=author,
+                    content=genai_types.Content(role=role, parts=[genai_types.Part.from_text(text=text)]),
+                ))
+        finally:
+            self.session_service.unpin((app_name, user_id, session_id))
+
+    async def _forward_artifacts(self, artifact_delta: Dict[str, int], user_id: str, session_id: str, updater: TaskUpdater) -> None:
+        """
+        Sends artifacts saved during the run (e.g. a fetched transcript) to the
+        A2A client as soon as they exist, instead of waiting for the model's answer.
+        """
+        artifact_service = self._runner.artifact_service
+        app_name = self.adk_agent_instance.name
+        for filename, version in artifact_delta.items():
+            artifact = await artifact_service.load_artifact(
+                app_name=app_name, user_id=user_id, session_id=session_id, filename=filename, version=version
+            )
+            if artifact is None or not artifact.text:
+                continue
+            await updater.add_artifact([Part(root=TextPart(text=artifact.text))], name=filename)
+            # The A2A task now holds the text; the model works from the transcript handle
+            await artifact_service.delete_artifact(
+                app_name=app_name, user_id=user_id, session_id=session_id, filename=filename
+            )
+            logger.info(f"Forwarded artifact {filename} ({len(artifact.text)} chars) to A2A task {updater.task_id}")
+
+    async def _watch_for_cancel(self, task_id: str) -> None:
+        """
+        Stops the run once the shared task store shows the task canceled, e.g.
+        by a `tasks/cancel` that another worker served.
+        """
+        while True:
+            await asyncio.sleep(settings.A2A_SHARED_POLL_INTERVAL)
+            try:
+                task = await self.task_store.get(task_id)
+            except Exception as e:
+                logger.debug(f"Cancellation check for A2A Task {task_id} failed: {e}")
+                continue
+            if task is not None and task.status is not None and task.status.state == TaskState.canceled:
+                if self.abort(task_id, "canceled through another worker"):
+                    self.run_stats["canceled"] += 1
+                return
+
+    def abort(self, task_id: str, reason: str) -> bool:
+        """
+        Stops the run of an A2A task, if it is running in this process.
+
+        Returns:
+            True if a running task was cancelled.
+        """
+        running = self._running.get(task_id)
+        if running is None or running.done():
+            return False
+        self._cancel_reasons[task_id] = reason
+        running.cancel()
+        return True
 
     async def cancel(self, request: RequestContext, event_queue: EventQueue) -> Optional[Task]:
         """ Handles an A2A task cancellation request. """
@@ -134,6 +463,8 @@ class EarningsCallTranscriptAgentExecutor(AgentExecutor):
             raise ServerError(error=UnsupportedOperationError(message="No active task to cancel."))
         
         logger.info(f"Cancelling A2A Task {task_to_cancel.id} for Earnings Call Transcript.")
+        if self.abort(task_to_cancel.id, "canceled by client"):
+            self.run_stats["canceled"] += 1
         updater = TaskUpdater(event_queue, task_to_cancel.id, task_to_cancel.contextId)
         await updater.update_status(
             TaskState.canceled,
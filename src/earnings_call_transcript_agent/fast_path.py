@@ -0,0 +1,155 @@
+"""
+Recognizes plain transcript fetch requests so the executor can serve them
+without an LLM round-trip.
+
+"Get MSFT Q4 2023 earnings call", "Apple 4Q23 transcript", "show me Tesla's
+latest earnings call" or "fetch https://..." map directly onto a
+`get_transcript` call. Anything that looks like a question or analysis
+("what did they say about...", "compare...") or names a company the ticker
+master cannot resolve exactly is left to the agent.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Tuple
+
+from utils.ticker_master import get_ticker_master
+
+# Only exact ticker, name, alias or former-name matches are trusted without the model
+MIN_RESOLVE_SCORE = 0.9
+MAX_COMPANY_WORDS = 5
+
+_URL_RE = re.compile(r"https?://\S+")
+_FETCH_RE = re.compile(r"\b(earnings?|transcripts?|call|conference call)\b")
+_QUESTION_RE = re.compile(
+    r"\?|\b(what|why|how|who|when|which|where|did|does|do|is|are|was|were|should|"
+    r"summar\w*|compar\w*|analy[sz]\w*|mention\w*|trend\w*|guidance|said|say|says|talk\w*|"
+    r"discuss\w*|highlight\w*|insight\w*|sentiment|tone|vs|versus|and|or|between|about|explain)\b"
+)
+_ORDINALS = {"first": 1, "1st": 1, "second": 2, "2nd": 2, "third": 3, "3rd": 3, "fourth": 4, "4th": 4}
+_YEAR = r"(?:fy\s*|fiscal\s+(?:year\s+)?)?'?(\d{4}|\d{2})"
+_PERIOD_PATTERNS = (
+    # Q4 2023, Q4 FY2023, Q4'23, Q4 of 2023
+    (re.compile(rf"\bq([1-4])\s*(?:of\s+)?{_YEAR}\b"), False),
+    # 2023 Q4, FY23 Q4
+    (re.compile(rf"\b{_YEAR}\s*q([1-4])\b"), True),
+    # 4Q23, 4Q 2023
+    (re.compile(r"\b([1-4])q\s*'?(\d{4}|\d{2})\b"), False),
+    # fourth quarter 2023, 4th fiscal quarter of 2023
+    (re.compile(rf"\b(first|second|third|fourth|1st|2nd|3rd|4th)\s+(?:fiscal\s+)?quarter\s+(?:of\s+)?{_YEAR}\b"), False),
+)
+_QUARTER_ONLY_RE = re.compile(r"\b(?:q([1-4])|(first|second|third|fourth|1st|2nd|3rd|4th)\s+(?:fiscal\s+)?quarter)\b")
+_LATEST_RE = re.compile(r"\b(latest|most recent|newest|last quarter'?s?|previous quarter'?s?|recent)\b")
+_LAST_YEAR_RE = re.compile(r"\b(last|previous) year'?s?\b")
+_FILLER = {
+    "get", "show", "fetch", "pull", "find", "give", "grab", "retrieve", "download", "send", "bring", "load",
+    "me", "us", "please", "pls", "the", "a", "an", "for", "of", "from", "to", "in", "full", "complete",
+    "entire", "whole", "earnings", "earning", "call", "calls", "transcript", "transcripts", "conference",
+    "quarterly", "report", "results", "fiscal", "fy", "quarter", "can", "you", "could", "would", "i", "want",
+    "need", "like", "its", "their", "text", "year", "this",
+}
+
+
+@dataclass(frozen=True)
+class FetchIntent:
+    """A request the executor can serve with a direct `get_transcript` call."""
+
+    ticker: Optional[str] = None
+    company: Optional[str] = None
+    year: Optional[int] = None
+    quarter: Optional[int] = None
+    latest: bool = False
+    url: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        if self.url:
+            return self.url
+        if self.latest:
+            return f"{self.company or self.ticker} latest"
+        return f"{self.company or self.ticker} Q{self.quarter} {self.year}"
+
+
+def _year(value: str) -> int:
+    year = int(value)
+    return 2000 + year if year < 100 else year
+
+
+def _quarter(value: str) -> int:
+    return int(value) if value.isdigit() else _ORDINALS[value]
+
+
+def _find_period(text: str, today: date) -> Tuple[Optional[Tuple[int, int]], bool, str]:
+    """
+    Extracts the requested period.
+
+    Returns:
+        ((year, quarter) or None, whether the latest call was asked for, text with the period removed).
+    """
+    for pattern, year_first in _PERIOD_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            year, quarter = (match.group(1), match.group(2)) if year_first else (match.group(2), match.group(1))
+            return (_year(year), _quarter(quarter)), False, text[:match.start()] + " " + text[match.end():]
+
+    match = _QUARTER_ONLY_RE.search(text)
+    if match:
+        quarter = _quarter(match.group(1) or match.group(2))
+        rest = text[:match.start()] + " " + text[match.end():]
+        last_year = _LAST_YEAR_RE.search(rest)
+        if last_year:
+            return (today.year - 1, quarter), False, rest[:last_year.start()] + " " + rest[last_year.end():]
+        # A quarter without a year means the current year, unless that quarter has not ended yet
+        year = today.year if quarter * 3 < today.month else today.year - 1
+        return (year, quarter), False, rest
+
+    match = _LATEST_RE.search(text)
+    if match:
+        return None, True, text[:match.start()] + " " + text[match.end():]
+    return None, False, text
+
+
+def parse_fetch_intent(query: str, today: Optional[date] = None) -> Optional[FetchIntent]:
+    """
+    Parses an unambiguous transcript fetch request.
+
+    Args:
+        query: The user's message.
+        today: Reference date for quarters given without a year.
+
+    Returns:
+        The fetch intent, or None when the request needs the agent.
+    """
+    text = " ".join(query.lower().split())
+    if not text or len(text) > 200:
+        return None
+
+    urls = _URL_RE.findall(query)
+    if urls:
+        rest = _URL_RE.sub(" ", text)
+        if len(urls) == 1 and not _QUESTION_RE.search(rest) and not set(re.findall(r"[a-z0-9']+", rest)) - _FILLER:
+            return FetchIntent(url=urls[0].rstrip(".,)"))
+        return None
+
+    if _QUESTION_RE.search(text) or not _FETCH_RE.search(text):
+        return None
+
+    period, latest, rest = _find_period(text, today or date.today())
+    if period is None and not latest:
+        return None
+
+    words = [w for w in re.findall(r"[a-z0-9][a-z0-9.&\-]*", rest.replace("'s", " ")) if w not in _FILLER]
+    if not words or len(words) > MAX_COMPANY_WORDS:
+        return None
+    matches = get_ticker_master().resolve(" ".join(words), limit=1)
+    if not matches or matches[0]["score"] < MIN_RESOLVE_SCORE:
+        return None
+
+    match = matches[0]
+    if latest:
+        return FetchIntent(ticker=match["ticker"], company=match["name"], latest=True)
+    year, quarter = period
+    if not 1990 <= year <= (today or date.today()).year + 1:
+        return None
+    return FetchIntent(ticker=match["ticker"], company=match["name"], year=year, quarter=quarter)
@@ -0,0 +1,146 @@
+"""
+Long-lived MCP client session for calling tools directly from the executor.
+
+The connection is owned by a background task (the MCP transports are anyio
+context managers that must be entered and exited in the same task); callers
+share the session and a dropped connection is re-established on the next call.
+Only transport failures close the session; a tool error or timeout fails that
+call alone.
+"""
+
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from earnings_call_transcript_agent.transcript_artifacts import tool_payload
+
+logger = logging.getLogger(__name__)
+
+
+class MCPToolError(RuntimeError):
+    """Raised when an MCP tool call fails or returns an error result."""
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """True if `error` means the MCP connection is broken, rather than one call failing."""
+    import anyio
+    import httpx
+    from mcp.shared.exceptions import McpError
+    from mcp.types import CONNECTION_CLOSED
+
+    if isinstance(error, McpError):
+        return error.error.code == CONNECTION_CLOSED
+    return isinstance(error, (
+        anyio.ClosedResourceError,
+        anyio.BrokenResourceError,
+        anyio.EndOfStream,
+        httpx.TransportError,
+        ConnectionError,
+    ))
+
+
+class MCPClient:
+    """Shared MCP ClientSession over SSE or streamable HTTP."""
+
+    def __init__(self, url: str, transport: str = "sse", timeout: float = 120):
+        self.url = url
+        self.transport = transport
+        self.timeout = timeout
+        self._session = None
+        self._owner: Optional[asyncio.Task] = None
+        self._closing: Optional[asyncio.Event] = None
+        self._lock = asyncio.Lock()
+        self.connects = 0
+        self.calls = 0
+
+    async def _own_connection(self, ready: asyncio.Future) -> None:
+        from mcp import ClientSession
+
+        try:
+            if self.transport == "streamable-http":
+                from mcp.client.streamable_http import streamablehttp_client
+                transport = streamablehttp_client(self.url)
+            else:
+                from mcp.client.sse import sse_client
+                transport = sse_client(self.url)
+            async with transport as streams:
+                async with ClientSession(streams[0], streams[1]) as session:
+                    await session.initialize()
+                    self._session = session
+                    self.connects += 1
+                    ready.set_result(session)
+                    await self._closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"MCP connection to {self.url} closed: {e}")
+        finally:
+            self._session = None
+
+    async def session(self):
+        """Returns the connected session, connecting first if needed."""
+        if self._session is not None:
+            return self._session
+        async with self._lock:
+            if self._session is None:
+                self._closing = asyncio.Event()
+                ready = asyncio.get_running_loop().create_future()
+                self._owner = asyncio.create_task(self._own_connection(ready))
+                await asyncio.wait_for(ready, timeout=self.timeout)
+                logger.info(f"MCP client connected to {self.url} ({self.transport})")
+        return self._session
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Dict[str, Any],
+        on_progress: Optional[Callable[[Optional[str]], Awaitable[None]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Calls an MCP tool and returns its result dict.
+
+        Args:
+            name: Tool name.
+            arguments: Tool arguments.
+            on_progress: Called with the message of each progress notification the tool sends.
+
+        Raises:
+            MCPToolError: The call failed or the tool reported an error.
+        """
+        try:
+            session = await self.session()
+        except Exception as e:
+            # Stop a half-open connection attempt; the next call connects again
+            await self.close()
+            raise MCPToolError(f"MCP call {name} failed: could not connect to {self.url}: {e}") from e
+
+        kwargs: Dict[str, Any] = {"read_timeout_seconds": timedelta(seconds=self.timeout)}
+        if on_progress is not None:
+            kwargs["progress_callback"] = lambda progress, total, message: on_progress(message)
+        try:
+            result = await session.call_tool(name, arguments, **kwargs)
+        except Exception as e:
+            # Other callers share the session, so only a broken connection is closed,
+            # and only if no other caller has reconnected in the meantime
+            if is_connection_error(e) and self._session in (session, None):
+                logger.warning(f"MCP connection to {self.url} lost during {name}: {e}; reconnecting on the next call")
+                await self.close()
+            raise MCPToolError(f"MCP call {name} failed: {e}") from e
+        self.calls += 1
+        payload = tool_payload(result.model_dump())
+        if result.isError or payload is None:
+            raise MCPToolError(f"MCP tool {name} returned an error: {payload or result.content}")
+        return payload
+
+    async def close(self) -> None:
+        if self._closing is not None:
+            self._closing.set()
+        if self._owner is not None:
+            try:
+                await asyncio.wait_for(self._owner, timeout=5)
+            except Exception:
+                self._owner.cancel()
+            self._owner = None
+        self._session = None
@@ -0,0 +1,75 @@
+"""
+Coalesced progress updates for one A2A task.
+
+Every `working` status update goes through the event queue, the task store and
+out to the client. The reporter sends at most one update per `min_interval`,
+suppresses a text identical to the last one sent, and while an update is held
+back keeps only the most recent text, so a burst of tool events (or a slow
+client) results in a single, current status.
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+from a2a.server.tasks import TaskUpdater
+from a2a.types import TaskState
+from a2a.utils import new_agent_text_message
+
+
+class ProgressReporter:
+    """Rate-limited, de-duplicated `working` status updates for one task."""
+
+    def __init__(self, updater: TaskUpdater, context_id: str, task_id: str, min_interval: float, stats: Dict[str, int]):
+        self.updater = updater
+        self.context_id = context_id
+        self.task_id = task_id
+        self.min_interval = min_interval
+        self.stats = stats
+        self._last_text: Optional[str] = None
+        self._last_sent = 0.0
+        self._pending: Optional[str] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def report(self, text: str) -> None:
+        if text == self._last_text or text == self._pending:
+            self.stats["duplicates"] += 1
+            return
+        if self._pending is not None:
+            self.stats["coalesced"] += 1
+        self._pending = text
+        if self._flusher is not None and not self._flusher.done():
+            return
+        wait = self._last_sent + self.min_interval - time.monotonic()
+        if wait <= 0:
+            await self._send()
+        else:
+            self._flusher = asyncio.create_task(self._flush_after(wait))
+
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self._pending is not None:
+            await self._send()
+
+    async def _send(self) -> None:
+        text, self._pending = self._pending, None
+        self._last_text = text
+        self._last_sent = time.monotonic()
+        self.stats["sent"] += 1
+        await self.updater.update_status(
+            TaskState.working, new_agent_text_message(text, self.context_id, self.task_id)
+        )
+
+    def close(self) -> None:
+        """Drops any held-back update; called before the task's final status."""
+        self._pending = None
+        if self._flusher is not None and not self._flusher.done():
+            self._flusher.cancel()
+        self._flusher = None
+
+    async def finish(self, state: TaskState, text: str) -> None:
+        """Sends the final status, after which no progress update can follow."""
+        self.close()
+        await self.updater.update_status(
+            state, new_agent_text_message(text, self.context_id, self.task_id), final=True
+        )
@@ -0,0 +1,123 @@
+"""
+A2A request handler that stops a streaming task's run when its client disconnects.
+
+`DefaultRequestHandler` keeps the agent running after a `message/stream`
+client goes away, spending Gemini quota and backend capacity on a result
+nobody will read. This handler cancels the run when the stream is closed
+before the task finished, and records the task as canceled in the task store
+(nothing else consumes the task's events once its only client is gone).
+
+With several worker processes, a task's event queue lives in the worker that
+runs it. `tasks/resubscribe` served by any other worker follows the task in the
+shared task store instead, streaming its status changes and new artifacts.
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Optional, Set
+
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.types import (
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskNotFoundError,
+    TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
+)
+from a2a.utils import new_agent_text_message
+from a2a.utils.errors import ServerError
+
+from config.config import settings
+from earnings_call_transcript_agent.agent_executor import EarningsCallTranscriptAgentExecutor
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATES = {TaskState.completed, TaskState.canceled, TaskState.failed, TaskState.rejected}
+
+
+def _event_task_id(event: Any) -> Optional[str]:
+    if isinstance(event, Task):
+        return event.id
+    return getattr(event, "taskId", None)
+
+
+class EarningsCallRequestHandler(DefaultRequestHandler):
+    """DefaultRequestHandler that cancels streaming runs on client disconnect and resubscribes across workers."""
+
+    def __init__(self, agent_executor: EarningsCallTranscriptAgentExecutor, task_store, **kwargs: Any):
+        super().__init__(agent_executor=agent_executor, task_store=task_store, **kwargs)
+        self.executor = agent_executor
+        self.store = task_store
+
+    async def on_message_send_stream(self, params, context=None) -> AsyncGenerator[Any, None]:
+        task_ids: Set[str] = set()
+        finished = False
+        try:
+            async for event in super().on_message_send_stream(params, context):
+                task_id = _event_task_id(event)
+                if task_id:
+                    task_ids.add(task_id)
+                if getattr(event, "final", False) or (
+                    isinstance(event, Task) and event.status and event.status.state in TERMINAL_STATES
+                ):
+                    finished = True
+                yield event
+            finished = True
+        finally:
+            if not finished:
+                for task_id in task_ids:
+                    await self._abort(task_id)
+
+    async def on_resubscribe_to_task(self, params, context=None) -> AsyncGenerator[Any, None]:
+        try:
+            async for event in super().on_resubscribe_to_task(params, context):
+                yield event
+            return
+        except ServerError as e:
+            # No local event queue: the run may belong to another worker
+            if not isinstance(e.error, TaskNotFoundError):
+                raise
+            task = await self.store.get(params.id)
+            if task is None or task.status is None or task.status.state in TERMINAL_STATES:
+                raise
+        logger.info(f"Following A2A Task {task.id} through the shared task store.")
+        async for event in self._follow(task):
+            yield event
+
+    async def _follow(self, task: Task) -> AsyncGenerator[Any, None]:
+        """Streams a task's status changes and new artifacts from the shared store until it finishes."""
+        sent_artifacts: Set[str] = {artifact.artifactId for artifact in task.artifacts or []}
+        last_status = task.status.model_dump_json()
+        while True:
+            await asyncio.sleep(settings.A2A_SHARED_POLL_INTERVAL)
+            current = await self.store.get(task.id)
+            if current is None:
+                return
+            for artifact in current.artifacts or []:
+                if artifact.artifactId not in sent_artifacts:
+                    sent_artifacts.add(artifact.artifactId)
+                    yield TaskArtifactUpdateEvent(taskId=task.id, contextId=task.contextId, artifact=artifact)
+            status = current.status.model_dump_json() if current.status else last_status
+            final = current.status is not None and current.status.state in TERMINAL_STATES
+            if status != last_status or final:
+                last_status = status
+                yield TaskStatusUpdateEvent(taskId=task.id, contextId=task.contextId, status=current.status, final=final)
+            if final:
+                return
+
+    async def _abort(self, task_id: str) -> None:
+        if not self.executor.abort(task_id, "client disconnected"):
+            return
+        self.executor.run_stats["aborted"] += 1
+        logger.info(f"Client disconnected from A2A Task {task_id}; run cancelled.")
+        try:
+            task = await self.store.get(task_id)
+            if task is not None and (task.status is None or task.status.state not in TERMINAL_STATES):
+                task.status = TaskStatus(
+                    state=TaskState.canceled,
+                    message=new_agent_text_message("Canceled because the client disconnected.", task.contextId, task_id),
+                )
+                await self.store.save(task)
+        except Exception as e:
+            logger.warning(f"Could not record cancellation of A2A Task {task_id}: {e}")
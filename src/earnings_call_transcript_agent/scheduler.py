@@ -0,0 +1,159 @@
+"""
+Fair admission of agent runs across users.
+
+At most `max_concurrent` runs execute at once and each user has at most
+`per_user` of them. Runs that cannot start wait in a per-user FIFO; when a
+slot frees up, users with waiting runs are served round-robin, so one user
+queueing dozens of tasks delays their own tasks rather than everyone else's.
+Waiters are told their queue position as it changes.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a user already has the maximum number of queued runs."""
+
+
+class _Waiter:
+    __slots__ = ("user_id", "future", "enqueued_at")
+
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.enqueued_at = time.monotonic()
+
+
+class FairScheduler:
+    """Global and per-user concurrency limits with round-robin queueing between users."""
+
+    def __init__(self, max_concurrent: int, per_user: int, max_queued_per_user: int, status_interval: float = 2.0):
+        self.max_concurrent = max_concurrent
+        self.per_user = per_user
+        self.max_queued_per_user = max_queued_per_user
+        self.status_interval = status_interval
+        self.running = 0
+        self._running_by_user: Dict[str, int] = {}
+        # Users with waiting runs, in round-robin order
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self.admitted = 0
+        self.queued_total = 0
+        self.rejected = 0
+        self._waits: Deque[float] = deque(maxlen=500)
+
+    def _can_start(self, user_id: str) -> bool:
+        return self.running < self.max_concurrent and self._running_by_user.get(user_id, 0) < self.per_user
+
+    def _start(self, user_id: str) -> None:
+        self.running += 1
+        self._running_by_user[user_id] = self._running_by_user.get(user_id, 0) + 1
+        self.admitted += 1
+
+    def _dispatch(self) -> None:
+        """Grants free slots to waiting users in round-robin order."""
+        while self.running < self.max_concurrent and self._queues:
+            for user_id, queue in self._queues.items():
+                if self._running_by_user.get(user_id, 0) < self.per_user:
+                    break
+            else:
+                return
+            waiter = queue.popleft()
+            if queue:
+                self._queues.move_to_end(user_id)
+            else:
+                del self._queues[user_id]
+            self._start(user_id)
+            self._waits.append(time.monotonic() - waiter.enqueued_at)
+            waiter.future.set_result(True)
+
+    def position(self, waiter: _Waiter) -> int:
+        """1-based position of a waiter in the round-robin service order."""
+        order: List[_Waiter] = []
+        depth = max((len(queue) for queue in self._queues.values()), default=0)
+        for k in range(depth):
+            for queue in self._queues.values():
+                if k < len(queue):
+                    order.append(queue[k])
+                    if queue[k] is waiter:
+                        return len(order)
+        return len(order) + 1
+
+    async def acquire(self, user_id: str, on_queued: Optional[Callable[[int], Awaitable[Any]]] = None) -> None:
+        """
+        Waits for a run slot for `user_id`.
+
+        Args:
+            user_id: The user the run belongs to.
+            on_queued: Called with the queue position whenever it changes while waiting.
+
+        Raises:
+            QueueFullError: The user already has `max_queued_per_user` runs waiting.
+        """
+        if not self._queues and self._can_start(user_id):
+            self._start(user_id)
+            self._waits.append(0.0)
+            return
+
+        queue = self._queues.get(user_id)
+        if queue is not None and len(queue) >= self.max_queued_per_user:
+            self.rejected += 1
+            raise QueueFullError(f"Too many queued requests ({len(queue)}); please wait for earlier ones to finish.")
+        waiter = _Waiter(user_id)
+        self._queues.setdefault(user_id, deque()).append(waiter)
+        self.queued_total += 1
+        self._dispatch()
+
+        reported = None
+        try:
+            while not waiter.future.done():
+                position = self.position(waiter)
+                if on_queued is not None and position != reported:
+                    reported = position
+                    await on_queued(position)
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter.future), timeout=self.status_interval)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot was granted just as the run was cancelled
+                self.release(user_id)
+            else:
+                waiter.future.cancel()
+                queue = self._queues.get(user_id)
+                if queue is not None and waiter in queue:
+                    queue.remove(waiter)
+                    if not queue:
+                        del self._queues[user_id]
+            raise
+
+    def release(self, user_id: str) -> None:
+        self.running -= 1
+        remaining = self._running_by_user.get(user_id, 1) - 1
+        if remaining:
+            self._running_by_user[user_id] = remaining
+        else:
+            self._running_by_user.pop(user_id, None)
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        waits = sorted(self._waits)
+        return {
+            "running": self.running,
+            "max_concurrent": self.max_concurrent,
+            "per_user": self.per_user,
+            "queue_depth": sum(len(queue) for queue in self._queues.values()),
+            "queued_users": len(self._queues),
+            "admitted": self.admitted,
+            "queued_total": self.queued_total,
+            "rejected": self.rejected,
+            "wait_seconds_p50": round(waits[len(waits) // 2], 3) if waits else 0.0,
+            "wait_seconds_p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 3) if waits else 0.0,
+            "wait_seconds_max": round(waits[-1], 3) if waits else 0.0,
+        }
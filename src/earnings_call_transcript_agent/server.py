@@ -7,16 +7,19 @@ A2A Starlette application with the agent's executor, and defines the main
 function to launch the Uvicorn server.
 """
 
+import asyncio
 import logging
 import uvicorn
+from contextlib import asynccontextmanager
 from typing import List
 from a2a.server.apps import A2AStarletteApplication
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCard, AgentSkill, AgentCapabilities, AgentProvider
-from fastapi.responses import JSONResponse
+from starlette.responses import JSONResponse
 from config.config import settings
-from earnings_call_transcript_agent.agent_executor import EarningsCallTranscriptAgentExecutor 
+from utils.compression import CompressionMiddleware
+from earnings_call_transcript_agent.task_store import SQLiteTaskStore
+from earnings_call_transcript_agent.agent_executor import EarningsCallTranscriptAgentExecutor
+from earnings_call_transcript_agent.request_handler import EarningsCallRequestHandler 
 
 logger = logging.getLogger(__name__)
 
@@ -71,16 +74,55 @@ async def health_check(request):
     """A simple health check endpoint that returns a 200 OK status."""
     return JSONResponse({"status": "ok"})
 
-def main() -> None:
-    """Initializes and runs the A2A server for the Earnings Call Transcript Agent."""
+def make_metrics_route(agent_executor: EarningsCallTranscriptAgentExecutor, task_store: SQLiteTaskStore):
+    """Builds the /metrics endpoint reporting session and task store metrics."""
+    async def metrics(request):
+        return JSONResponse({**agent_executor.metrics(), "tasks": task_store.stats()})
+    return metrics
+
+def make_lifespan(agent_executor: EarningsCallTranscriptAgentExecutor, task_store: SQLiteTaskStore):
+    """
+    Builds a lifespan that warms the ADK runner and connects the MCP toolset in
+    the background once the server is listening, so cold start is not blocked on
+    google.adk imports and the first request does not pay for the MCP handshake.
+    """
+    @asynccontextmanager
+    async def lifespan(app):
+        warmup_task = asyncio.create_task(agent_executor.connect_mcp())
+        yield
+        if not warmup_task.done():
+            warmup_task.cancel()
+        await agent_executor.close_mcp()
+        task_store.close()
+    return lifespan
+
+def configure_logging() -> None:
     logging.basicConfig(
         level=settings.LOG_LEVEL.upper(),
         format='%(asctime)s - %(name)s [%(levelname)s] - %(message)s'
     )
+
+def create_app():
+    """
+    Builds the A2A Starlette app with its executor and task store. Each uvicorn
+    worker process calls this once; workers share task and session state
+    through the SQLite database at A2A_STATE_DB_PATH.
     
-    request_handler = DefaultRequestHandler(
-        agent_executor=EarningsCallTranscriptAgentExecutor(),
-        task_store=InMemoryTaskStore(),
+    Returns:
+        The ASGI application.
+    """
+    configure_logging()
+    task_store = SQLiteTaskStore(
+        settings.A2A_STATE_DB_PATH,
+        memory_tasks=settings.A2A_TASK_MEMORY_TASKS,
+        memory_bytes=settings.A2A_TASK_MEMORY_BYTES,
+        memory_ttl_seconds=settings.A2A_TASK_MEMORY_TTL_SECONDS,
+        retention_hours=settings.A2A_TASK_RETENTION_HOURS,
+    )
+    agent_executor = EarningsCallTranscriptAgentExecutor(task_store=task_store)
+    request_handler = EarningsCallRequestHandler(
+        agent_executor=agent_executor,
+        task_store=task_store,
     )
     
     server_app = A2AStarletteApplication(
@@ -88,20 +130,42 @@ def main() -> None:
         http_handler=request_handler
     )
     
-    app = server_app.build()
+    app = server_app.build(lifespan=make_lifespan(agent_executor, task_store))
     app.add_route("/health", health_check, methods=["GET"])
-    
+    app.add_route("/metrics", make_metrics_route(agent_executor, task_store), methods=["GET"])
+    if settings.HTTP_COMPRESSION_ENABLED:
+        app.add_middleware(CompressionMiddleware, minimum_size=settings.HTTP_COMPRESSION_MIN_BYTES)
+    return app
+
+def main() -> None:
+    """Initializes and runs the A2A server for the Earnings Call Transcript Agent."""
+    configure_logging()
     host = "0.0.0.0" if settings.APP_ENVIRONMENT == "docker" else "127.0.0.1"
     port = settings.EARNINGS_CALL_TRANSCRIPT_A2A_PORT_INTERNAL
+    workers = max(settings.A2A_WORKERS, 1)
     
-    logger.info(f"Starting Earnings Call Transcript Agent A2A server on http://{host}:{port}")
-    
-    uvicorn.run(
-        app,
-        host=host,
-        port=port,
-        log_level=settings.LOG_LEVEL.lower()
+    logger.info(
+        f"Starting Earnings Call Transcript Agent A2A server on http://{host}:{port} "
+        f"with {workers} worker process(es)"
     )
+    
+    if workers > 1:
+        # Workers are separate processes that import the app factory themselves
+        uvicorn.run(
+            "earnings_call_transcript_agent.server:create_app",
+            factory=True,
+            workers=workers,
+            host=host,
+            port=port,
+            log_level=settings.LOG_LEVEL.lower()
+        )
+    else:
+        uvicorn.run(
+            create_app(),
+            host=host,
+            port=port,
+            log_level=settings.LOG_LEVEL.lower()
+        )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""
+Per-session tool result memoization and history compaction for the agent.
+
+Three ADK callbacks keep per-turn model input roughly flat as a conversation
+grows:
+
+- before_tool: answers a repeated read-only tool call (same tool, same
+  arguments, same session) from memory instead of calling the MCP server.
+- after_tool: delivers transcripts as artifacts (see `transcript_artifacts`)
+  and memoizes the response the model saw.
+- before_model: in the request sent to Gemini, replaces large tool responses
+  and long model replies from earlier turns with compact summaries that keep
+  their handles and scalar fields. The session itself is not modified, and the
+  full result is one (memoized) tool call away when the model needs it again.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from config.config import settings
+from earnings_call_transcript_agent.transcript_artifacts import TRANSCRIPT_TOOL, deliver_transcript_artifact, tool_payload
+
+logger = logging.getLogger(__name__)
+
+# Read-only tools whose results can be reused within a session
+MEMOIZABLE_TOOLS = {
+    "get_transcript",
+    "get_transcript_page",
+    "search_transcripts",
+    "search_transcript_mentions",
+    "term_trends",
+    "get_call_roster",
+    "validate_ticker",
+    "resolve_ticker",
+}
+# Kept verbatim in a compacted tool response
+_MAX_SCALAR_CHARS = 200
+_COMPACT_NOTE = (
+    "Earlier result compacted to save context. Call the tool again with the same arguments "
+    "(answered from memory) or read pages by handle if you need the details."
+)
+
+
+def _session_key(context) -> Tuple[str, str]:
+    """(user id, session id) of the session a ToolContext or CallbackContext belongs to."""
+    session = context.session
+    return (session.user_id, session.id)
+
+
+def _memo_key(tool_name: str, args: Dict[str, Any]) -> str:
+    return f"{tool_name}:{json.dumps(args, sort_keys=True, default=str)}"
+
+
+def _memoizable(tool_name: str, args: Dict[str, Any]) -> bool:
+    # A full transcript request re-delivers the artifact, so it always runs
+    if tool_name == TRANSCRIPT_TOOL and not args.get("paginate"):
+        return False
+    return tool_name in MEMOIZABLE_TOOLS
+
+
+def compact_response(name: str, response: Dict[str, Any]) -> Dict[str, Any]:
+    """Keeps the short scalar fields of a tool response and the sizes of everything else."""
+    payload = tool_payload(response) or response
+    compact: Dict[str, Any] = {"compacted": True, "tool": name}
+    for key, value in payload.items():
+        if isinstance(value, (bool, int, float)) or value is None:
+            compact[key] = value
+        elif isinstance(value, str):
+            compact[key] = value if len(value) <= _MAX_SCALAR_CHARS else f"[{len(value):,} chars omitted]"
+        elif isinstance(value, (list, dict)):
+            compact[key] = f"[{len(value)} items omitted]"
+    compact["note"] = _COMPACT_NOTE
+    return compact
+
+
+class SessionContextManager:
+    """Holds the per-session memo and implements the agent's context callbacks."""
+
+    def __init__(self, entries_per_session: int, max_sessions: int, ttl_seconds: float, compact_min_chars: int):
+        self.entries_per_session = entries_per_session
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.compact_min_chars = compact_min_chars
+        self._memo: "OrderedDict[Tuple[str, str], OrderedDict[str, Tuple[float, Dict[str, Any]]]]" = OrderedDict()
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.compacted_parts = 0
+        self.compacted_chars = 0
+
+    def _session_memo(self, key: Tuple[str, str]) -> "OrderedDict[str, Tuple[float, Dict[str, Any]]]":
+        memo = self._memo.get(key)
+        if memo is None:
+            memo = self._memo[key] = OrderedDict()
+            while len(self._memo) > self.max_sessions:
+                self._memo.popitem(last=False)
+        self._memo.move_to_end(key)
+        return memo
+
+    async def before_tool(self, tool, args: Dict[str, Any], tool_context) -> Optional[Dict[str, Any]]:
+        if not _memoizable(tool.name, args):
+            return None
+        memo = self._session_memo(_session_key(tool_context))
+        entry = memo.get(_memo_key(tool.name, args))
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            self.memo_misses += 1
+            return None
+        self.memo_hits += 1
+        logger.info(f"Answering {tool.name} from the session memo")
+        return {**entry[1], "memoized": True}
+
+    async def after_tool(self, tool, args: Dict[str, Any], tool_context, tool_response: Any) -> Optional[Dict[str, Any]]:
+        replacement = await deliver_transcript_artifact(tool, args, tool_context, tool_response)
+        response = replacement if replacement is not None else tool_response
+        if isinstance(response, dict) and not response.get("memoized") and _memoizable(tool.name, args):
+            payload = tool_payload(response)
+            if payload is not None and payload.get("success", True):
+                memo = self._session_memo(_session_key(tool_context))
+                memo[_memo_key(tool.name, args)] = (time.monotonic(), payload)
+                memo.move_to_end(_memo_key(tool.name, args))
+                while len(memo) > self.entries_per_session:
+                    memo.popitem(last=False)
+        return replacement
+
+    async def before_model(self, callback_context, llm_request) -> None:
+        """Compacts large tool responses and model replies from turns before the current one."""
+        from google.genai import types as genai_types
+
+        contents = llm_request.contents or []
+        # The current turn starts at the last user text message; everything before it is history
+        current = 0
+        for i, content in enumerate(contents):
+            if content.role == "user" and any(part.text for part in content.parts or []):
+                current = i
+
+        for i in range(current):
+            content = contents[i]
+            parts, changed = [], False
+            for part in content.parts or []:
+                if part.function_response and part.function_response.response:
+                    size = len(json.dumps(part.function_response.response, default=str))
+                    if size > self.compact_min_chars:
+                        compact = compact_response(part.function_response.name, part.function_response.response)
+                        part = genai_types.Part(function_response=genai_types.FunctionResponse(
+                            id=part.function_response.id, name=part.function_response.name, response=compact
+                        ))
+                        self.compacted_chars += size - len(json.dumps(compact))
+                        self.compacted_parts += 1
+                        changed = True
+                elif content.role == "model" and part.text and len(part.text) > self.compact_min_chars:
+                    self.compacted_chars += len(part.text) - self.compact_min_chars
+                    self.compacted_parts += 1
+                    part = genai_types.Part.from_text(
+                        text=part.text[: self.compact_min_chars] + "\n[... rest of this earlier reply omitted]"
+                    )
+                    changed = True
+                parts.append(part)
+            if changed:
+                # New Content objects, so the events stored in the session keep their full parts
+                contents[i] = genai_types.Content(role=content.role, parts=parts)
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "memo_sessions": len(self._memo),
+            "memo_entries": sum(len(memo) for memo in self._memo.values()),
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+            "compacted_parts": self.compacted_parts,
+            "compacted_chars": self.compacted_chars,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_session_context() -> SessionContextManager:
+    """Returns the process-wide manager used by the agent's callbacks."""
+    return SessionContextManager(
+        entries_per_session=settings.A2A_TOOL_MEMO_ENTRIES_PER_SESSION,
+        max_sessions=settings.A2A_SESSION_MAX_SESSIONS,
+        ttl_seconds=settings.A2A_TOOL_MEMO_TTL_SECONDS,
+        compact_min_chars=settings.A2A_COMPACT_MIN_CHARS,
+    )
@@ -0,0 +1,360 @@
+"""
+Bounded in-memory ADK session service for the A2A executor.
+
+`InMemorySessionService` keeps every session and its full event history
+(including multi-hundred-KB tool responses) for the life of the process. This
+subclass caps the number of live sessions and their total size, expires
+sessions idle for longer than a TTL, and evicts the least recently used
+sessions first. Sessions with a run in progress are pinned and never evicted
+or expired, so a turn is not cut off half-way. Evicted and expired sessions
+can optionally be written to a SQLite tier and are transparently restored when
+their conversation resumes.
+
+With several A2A worker processes the SQLite tier is shared: each completed
+turn is written through, and a worker reloads a session whose stored version
+is newer than its in-memory copy, so a conversation can continue on any
+worker. Concurrent turns of one session on two workers are last-writer-wins.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService, Session
+
+logger = logging.getLogger(__name__)
+
+SessionKey = Tuple[str, str, str]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS adk_sessions (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    bytes INTEGER,
+    saved_at TEXT,
+    version INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (app_name, user_id, session_id)
+);
+CREATE INDEX IF NOT EXISTS idx_adk_sessions_saved_at ON adk_sessions (saved_at);
+"""
+
+
+class SessionStore:
+    """SQLite tier for evicted or shared sessions (WAL, one connection per thread)."""
+
+    def __init__(self, db_path: str, ttl_hours: float):
+        self.db_path = db_path
+        self.ttl = timedelta(hours=ttl_hours)
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def save(self, key: SessionKey, data: str) -> int:
+        """Writes a session and returns its new version."""
+        conn = self._connect()
+        conn.execute(
+            "INSERT INTO adk_sessions (app_name, user_id, session_id, data, bytes, saved_at, version) "
+            "VALUES (?, ?, ?, ?, ?, ?, 1) ON CONFLICT(app_name, user_id, session_id) DO UPDATE SET "
+            "data = excluded.data, bytes = excluded.bytes, saved_at = excluded.saved_at, "
+            "version = adk_sessions.version + 1",
+            (*key, data, len(data), datetime.utcnow().isoformat()),
+        )
+        version = conn.execute(
+            "SELECT version FROM adk_sessions WHERE app_name = ? AND user_id = ? AND session_id = ?", key
+        ).fetchone()[0]
+        conn.commit()
+        return version
+
+    def load(self, key: SessionKey) -> Optional[Tuple[str, int]]:
+        """Returns the session's data and version, unless it is missing or expired."""
+        row = self._connect().execute(
+            "SELECT data, version FROM adk_sessions "
+            "WHERE app_name = ? AND user_id = ? AND session_id = ? AND saved_at > ?",
+            (*key, (datetime.utcnow() - self.ttl).isoformat()),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def version(self, key: SessionKey) -> Optional[int]:
+        row = self._connect().execute(
+            "SELECT version FROM adk_sessions WHERE app_name = ? AND user_id = ? AND session_id = ?", key
+        ).fetchone()
+        return row[0] if row else None
+
+    def delete(self, key: SessionKey) -> None:
+        conn = self._connect()
+        conn.execute("DELETE FROM adk_sessions WHERE app_name = ? AND user_id = ? AND session_id = ?", key)
+        conn.commit()
+
+    def purge_expired(self) -> int:
+        conn = self._connect()
+        cursor = conn.execute(
+            "DELETE FROM adk_sessions WHERE saved_at <= ?", ((datetime.utcnow() - self.ttl).isoformat(),)
+        )
+        conn.commit()
+        return cursor.rowcount
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM adk_sessions").fetchone()[0]
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class BoundedSessionService(InMemorySessionService):
+    """In-memory session service with max sessions, max bytes, idle TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        max_sessions: int,
+        max_bytes: int,
+        idle_ttl_seconds: float,
+        store: Optional[SessionStore] = None,
+        shared: bool = False,
+    ):
+        super().__init__()
+        if shared and store is None:
+            raise ValueError("A shared session service needs a SessionStore")
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.store = store
+        self.shared = shared
+        # Stored version each in-memory session was loaded from or last written as (shared mode)
+        self._versions: Dict[SessionKey, int] = {}
+        # Sessions with a run in progress -> number of runs; never evicted
+        self._pinned: Dict[SessionKey, int] = {}
+        # Least recently used first: key -> (approximate bytes, last access)
+        self._lru: "OrderedDict[SessionKey, Tuple[int, float]]" = OrderedDict()
+        self.live_bytes = 0
+        self.evicted_sessions = 0
+        self.evicted_bytes = 0
+        self.expired_sessions = 0
+        self.restored_sessions = 0
+        self.written_through = 0
+        self.reloaded_sessions = 0
+
+    # --- ADK session service API ---
+
+    async def create_session(self, **kwargs: Any) -> Session:
+        session = await super().create_session(**kwargs)
+        key = self._key(session)
+        self._track(key, len(session.model_dump_json()))
+        await self._enforce_limits(keep=key)
+        return session
+
+    async def get_session(self, **kwargs: Any) -> Optional[Session]:
+        key = (kwargs["app_name"], kwargs["user_id"], kwargs["session_id"])
+        await self._expire_idle()
+        if key in self._lru and self.shared:
+            await self._reload_if_stale(key)
+        if key not in self._lru and self.store is not None:
+            await self._restore(key)
+        session = await super().get_session(**kwargs)
+        if session is not None and key in self._lru:
+            self._touch(key)
+        return session
+
+    async def delete_session(self, **kwargs: Any) -> None:
+        key = (kwargs["app_name"], kwargs["user_id"], kwargs["session_id"])
+        await super().delete_session(**kwargs)
+        self._untrack(key)
+        self._versions.pop(key, None)
+        if self.store is not None:
+            await asyncio.to_thread(self.store.delete, key)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session, event)
+        key = self._key(session)
+        # An evicted session is not written back by the base class, so there is nothing to track
+        if not event.partial and self._stored_session(key) is not None:
+            size = len(event.model_dump_json(exclude_none=True))
+            self._track(key, self._lru.get(key, (0, 0.0))[0] + size)
+            await self._enforce_limits(keep=key)
+        if self.shared and event.is_final_response() and not event.partial:
+            await self._write_through(key, self._stored_session(key) or session)
+        return event
+
+    # --- Pinning ---
+
+    async def pin_session(self, app_name: str, user_id: str, session_id: str) -> Session:
+        """
+        Returns a session ready for a run and pins it; pair with `unpin`.
+
+        The session is fetched (reloading a copy another worker has superseded)
+        or created before it is pinned, because a pinned session is never reloaded.
+        """
+        session = await self.get_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        if session is None:
+            session = await self.create_session(app_name=app_name, user_id=user_id, session_id=session_id, state={})
+        self.pin((app_name, user_id, session_id))
+        return session
+
+    def pin(self, key: SessionKey) -> None:
+        """Keeps a session in memory while a run appends to it; pair with `unpin`."""
+        self._pinned[key] = self._pinned.get(key, 0) + 1
+
+    def unpin(self, key: SessionKey) -> None:
+        remaining = self._pinned.get(key, 0) - 1
+        if remaining > 0:
+            self._pinned[key] = remaining
+        else:
+            self._pinned.pop(key, None)
+
+    # --- Bookkeeping ---
+
+    @staticmethod
+    def _key(session: Session) -> SessionKey:
+        return (session.app_name, session.user_id, session.id)
+
+    def _track(self, key: SessionKey, size: int) -> None:
+        previous = self._lru.pop(key, (0, 0.0))[0]
+        self._lru[key] = (size, time.monotonic())
+        self.live_bytes += size - previous
+
+    def _touch(self, key: SessionKey) -> None:
+        size, _ = self._lru.pop(key)
+        self._lru[key] = (size, time.monotonic())
+
+    def _untrack(self, key: SessionKey) -> int:
+        size, _ = self._lru.pop(key, (0, 0.0))
+        self.live_bytes -= size
+        return size
+
+    def _stored_session(self, key: SessionKey) -> Optional[Session]:
+        app_name, user_id, session_id = key
+        return self.sessions.get(app_name, {}).get(user_id, {}).get(session_id)
+
+    async def _evict(self, key: SessionKey) -> None:
+        """Drops a session from memory, writing it to the SQLite tier first if enabled."""
+        session = self._stored_session(key)
+        size = self._untrack(key)
+        self._versions.pop(key, None)
+        if session is None:
+            return
+        # A shared store already holds every completed turn, possibly newer ones from other workers
+        if self.store is not None and not self.shared:
+            try:
+                await asyncio.to_thread(self.store.save, key, session.model_dump_json())
+            except sqlite3.Error as e:
+                logger.error(f"Could not persist evicted session {key[2]}: {e}")
+        app_name, user_id, session_id = key
+        user_sessions = self.sessions.get(app_name, {}).get(user_id, {})
+        user_sessions.pop(session_id, None)
+        if not user_sessions:
+            self.sessions.get(app_name, {}).pop(user_id, None)
+        self.evicted_bytes += size
+
+    def _over_budget(self) -> bool:
+        return len(self._lru) > self.max_sessions or self.live_bytes > self.max_bytes
+
+    async def _enforce_limits(self, keep: Optional[SessionKey] = None) -> None:
+        """
+        Evicts least recently used sessions until both the count and byte limits
+        hold. The session being written and pinned sessions are never evicted,
+        even if that leaves memory over budget until their runs finish.
+        """
+        if not self._over_budget():
+            return
+        candidates = [key for key in self._lru if key != keep and key not in self._pinned]
+        for key in candidates:
+            if not self._over_budget():
+                break
+            await self._evict(key)
+            self.evicted_sessions += 1
+
+    async def _expire_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_ttl_seconds
+        expired = []
+        for key, (_, last_access) in self._lru.items():
+            if last_access > cutoff:
+                break
+            if key not in self._pinned:
+                expired.append(key)
+        for key in expired:
+            await self._evict(key)
+            self.expired_sessions += 1
+
+    async def _restore(self, key: SessionKey) -> None:
+        """Loads an evicted session back into memory so the conversation can resume."""
+        try:
+            row = await asyncio.to_thread(self.store.load, key)
+        except sqlite3.Error as e:
+            logger.error(f"Could not load persisted session {key[2]}: {e}")
+            return
+        if row is None:
+            return
+        data, version = row
+        session = Session.model_validate_json(data)
+        app_name, user_id, session_id = key
+        self.sessions.setdefault(app_name, {}).setdefault(user_id, {})[session_id] = session
+        self._track(key, len(data))
+        self.restored_sessions += 1
+        if self.shared:
+            self._versions[key] = version
+        else:
+            await asyncio.to_thread(self.store.delete, key)
+        await self._enforce_limits(keep=key)
+
+    async def _write_through(self, key: SessionKey, session: Session) -> None:
+        """Writes a session after a completed turn so other workers can continue it."""
+        try:
+            self._versions[key] = await asyncio.to_thread(self.store.save, key, session.model_dump_json())
+            self.written_through += 1
+        except sqlite3.Error as e:
+            logger.error(f"Could not write through session {key[2]}: {e}")
+
+    async def _reload_if_stale(self, key: SessionKey) -> None:
+        """
+        Drops the in-memory copy of a session another worker has written since, so
+        it is restored. A pinned copy is kept: a run in this worker is appending to it.
+        """
+        try:
+            version = await asyncio.to_thread(self.store.version, key)
+        except sqlite3.Error as e:
+            logger.error(f"Could not check version of session {key[2]}: {e}")
+            return
+        if version is not None and version != self._versions.get(key) and key not in self._pinned:
+            await self._evict(key)
+            self.reloaded_sessions += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "live_sessions": len(self._lru),
+            "live_bytes": self.live_bytes,
+            "pinned_sessions": len(self._pinned),
+            "max_sessions": self.max_sessions,
+            "max_bytes": self.max_bytes,
+            "idle_ttl_seconds": self.idle_ttl_seconds,
+            "evicted_sessions": self.evicted_sessions,
+            "evicted_bytes": self.evicted_bytes,
+            "expired_sessions": self.expired_sessions,
+            "restored_sessions": self.restored_sessions,
+            "persistence": self.store is not None,
+            "shared": self.shared,
+            "written_through": self.written_through,
+            "reloaded_sessions": self.reloaded_sessions,
+        }
@@ -0,0 +1,253 @@
+"""
+A2A task store with a bounded in-memory tier over a shared SQLite database.
+
+Every save is written through to SQLite (WAL mode), so tasks survive restarts
+and are visible to every A2A worker process using the same database. A small
+in-process LRU, bounded by task count and serialized bytes, keeps recently
+used tasks so `tasks/get` polling does not re-parse large task payloads: a
+cached terminal task is returned directly, and a cached running task only
+costs a version lookup to confirm no other process has updated it.
+
+Terminal tasks (completed, canceled, failed, rejected) leave memory after
+`memory_ttl_seconds` and are deleted from disk after `retention_hours`. A task
+that reached a terminal state is never overwritten, so a run still going in one
+worker cannot undo a cancellation recorded by another.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from a2a.server.tasks import TaskStore
+from a2a.types import Task, TaskState
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS a2a_tasks (
+    id TEXT PRIMARY KEY,
+    context_id TEXT,
+    state TEXT,
+    data TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_a2a_tasks_updated_at ON a2a_tasks (updated_at);
+"""
+
+TERMINAL_STATES = {TaskState.completed, TaskState.canceled, TaskState.failed, TaskState.rejected}
+
+# How often expired terminal tasks are purged from disk
+PURGE_INTERVAL_SECONDS = 60
+
+
+def is_terminal(task: Task) -> bool:
+    return task.status is not None and task.status.state in TERMINAL_STATES
+
+
+class _Cached:
+    __slots__ = ("task", "version", "size", "terminal_at")
+
+    def __init__(self, task: Task, version: int, size: int, terminal_at: Optional[float]):
+        self.task = task
+        self.version = version
+        self.size = size
+        self.terminal_at = terminal_at
+
+
+class SQLiteTaskStore(TaskStore):
+    """TaskStore backed by SQLite with a bounded, TTL-evicted memory tier."""
+
+    def __init__(
+        self,
+        db_path: str,
+        memory_tasks: int = 256,
+        memory_bytes: int = 64 * 1024 * 1024,
+        memory_ttl_seconds: float = 600,
+        retention_hours: float = 24,
+    ):
+        self.db_path = db_path
+        self.memory_tasks = memory_tasks
+        self.memory_bytes = memory_bytes
+        self.memory_ttl_seconds = memory_ttl_seconds
+        self.retention_seconds = retention_hours * 3600
+        self._memory: "OrderedDict[str, _Cached]" = OrderedDict()
+        self._memory_size = 0
+        self._local = threading.local()
+        self._last_purge = 0.0
+        self.memory_hits = 0
+        self.disk_reads = 0
+        self.writes = 0
+        self.rejected_writes = 0
+        self.purged = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    # --- Memory tier ---
+
+    def _remember(self, task: Task, version: int, size: int) -> None:
+        previous = self._memory.pop(task.id, None)
+        if previous is not None:
+            self._memory_size -= previous.size
+        terminal_at = time.monotonic() if is_terminal(task) else None
+        self._memory[task.id] = _Cached(task, version, size, terminal_at)
+        self._memory_size += size
+        self._evict()
+
+    def _forget(self, task_id: str) -> None:
+        cached = self._memory.pop(task_id, None)
+        if cached is not None:
+            self._memory_size -= cached.size
+
+    def _evict(self) -> None:
+        """Drops expired terminal tasks, then least recently used tasks past the limits."""
+        cutoff = time.monotonic() - self.memory_ttl_seconds
+        expired = [task_id for task_id, cached in self._memory.items()
+                   if cached.terminal_at is not None and cached.terminal_at < cutoff]
+        for task_id in expired:
+            self._forget(task_id)
+        while self._memory and (len(self._memory) > self.memory_tasks or self._memory_size > self.memory_bytes):
+            self._forget(next(iter(self._memory)))
+
+    # --- Disk tier (run in worker threads) ---
+
+    def _write(self, task: Task, data: str) -> Optional[int]:
+        """Upserts a task and returns its new version, or None if the stored task is already terminal."""
+        conn = self._connect()
+        states = tuple(state.value for state in TERMINAL_STATES)
+        cursor = conn.execute(
+            "INSERT INTO a2a_tasks (id, context_id, state, data, version, updated_at) VALUES (?, ?, ?, ?, 1, ?) "
+            "ON CONFLICT(id) DO UPDATE SET context_id = excluded.context_id, state = excluded.state, "
+            "data = excluded.data, version = a2a_tasks.version + 1, updated_at = excluded.updated_at "
+            f"WHERE a2a_tasks.state IS NULL OR a2a_tasks.state NOT IN ({', '.join('?' * len(states))})",
+            (task.id, task.contextId, task.status.state.value if task.status else None, data, time.time(), *states),
+        )
+        if cursor.rowcount == 0:
+            conn.commit()
+            return None
+        version = conn.execute("SELECT version FROM a2a_tasks WHERE id = ?", (task.id,)).fetchone()[0]
+        conn.commit()
+        return version
+
+    def _read_version(self, task_id: str) -> Optional[int]:
+        row = self._connect().execute("SELECT version FROM a2a_tasks WHERE id = ?", (task_id,)).fetchone()
+        return row[0] if row else None
+
+    def _read(self, task_id: str) -> Optional[Tuple[str, int]]:
+        row = self._connect().execute("SELECT data, version FROM a2a_tasks WHERE id = ?", (task_id,)).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def _delete(self, task_id: str) -> None:
+        conn = self._connect()
+        conn.execute("DELETE FROM a2a_tasks WHERE id = ?", (task_id,))
+        conn.commit()
+
+    def _purge(self) -> int:
+        conn = self._connect()
+        states = tuple(state.value for state in TERMINAL_STATES)
+        cursor = conn.execute(
+            f"DELETE FROM a2a_tasks WHERE updated_at < ? AND state IN ({', '.join('?' * len(states))})",
+            (time.time() - self.retention_seconds, *states),
+        )
+        conn.commit()
+        return cursor.rowcount
+
+    # --- TaskStore API ---
+
+    async def save(self, task: Task, context: Any = None) -> None:
+        data = task.model_dump_json(exclude_none=True)
+        try:
+            version = await asyncio.to_thread(self._write, task, data)
+        except sqlite3.Error as e:
+            logger.error(f"Task store write failed for {task.id}: {e}")
+            version = 0
+        if version is None:
+            # Finished or canceled elsewhere; the stored state stands
+            logger.info(f"Ignored update of A2A Task {task.id}: it is already in a terminal state.")
+            self.rejected_writes += 1
+            self._forget(task.id)
+        else:
+            self.writes += 1
+            self._remember(task, version, len(data))
+
+        now = time.monotonic()
+        if now - self._last_purge > PURGE_INTERVAL_SECONDS:
+            self._last_purge = now
+            try:
+                self.purged += await asyncio.to_thread(self._purge)
+            except sqlite3.Error as e:
+                logger.warning(f"Task store purge failed: {e}")
+
+    async def get(self, task_id: str, context: Any = None) -> Optional[Task]:
+        cached = self._memory.get(task_id)
+        if cached is not None:
+            if cached.terminal_at is not None:
+                self._memory.move_to_end(task_id)
+                self.memory_hits += 1
+                return cached.task
+            try:
+                version = await asyncio.to_thread(self._read_version, task_id)
+            except sqlite3.Error as e:
+                logger.error(f"Task store read failed for {task_id}: {e}")
+                version = cached.version
+            if version == cached.version and task_id in self._memory:
+                self._memory.move_to_end(task_id)
+                self.memory_hits += 1
+                return cached.task
+
+        try:
+            row = await asyncio.to_thread(self._read, task_id)
+        except sqlite3.Error as e:
+            logger.error(f"Task store read failed for {task_id}: {e}")
+            return None
+        if row is None:
+            self._forget(task_id)
+            return None
+        data, version = row
+        task = Task.model_validate_json(data)
+        self.disk_reads += 1
+        self._remember(task, version, len(data))
+        return task
+
+    async def delete(self, task_id: str, context: Any = None) -> None:
+        self._forget(task_id)
+        try:
+            await asyncio.to_thread(self._delete, task_id)
+        except sqlite3.Error as e:
+            logger.error(f"Task store delete failed for {task_id}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        self._evict()
+        return {
+            "memory_tasks": len(self._memory),
+            "memory_bytes": self._memory_size,
+            "memory_hits": self.memory_hits,
+            "disk_reads": self.disk_reads,
+            "writes": self.writes,
+            "rejected_writes": self.rejected_writes,
+            "purged": self.purged,
+        }
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,110 @@
+"""
+MCP toolset that is connected before the first request and stays connected.
+
+`MCPToolset` connects lazily and runs `list_tools` every time the agent asks
+for its tools, i.e. on every model call. This subclass caches the filtered
+tool list after the first successful listing, is connected and health-checked
+at startup, pings the MCP server periodically, and reconnects with
+exponential backoff when the connection drops. The toolset is shared by the
+process-wide agent, so one MCP session serves every ADK session.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
+
+logger = logging.getLogger(__name__)
+
+
+class WarmMCPToolset(MCPToolset):
+    """MCPToolset with a cached tool schema, startup warm-up and reconnect with backoff."""
+
+    def __init__(self, *, health_interval: float = 30, max_backoff: float = 30, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.health_interval = health_interval
+        self.max_backoff = max_backoff
+        self._tools: Optional[List[BaseTool]] = None
+        self._tools_lock = asyncio.Lock()
+        self.connected = False
+        self.stats: Dict[str, Any] = {
+            "list_tools": 0,
+            "cached_tool_lookups": 0,
+            "reconnects": 0,
+            "health_failures": 0,
+            "connect_seconds": None,
+        }
+
+    async def get_tools(self, readonly_context=None) -> List[BaseTool]:
+        if self._tools is not None:
+            self.stats["cached_tool_lookups"] += 1
+            return list(self._tools)
+        async with self._tools_lock:
+            if self._tools is None:
+                self._tools = await super().get_tools(readonly_context)
+                self.stats["list_tools"] += 1
+                logger.info(f"MCP tool schema cached: {', '.join(tool.name for tool in self._tools)}")
+        return list(self._tools)
+
+    async def _check(self) -> None:
+        session = await self._mcp_session_manager.create_session()
+        await asyncio.wait_for(session.send_ping(), timeout=10)
+
+    async def connect(self, attempts: Optional[int] = None) -> bool:
+        """
+        Connects, lists tools and pings the server, retrying with exponential backoff.
+
+        Args:
+            attempts: Give up after this many failures; None retries until it succeeds.
+
+        Returns:
+            True once connected.
+        """
+        delay, failures = 0.5, 0
+        started = time.monotonic()
+        while True:
+            try:
+                await self.get_tools()
+                await self._check()
+                self.connected = True
+                self.stats["connect_seconds"] = round(time.monotonic() - started, 3)
+                logger.info(f"MCP toolset connected in {self.stats['connect_seconds']}s")
+                return True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                self.connected = False
+                if attempts is not None and failures >= attempts:
+                    logger.error(f"MCP toolset could not connect after {failures} attempts: {e}")
+                    return False
+                logger.warning(f"MCP toolset connection failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+                delay = min(delay * 2, self.max_backoff)
+
+    async def keep_alive(self) -> None:
+        """Pings the MCP server every `health_interval` seconds and reconnects when it stops answering."""
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self._check()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["health_failures"] += 1
+                self.connected = False
+                logger.warning(f"MCP health check failed ({e}); reconnecting")
+                try:
+                    await self._mcp_session_manager.close()
+                except Exception as close_error:
+                    logger.debug(f"Closing the stale MCP session failed: {close_error}")
+                self._tools = None
+                await self.connect()
+                self.stats["reconnects"] += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        return {"connected": self.connected, "tools": len(self._tools or []), **self.stats}
@@ -0,0 +1,97 @@
+"""
+Delivers fetched transcripts to the user as artifacts instead of model output.
+
+An after-tool callback on the agent picks up successful `get_transcript`
+responses, saves the transcript through the ADK artifact service and hands the
+model a short summary (title, source, size and the transcript handle) in place
+of the text. The executor forwards the saved artifact to the A2A client as soon
+as the tool returns, so the model only writes its commentary and never has to
+re-generate the transcript token by token.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_TOOL = "get_transcript"
+
+
+def tool_payload(tool_response: Any) -> Optional[Dict[str, Any]]:
+    """
+    Returns the tool's own result dict from an MCP tool response.
+
+    ADK passes MCP results as a dumped CallToolResult (`structuredContent` and/or
+    a text `content` part holding the JSON result); plain dicts are returned as is.
+    """
+    if not isinstance(tool_response, dict):
+        return None
+    if "success" in tool_response:
+        return tool_response
+    structured = tool_response.get("structuredContent") or tool_response.get("structured_content")
+    if isinstance(structured, dict):
+        return structured.get("result", structured) if "success" not in structured else structured
+    for part in tool_response.get("content") or []:
+        if isinstance(part, dict) and part.get("type") == "text":
+            try:
+                payload = json.loads(part.get("text") or "")
+            except ValueError:
+                continue
+            if isinstance(payload, dict):
+                return payload
+    return None
+
+
+def artifact_filename(payload: Dict[str, Any]) -> str:
+    name = payload.get("handle") or payload.get("title") or "earnings_call"
+    return re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_")[:80] + "_transcript.md"
+
+
+def render_transcript(payload: Dict[str, Any]) -> str:
+    """Formats the transcript as a markdown document."""
+    header = [f"# {payload.get('title') or 'Earnings Call Transcript'}"]
+    source = payload.get("source_info") or payload.get("source")
+    if source:
+        header.append(f"_{source}_" + (f" ({payload['source_url']})" if payload.get("source_url") else ""))
+    return "\n\n".join(header + [payload["transcript"]])
+
+
+async def deliver_transcript_artifact(tool, args: Dict[str, Any], tool_context, tool_response: Any) -> Optional[Dict[str, Any]]:
+    """
+    After-tool callback: saves a fetched transcript as an artifact and gives the
+    model a summary instead of the full text.
+
+    Returns:
+        The replacement tool response, or None to keep the original.
+    """
+    if tool.name != TRANSCRIPT_TOOL:
+        return None
+    payload = tool_payload(tool_response)
+    if not payload or not payload.get("success") or not payload.get("transcript"):
+        return None
+
+    from google.genai import types as genai_types
+
+    filename = artifact_filename(payload)
+    text = render_transcript(payload)
+    try:
+        await tool_context.save_artifact(filename=filename, artifact=genai_types.Part.from_text(text=text))
+    except Exception as e:
+        logger.warning(f"Could not save transcript artifact {filename}, returning it to the model: {e}")
+        return None
+
+    summary = {k: v for k, v in payload.items() if k not in ("transcript", "roster")}
+    summary.update({
+        "artifact": filename,
+        "total_chars": len(payload["transcript"]),
+        "message": (
+            "The complete transcript has been delivered to the user as an attachment. "
+            "Do not reproduce it; reply with a brief acknowledgment, the source and short commentary. "
+            + (f"To quote specific passages, read pages with get_transcript_page(handle='{payload['handle']}')."
+               if payload.get("handle") else "")
+        ),
+    })
+    logger.info(f"Transcript delivered as artifact {filename} ({len(text)} chars)")
+    return summary
@@ -0,0 +1,134 @@
+"""
+Long-lived, pooled HTTP client for the transcript backend.
+
+One `httpx.AsyncClient` is shared by every MCP tool call and route, so
+connections to the backend are kept alive and reused instead of being set up
+and torn down per call. Requests are spread round-robin over the configured
+backend replicas, failing over to the next replica on connection errors.
+"""
+
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from config.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class BackendClient:
+    """Shared client for one or more backend replicas."""
+
+    def __init__(self, base_urls: List[str], timeouts: Dict[str, float]):
+        if not base_urls:
+            raise ValueError("At least one backend URL is required")
+        self.base_urls = [url.rstrip("/") for url in base_urls]
+        self.timeouts = timeouts
+        self._rotation = itertools.cycle(range(len(self.base_urls)))
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled client; created on first use if `start()` was not called."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeouts["default"], connect=settings.MCP_BACKEND_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=settings.MCP_BACKEND_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.MCP_BACKEND_MAX_KEEPALIVE,
+                    keepalive_expiry=settings.MCP_BACKEND_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._client
+
+    async def start(self) -> None:
+        """Creates the connection pool at server startup."""
+        _ = self.client
+        logger.info(f"Backend client ready for {', '.join(self.base_urls)}")
+
+    async def aclose(self) -> None:
+        """Closes pooled connections at server shutdown."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def timeout_for(self, operation: str) -> float:
+        return self.timeouts.get(operation, self.timeouts["default"])
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        operation: str = "default",
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Sends a request to the next backend replica, failing over on connection errors.
+
+        Args:
+            method: HTTP method.
+            path: Path on the backend, e.g. "/get-transcript".
+            operation: Name of the timeout profile to use (see `MCP_*_TIMEOUT` settings).
+            **kwargs: Passed through to `httpx.AsyncClient.request`.
+
+        Returns:
+            The backend response.
+        """
+        kwargs.setdefault(
+            "timeout", httpx.Timeout(self.timeout_for(operation), connect=settings.MCP_BACKEND_CONNECT_TIMEOUT)
+        )
+        last_error: Optional[httpx.RequestError] = None
+        for _ in range(len(self.base_urls)):
+            base_url = self.base_urls[next(self._rotation)]
+            try:
+                return await self.client.request(method, f"{base_url}{path}", **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                logger.warning(f"Backend replica {base_url} unreachable: {e}")
+                last_error = e
+        raise last_error
+
+    @asynccontextmanager
+    async def stream(self, method: str, path: str, operation: str = "default", **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """
+        Like `request`, but yields the response before its body is read (for
+        event streams); the connection is released when the block exits.
+        """
+        kwargs.setdefault(
+            "timeout", httpx.Timeout(self.timeout_for(operation), connect=settings.MCP_BACKEND_CONNECT_TIMEOUT)
+        )
+        response: Optional[httpx.Response] = None
+        last_error: Optional[httpx.RequestError] = None
+        for _ in range(len(self.base_urls)):
+            base_url = self.base_urls[next(self._rotation)]
+            try:
+                request = self.client.build_request(method, f"{base_url}{path}", **kwargs)
+                response = await self.client.send(request, stream=True)
+                break
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                logger.warning(f"Backend replica {base_url} unreachable: {e}")
+                last_error = e
+        if response is None:
+            raise last_error
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    async def get(self, path: str, operation: str = "default", **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", path, operation, **kwargs)
+
+    async def post(self, path: str, operation: str = "default", **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", path, operation, **kwargs)
+
+
+backend = BackendClient(
+    settings.earnings_call_backend_urls,
+    timeouts={
+        "default": settings.MCP_BACKEND_DEFAULT_TIMEOUT,
+        "get_transcript": settings.MCP_GET_TRANSCRIPT_TIMEOUT,
+        "health": settings.MCP_HEALTH_TIMEOUT,
+    },
+)
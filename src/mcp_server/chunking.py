@@ -0,0 +1,91 @@
+"""
+Splits transcripts into pages aligned to speaker turns.
+
+Pages are packed with whole speaker turns (see `utils.transcript_structure`)
+up to the requested size; a single turn longer than a page is split at
+paragraph, then line, boundaries.
+"""
+
+import math
+from typing import Any, Dict, List, NamedTuple
+
+from utils.transcript_structure import find_speaker_turns
+
+# Rough chars-per-token ratio for English prose with Gemini/GPT-style tokenizers
+CHARS_PER_TOKEN = 4
+
+
+class Chunk(NamedTuple):
+    start: int
+    end: int
+    speakers: List[str]
+
+
+def estimate_tokens(text_or_length: Any) -> int:
+    """Approximate token count of a string (or of a length in characters)."""
+    length = text_or_length if isinstance(text_or_length, int) else len(text_or_length)
+    return math.ceil(length / CHARS_PER_TOKEN)
+
+
+def _split_long(text: str, start: int, end: int, chunk_chars: int) -> List[int]:
+    """Cut points inside text[start:end] so no piece exceeds chunk_chars, preferring paragraph breaks."""
+    cuts = []
+    while end - start > chunk_chars:
+        limit = start + chunk_chars
+        # Only accept breaks in the second half of the page to avoid tiny pages
+        floor = start + chunk_chars // 2
+        cut = text.rfind("\n\n", floor, limit)
+        if cut <= floor:
+            cut = text.rfind("\n", floor, limit)
+        if cut <= floor:
+            cut = text.rfind(" ", floor, limit)
+        if cut <= floor:
+            cut = limit
+        cuts.append(cut)
+        start = cut
+    return cuts
+
+
+def chunk_transcript(text: str, chunk_chars: int) -> List[Chunk]:
+    """
+    Packs speaker turns into pages of at most `chunk_chars` characters.
+
+    Returns:
+        The pages in order, as character offsets into `text` plus the speakers
+        whose turns start in each page.
+    """
+    if not text:
+        return []
+
+    turns = find_speaker_turns(text)
+    bounds = [start for start, _ in turns] + [len(text)]
+    chunks: List[Chunk] = []
+    page_start, speakers = 0, []
+
+    for (turn_start, speaker), turn_end in zip(turns, bounds[1:]):
+        if turn_start > page_start and turn_end - page_start > chunk_chars:
+            chunks.append(Chunk(page_start, turn_start, speakers))
+            page_start, speakers = turn_start, []
+
+        if speaker and speaker not in speakers:
+            speakers.append(speaker)
+
+        if turn_end - page_start > chunk_chars:
+            for cut in _split_long(text, page_start, turn_end, chunk_chars):
+                chunks.append(Chunk(page_start, cut, speakers))
+                page_start, speakers = cut, [speaker] if speaker else []
+
+    chunks.append(Chunk(page_start, len(text), speakers))
+    return chunks
+
+
+def outline(chunks: List[Chunk], max_speakers: int = 4) -> List[Dict[str, Any]]:
+    """Compact per-page table of contents the agent can use to pick pages."""
+    return [
+        {
+            "page": number,
+            "chars": chunk.end - chunk.start,
+            "speakers": chunk.speakers[:max_speakers],
+        }
+        for number, chunk in enumerate(chunks, start=1)
+    ]
@@ -0,0 +1,138 @@
+"""
+Background health monitor for the MCP server's dependencies.
+
+Each backend replica's `/health` is polled on an interval with random jitter
+(so several MCP replicas do not poll in lockstep). The latest status, latency,
+last error and the backend's own health payload are kept in memory, and the
+`/health` and `/debug/sources` routes serve that snapshot without making any
+request of their own.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from mcp_server.backend_client import BackendClient
+from utils.json_codec import loads as json_loads
+
+logger = logging.getLogger(__name__)
+
+
+class DependencyStatus:
+    """Latest probe result for one dependency."""
+
+    def __init__(self, name: str, url: str):
+        self.name = name
+        self.url = url
+        self.healthy = False
+        self.status_code: Optional[int] = None
+        self.latency_ms: Optional[float] = None
+        self.last_checked: Optional[str] = None
+        self.last_success: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.consecutive_failures = 0
+        self.checked_at_monotonic: Optional[float] = None
+        self.info: Dict[str, Any] = {}
+
+    def to_dict(self, stale_after: float) -> Dict[str, Any]:
+        age = None if self.checked_at_monotonic is None else time.monotonic() - self.checked_at_monotonic
+        return {
+            "name": self.name,
+            "url": self.url,
+            "healthy": self.healthy,
+            "status_code": self.status_code,
+            "latency_ms": self.latency_ms,
+            "last_checked": self.last_checked,
+            "last_success": self.last_success,
+            "last_error": self.last_error,
+            "consecutive_failures": self.consecutive_failures,
+            "stale": age is None or age > stale_after,
+        }
+
+
+class HealthMonitor:
+    """Polls backend replicas in the background and keeps the latest snapshot."""
+
+    def __init__(self, client: BackendClient, interval: float, jitter: float, timeout: float):
+        self.client = client
+        self.interval = interval
+        self.jitter = jitter
+        self.timeout = timeout
+        self.backends: List[DependencyStatus] = [
+            DependencyStatus(f"backend-{i}", url) for i, url in enumerate(client.base_urls)
+        ]
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Starts the polling loop; the first poll runs immediately without delaying startup."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="health-monitor")
+            logger.info(f"Health monitor polling {len(self.backends)} backend(s) every ~{self.interval}s")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error(f"Health poll failed: {e}", exc_info=True)
+            delay = self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+            await asyncio.sleep(max(1.0, delay))
+
+    async def poll_once(self) -> None:
+        await asyncio.gather(*(self._probe(status) for status in self.backends))
+
+    async def _probe(self, status: DependencyStatus) -> None:
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc).isoformat()
+        try:
+            response = await self.client.client.get(f"{status.url}/health", timeout=self.timeout)
+            status.status_code = response.status_code
+            status.healthy = response.status_code == 200
+            if status.healthy:
+                status.info = json_loads(response.content)
+                status.last_success = now
+                status.last_error = None
+                status.consecutive_failures = 0
+            else:
+                status.last_error = f"HTTP {response.status_code}"
+                status.consecutive_failures += 1
+        except (httpx.HTTPError, ValueError) as e:
+            status.healthy = False
+            status.status_code = None
+            status.last_error = f"{type(e).__name__}: {e}"
+            status.consecutive_failures += 1
+        status.latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        status.last_checked = now
+        status.checked_at_monotonic = time.monotonic()
+        if not status.healthy and status.consecutive_failures in (1, 10):
+            logger.warning(f"Backend {status.url} unhealthy: {status.last_error}")
+
+    @property
+    def healthy(self) -> bool:
+        """True if at least one backend replica passed its last probe."""
+        return any(status.healthy for status in self.backends)
+
+    def backend_info(self) -> Dict[str, Any]:
+        """Health payload of the first healthy replica, or {} if none is healthy."""
+        for status in self.backends:
+            if status.healthy:
+                return status.info
+        return {}
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        stale_after = self.interval * (1 + self.jitter) * 3
+        return [status.to_dict(stale_after) for status in self.backends]
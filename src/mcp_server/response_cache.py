@@ -0,0 +1,128 @@
+"""
+In-process TTL/LRU cache for `get_transcript` results.
+
+The cache is bounded by the total size of the cached payloads rather than by
+entry count, since one transcript can be hundreds of KB. Entries expire after
+a TTL and the least recently used entries are evicted first when the byte
+budget is exceeded.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[Any, ...]
+
+
+def make_request_key(
+    company_ticker: Optional[str] = None,
+    year: Optional[int] = None,
+    quarter: Optional[int] = None,
+    url: Optional[str] = None,
+) -> Optional[CacheKey]:
+    """
+    Normalizes a get_transcript request into a cache key; None if the request is incomplete.
+
+    URL keys keep the URL as given, because handles are built from keys and the
+    URL is fetched again from a handle. The cache itself ignores a trailing slash.
+    """
+    if company_ticker and year and quarter:
+        return ("ticker", company_ticker.strip().upper(), int(year), int(quarter))
+    if url:
+        return ("url", url.strip())
+    return None
+
+
+def lookup_key(key: CacheKey) -> CacheKey:
+    """The key a request is cached under: URLs with and without a trailing slash share an entry."""
+    if key[0] == "url":
+        return ("url", key[1].rstrip("/"))
+    return key
+
+
+def key_to_handle(key: CacheKey) -> str:
+    """Opaque string handle for a cached transcript, e.g. "ticker:MSFT:2023:4"."""
+    return ":".join(str(part) for part in key)
+
+
+def handle_to_key(handle: str) -> Optional[CacheKey]:
+    """Inverse of `key_to_handle`; None if the handle is malformed."""
+    kind, _, rest = handle.strip().partition(":")
+    if kind == "url" and rest:
+        return ("url", rest)
+    if kind == "ticker":
+        parts = rest.split(":")
+        if len(parts) == 3 and parts[1].isdigit() and parts[2].isdigit():
+            return ("ticker", parts[0].upper(), int(parts[1]), int(parts[2]))
+    return None
+
+
+class ResponseCache:
+    """Byte-bounded LRU cache with per-entry TTL."""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the cached value, or None if missing or expired."""
+        key = lookup_key(key)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(value)
+
+    def put(self, key: CacheKey, value: Dict[str, Any], size: int) -> None:
+        """Caches `value`, accounting `size` bytes against the budget."""
+        key = lookup_key(key)
+        if size > self.max_bytes:
+            logger.debug(f"Not caching {key}: {size} bytes exceeds the whole cache budget")
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, size, dict(value))
+        self.total_bytes += size
+
+        while self.total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.total_bytes -= size
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -4,30 +4,58 @@ Enhanced MCP server with multi-source transcript fetching
 
 import logging
 import sys
-from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
 import httpx
-from fastmcp import FastMCP
+import uvicorn
+from fastmcp import FastMCP, Context
 from pydantic import Field
-from fastapi.responses import JSONResponse
+from starlette.middleware import Middleware
+from config.config import settings
+from utils.json_codec import FastJSONResponse as JSONResponse, loads as json_loads
+from utils.compression import CompressionMiddleware
+from mcp_server.backend_client import backend
+from mcp_server.health_monitor import HealthMonitor
+from mcp_server.response_cache import ResponseCache, make_request_key, key_to_handle, handle_to_key
+from mcp_server.chunking import chunk_transcript, estimate_tokens, outline
+from utils.ticker_master import SCORE_CONFIDENT, get_ticker_master
 
 logger = logging.getLogger(__name__)
 
 # Backend configuration
-BACKEND_API_URL = "http://localhost:8082"
+# The backend's deadline is set a little below ours so it gives up (and
+# cancels its source calls) before we stop waiting for it
+BACKEND_DEADLINE_MARGIN = 5.0
 
 print("=== MCP Server Starting ===", file=sys.stderr)
-print(f"Backend API URL: {BACKEND_API_URL}", file=sys.stderr)
+print(f"Backend API URLs: {', '.join(backend.base_urls)}", file=sys.stderr)
 print("Multi-source transcript fetching enabled", file=sys.stderr)
 print("===============================", file=sys.stderr)
 
 mcp = FastMCP("earnings_call_transcript_tools")
 
+transcript_cache = ResponseCache(
+    max_bytes=settings.MCP_CACHE_MAX_BYTES,
+    ttl_seconds=settings.MCP_CACHE_TTL_SECONDS,
+)
+
+health_monitor = HealthMonitor(
+    backend,
+    interval=settings.MCP_HEALTH_POLL_INTERVAL,
+    jitter=settings.MCP_HEALTH_POLL_JITTER,
+    timeout=settings.MCP_HEALTH_TIMEOUT,
+)
+
 @mcp.tool(name="get_transcript")
 async def get_transcript(
+    ctx: Context,
     company_ticker: Optional[str] = Field(None, description="Stock ticker symbol (e.g., 'MSFT', 'AAPL')"),
     year: Optional[int] = Field(None, description="Year of the earnings call (e.g., 2023)"),
     quarter: Optional[int] = Field(None, description="Quarter of the earnings call (1, 2, 3, or 4)"),
-    url: Optional[str] = Field(None, description="Direct URL of the earnings call transcript (any source)")
+    url: Optional[str] = Field(None, description="Direct URL of the earnings call transcript (any source)"),
+    paginate: bool = Field(False, description="Return a transcript handle and page outline instead of the full text"),
+    page_chars: Optional[int] = Field(None, description="Page size in characters when paginating")
 ) -> Dict[str, Any]:
     """
     Fetches earnings call transcript using intelligent multi-source fallback:
@@ -37,86 +65,231 @@ async def get_transcript(
     4. User-provided URL (fallback)
     
     The tool automatically tries each source in order until successful.
+    
+    With paginate=True, returns a handle, the total size, a token estimate and a
+    per-page outline of speakers instead of the text; read pages with
+    get_transcript_page.
+    
+    While the backend searches, progress notifications name the source or
+    candidate URL being checked.
     """
     
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        try:
-            # Build request payload
-            payload = {}
-            
-            if company_ticker and year and quarter:
-                payload = {
-                    "company_ticker": company_ticker.upper(),
-                    "year": year,
-                    "quarter": quarter
-                }
-                logger.info(f"Starting multi-source search for {company_ticker} Q{quarter} {year}")
-            elif url:
-                payload = {"url": url}
-                logger.info(f"Using direct URL: {url}")
-            else:
-                return {
-                    "success": False,
-                    "error": "Please provide either (1) company ticker, year, and quarter OR (2) a direct URL",
-                    "usage_examples": [
-                        "Natural search: ticker='AAPL', year=2024, quarter=1",
-                        "Direct URL: url='https://example.com/transcript'"
-                    ]
-                }
-            
-            # Make request to enhanced backend
-            response = await client.post(
-                f"{BACKEND_API_URL}/get-transcript",
-                json=payload
-            )
+    async def relay_progress(event: Dict[str, Any], count: int) -> None:
+        await ctx.report_progress(progress=count, message=event.get("message"))
+    
+    result = await load_transcript(company_ticker, year, quarter, url, on_progress=relay_progress)
+    if not result.get("success"):
+        return result
+    
+    handle = key_to_handle(make_request_key(company_ticker, year, quarter, url))
+    if not paginate:
+        # The handle lets a client that delivers the text elsewhere still read pages later
+        return {**result, "handle": handle}
+    
+    text = result.get("transcript") or ""
+    size = page_size(page_chars)
+    pages = transcript_pages(text, size)
+    summary = {k: v for k, v in result.items() if k != "transcript"}
+    summary.update({
+        "handle": handle,
+        "total_chars": len(text),
+        "total_tokens_estimate": estimate_tokens(text),
+        "page_chars": size,
+        "total_pages": len(pages),
+        "pages": outline(pages),
+        "message": f"Transcript has {len(pages)} pages. Use get_transcript_page with handle '{handle}' to read them."
+    })
+    return summary
+
+@mcp.tool(name="get_transcript_page")
+async def get_transcript_page(
+    handle: str = Field(..., description="Transcript handle returned by get_transcript(paginate=True)"),
+    page: int = Field(1, description="Page number, starting at 1"),
+    page_chars: Optional[int] = Field(None, description="Page size in characters; must match the size used for the outline")
+) -> Dict[str, Any]:
+    """
+    Returns one page of a transcript. Pages hold whole speaker turns where possible,
+    so a page never starts mid-answer unless a single turn is longer than a page.
+    """
+    
+    key = handle_to_key(handle)
+    if key is None:
+        return {"success": False, "error": f"Invalid transcript handle: {handle}"}
+    
+    if key[0] == "ticker":
+        result = await load_transcript(company_ticker=key[1], year=key[2], quarter=key[3])
+    else:
+        result = await load_transcript(url=key[1])
+    if not result.get("success"):
+        return result
+    
+    text = result.get("transcript") or ""
+    size = page_size(page_chars)
+    pages = transcript_pages(text, size)
+    if not 1 <= page <= len(pages):
+        return {"success": False, "error": f"Page {page} is out of range (1-{len(pages)})", "total_pages": len(pages)}
+    
+    chunk = pages[page - 1]
+    page_text = text[chunk.start:chunk.end]
+    return {
+        "success": True,
+        "handle": handle,
+        "title": result.get("title"),
+        "page": page,
+        "total_pages": len(pages),
+        "has_more": page < len(pages),
+        "start_offset": chunk.start,
+        "end_offset": chunk.end,
+        "speakers": chunk.speakers,
+        "tokens_estimate": estimate_tokens(page_text),
+        "text": page_text
+    }
+
+def page_size(page_chars: Optional[int]) -> int:
+    return max(1000, min(page_chars or settings.MCP_PAGE_CHARS, settings.MCP_PAGE_MAX_CHARS))
+
+async def post_with_progress(
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    on_progress: Callable[[Dict[str, Any], int], Awaitable[None]]
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Posts to /get-transcript asking for a progress event stream.
+    
+    Returns:
+        The result and its size in bytes. Cache hits come back as plain JSON.
+    """
+    async with backend.stream(
+        "POST", "/get-transcript", operation="get_transcript", json=payload,
+        headers={**headers, "Accept": "text/event-stream"}
+    ) as response:
+        if response.status_code >= 400:
+            await response.aread()
             response.raise_for_status()
-            result = response.json()
-            
-            # Log the source used
-            if result.get("success"):
-                source = result.get("source_type", "unknown")
-                logger.info(f"Successfully retrieved transcript from source: {source}")
-                
-                # Add user-friendly message about the source
-                if source == "official":
-                    result["source_info"] = "Retrieved from official company source"
-                elif source == "fmp":
-                    result["source_info"] = "Retrieved from Financial Modeling Prep API"
-                elif source == "motley_fool":
-                    result["source_info"] = "Retrieved from Motley Fool"
-                elif source == "user_provided":
-                    result["source_info"] = "Retrieved from user-provided URL"
-            else:
-                # Log which sources were attempted
-                attempts = result.get("search_attempts", [])
-                if attempts:
-                    logger.warning(f"All sources failed. Attempted: {', '.join(attempts)}")
-            
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Backend API error: {e.response.status_code} - {e.response.text}")
-            return {
-                "success": False, 
-                "error": f"Backend API error: {e.response.text}",
-                "status_code": e.response.status_code
-            }
-        except httpx.RequestError as e:
-            logger.error(f"Failed to connect to backend API: {e}")
-            return {
-                "success": False, 
-                "error": "Connection to backend service failed. Please ensure the backend is running.",
-                "troubleshooting": [
-                    "Check if backend is running on port 8082",
-                    "Run: python run_backend.py"
-                ]
+        if not response.headers.get("content-type", "").startswith("text/event-stream"):
+            content = await response.aread()
+            return json_loads(content), len(content)
+        
+        event, count = None, 0
+        async for line in response.aiter_lines():
+            if line.startswith("event:"):
+                event = line[6:].strip()
+            elif line.startswith("data:"):
+                data = line[5:].strip()
+                if event == "result":
+                    return json_loads(data), len(data)
+                count += 1
+                try:
+                    await on_progress(json_loads(data), count)
+                except Exception as e:
+                    logger.debug(f"Progress relay failed: {e}")
+    raise httpx.RemoteProtocolError("Backend progress stream ended without a result")
+
+# Page layouts are reused across get_transcript_page calls for the same transcript
+transcript_pages = lru_cache(maxsize=32)(chunk_transcript)
+
+async def load_transcript(
+    company_ticker: Optional[str] = None,
+    year: Optional[int] = None,
+    quarter: Optional[int] = None,
+    url: Optional[str] = None,
+    on_progress: Optional[Callable[[Dict[str, Any], int], Awaitable[None]]] = None
+) -> Dict[str, Any]:
+    """
+    Returns the transcript from the response cache, or fetches it from the backend.
+    
+    With `on_progress`, the backend streams progress events, which are passed
+    on with a running count as they arrive.
+    """
+    
+    cache_key = make_request_key(company_ticker, year, quarter, url)
+    if cache_key:
+        cached = transcript_cache.get(cache_key)
+        if cached:
+            logger.info(f"Serving {cache_key} from the MCP response cache")
+            return cached
+    
+    try:
+        # Build request payload
+        payload = {}
+        
+        if company_ticker and year and quarter:
+            payload = {
+                "company_ticker": company_ticker.upper(),
+                "year": year,
+                "quarter": quarter
             }
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}", exc_info=True)
+            logger.info(f"Starting multi-source search for {company_ticker} Q{quarter} {year}")
+        elif url:
+            payload = {"url": url}
+            logger.info(f"Using direct URL: {url}")
+        else:
             return {
                 "success": False,
-                "error": f"Unexpected error: {str(e)}"
+                "error": "Please provide either (1) company ticker, year, and quarter OR (2) a direct URL",
+                "usage_examples": [
+                    "Natural search: ticker='AAPL', year=2024, quarter=1",
+                    "Direct URL: url='https://example.com/transcript'"
+                ]
             }
+        
+        # Make request to enhanced backend
+        headers = {"X-Request-Timeout": str(backend.timeout_for("get_transcript") - BACKEND_DEADLINE_MARGIN)}
+        if on_progress is None:
+            response = await backend.post("/get-transcript", operation="get_transcript", json=payload, headers=headers)
+            response.raise_for_status()
+            result, size = json_loads(response.content), len(response.content)
+        else:
+            result, size = await post_with_progress(payload, headers, on_progress)
+        
+        # Log the source used
+        if result.get("success"):
+            source = result.get("source_type", "unknown")
+            logger.info(f"Successfully retrieved transcript from source: {source}")
+            
+            # Add user-friendly message about the source
+            if source == "official":
+                result["source_info"] = "Retrieved from official company source"
+            elif source == "fmp":
+                result["source_info"] = "Retrieved from Financial Modeling Prep API"
+            elif source == "motley_fool":
+                result["source_info"] = "Retrieved from Motley Fool"
+            elif source == "user_provided":
+                result["source_info"] = "Retrieved from user-provided URL"
+        else:
+            # Log which sources were attempted
+            attempts = result.get("search_attempts", [])
+            if attempts:
+                logger.warning(f"All sources failed. Attempted: {', '.join(attempts)}")
+        
+        if result.get("success") and cache_key:
+            transcript_cache.put(cache_key, result, size=size)
+        
+        return result
+        
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Backend API error: {e.response.status_code} - {e.response.text}")
+        return {
+            "success": False, 
+            "error": f"Backend API error: {e.response.text}",
+            "status_code": e.response.status_code
+        }
+    except httpx.RequestError as e:
+        logger.error(f"Failed to connect to backend API: {e}")
+        return {
+            "success": False, 
+            "error": "Connection to backend service failed. Please ensure the backend is running.",
+            "troubleshooting": [
+                "Check if backend is running on port 8082",
+                "Run: python run_backend.py"
+            ]
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}", exc_info=True)
+        return {
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
+        }
 
 @mcp.tool(name="search_transcripts")
 async def search_transcripts(
@@ -126,21 +299,177 @@ async def search_transcripts(
 ) -> Dict[str, Any]:
     """
     Searches for available earnings call transcripts for a company.
-    This is useful for discovering what transcripts are available before fetching.
+    This is useful for discovering what transcripts are available before fetching,
+    and for resolving the "latest" call, without downloading any transcript.
+    
+    Returns each known (year, quarter) with its sources and whether it is already
+    cached (cached transcripts are returned instantly by get_transcript).
     """
     
-    # This would integrate with your backend to search across sources
-    # For now, returning a placeholder
-    return {
-        "success": True,
-        "ticker": company_ticker.upper(),
-        "message": f"To search for specific transcripts, use get_transcript with ticker, year, and quarter.",
-        "example": {
-            "company_ticker": company_ticker.upper(),
-            "year": 2024,
-            "quarter": 1
+    params = {"ticker": company_ticker.strip().upper()}
+    if start_year:
+        params["start_year"] = start_year
+    if end_year:
+        params["end_year"] = end_year
+    
+    try:
+        response = await backend.get("/transcripts/available", params=params)
+        response.raise_for_status()
+        return json_loads(response.content)
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Backend availability lookup error: {e.response.status_code} - {e.response.text}")
+        return {
+            "success": False,
+            "error": f"Backend API error: {e.response.text}",
+            "status_code": e.response.status_code
         }
+    except httpx.RequestError as e:
+        logger.error(f"Failed to connect to backend API: {e}")
+        return {
+            "success": False,
+            "error": "Connection to backend service failed. Please ensure the backend is running."
+        }
+
+@mcp.tool(name="search_transcript_mentions")
+async def search_transcript_mentions(
+    terms: List[str] = Field(..., description="Words or phrases to look for (e.g., ['AI', 'pricing power'])"),
+    company_ticker: Optional[str] = Field(None, description="Stock ticker symbol (e.g., 'MSFT', 'AAPL')"),
+    year: Optional[int] = Field(None, description="Year of the earnings call (e.g., 2023)"),
+    quarter: Optional[int] = Field(None, description="Quarter of the earnings call (1, 2, 3, or 4)"),
+    url: Optional[str] = Field(None, description="Direct URL of the earnings call transcript"),
+    stem: bool = Field(False, description="Also match inflections (e.g., 'price' matches 'pricing', 'priced')"),
+    case_sensitive: bool = Field(False, description="Match the terms' capitalization exactly"),
+    max_snippets: int = Field(10, description="Maximum number of context snippets per term")
+) -> Dict[str, Any]:
+    """
+    Searches one earnings call transcript for mentions of terms or phrases on the
+    server, without loading the transcript into the conversation.
+    
+    Returns, per term, the total mention count, counts per speaker and per section
+    (prepared remarks vs Q&A), and context snippets with character offsets.
+    """
+    
+    payload = {
+        "terms": terms,
+        "stem": stem,
+        "case_sensitive": case_sensitive,
+        "max_snippets": max_snippets
     }
+    if company_ticker and year and quarter:
+        payload.update({"company_ticker": company_ticker.strip().upper(), "year": year, "quarter": quarter})
+    elif url:
+        payload["url"] = url
+    else:
+        return {
+            "success": False,
+            "error": "Please provide either (1) company ticker, year, and quarter OR (2) a direct URL"
+        }
+    
+    try:
+        response = await backend.post(
+            "/transcripts/search",
+            operation="get_transcript",
+            json=payload,
+            headers={"X-Request-Timeout": str(backend.timeout_for("get_transcript") - BACKEND_DEADLINE_MARGIN)}
+        )
+        response.raise_for_status()
+        return json_loads(response.content)
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Backend mention search error: {e.response.status_code} - {e.response.text}")
+        return {
+            "success": False,
+            "error": f"Backend API error: {e.response.text}",
+            "status_code": e.response.status_code
+        }
+    except httpx.RequestError as e:
+        logger.error(f"Failed to connect to backend API: {e}")
+        return {
+            "success": False,
+            "error": "Connection to backend service failed. Please ensure the backend is running."
+        }
+
+@mcp.tool(name="get_call_roster")
+async def get_call_roster(
+    company_ticker: Optional[str] = Field(None, description="Stock ticker symbol (e.g., 'TSLA', 'AAPL')"),
+    year: Optional[int] = Field(None, description="Year of the earnings call (e.g., 2024)"),
+    quarter: Optional[int] = Field(None, description="Quarter of the earnings call (1, 2, 3, or 4)"),
+    url: Optional[str] = Field(None, description="Direct URL of the earnings call transcript")
+) -> Dict[str, Any]:
+    """
+    Returns who spoke on an earnings call, without the transcript text: executives
+    with their titles, analysts with their firms and number of questions, and
+    turn and word counts per speaker.
+    """
+    
+    if company_ticker and year and quarter:
+        payload = {"company_ticker": company_ticker.strip().upper(), "year": year, "quarter": quarter}
+    elif url:
+        payload = {"url": url}
+    else:
+        return {
+            "success": False,
+            "error": "Please provide either (1) company ticker, year, and quarter OR (2) a direct URL"
+        }
+    
+    try:
+        response = await backend.post(
+            "/transcripts/roster",
+            operation="get_transcript",
+            json=payload,
+            headers={"X-Request-Timeout": str(backend.timeout_for("get_transcript") - BACKEND_DEADLINE_MARGIN)}
+        )
+        response.raise_for_status()
+        return json_loads(response.content)
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Backend roster error: {e.response.status_code} - {e.response.text}")
+        return {
+            "success": False,
+            "error": f"Backend API error: {e.response.text}",
+            "status_code": e.response.status_code
+        }
+    except httpx.RequestError as e:
+        logger.error(f"Failed to connect to backend API: {e}")
+        return {
+            "success": False,
+            "error": "Connection to backend service failed. Please ensure the backend is running."
+        }
+
+@mcp.tool(name="term_trends")
+async def term_trends(
+    company_ticker: str = Field(..., description="Stock ticker symbol (e.g., 'MSFT', 'AAPL')"),
+    terms: List[str] = Field(..., description="Words or phrases to track (e.g., ['pricing', 'AI', 'supply chain'])"),
+    quarters: int = Field(8, description="Number of most recent quarters to include"),
+    stem: bool = Field(True, description="Count word variants together (e.g., 'price', 'pricing', 'priced')")
+) -> Dict[str, Any]:
+    """
+    Tracks how often terms and phrases come up across a company's recent earnings
+    calls, computed on the server from cached transcripts.
+    
+    Returns a compact table: per term, raw counts and frequency per 1,000 words for
+    each quarter (oldest first), the change from first to last quarter, the trend
+    slope and the peak quarter. Quarters that are known but not cached yet are
+    listed in "not_cached"; fetch them with get_transcript to include them.
+    """
+    
+    payload = {"ticker": company_ticker.strip().upper(), "terms": terms, "quarters": quarters, "stem": stem}
+    
+    try:
+        response = await backend.post("/analytics/term-trends", json=payload)
+        response.raise_for_status()
+        return json_loads(response.content)
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Backend term trends error: {e.response.status_code} - {e.response.text}")
+        return {
+            "success": False,
+            "error": f"Backend API error: {e.response.text}",
+            "status_code": e.response.status_code
+        }
+    except httpx.RequestError as e:
+        logger.error(f"Failed to connect to backend API: {e}")
+        return {
+            "success": False,
+            "error": "Connection to backend service failed. Please ensure the backend is running."
+        }
 
 @mcp.tool(name="validate_ticker")
 async def validate_ticker(
@@ -149,51 +478,120 @@ async def validate_ticker(
     """
     Validates a stock ticker and returns company information.
     Useful for confirming the correct ticker before searching for transcripts.
+    Renamed tickers (e.g. FB) point to the current ticker. A ticker missing from
+    a partial master is "unknown" (valid is null), not invalid, and comes back
+    with the closest matches.
     """
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        try:
-            # You could call a validation endpoint on your backend
-            # For now, we'll return a simple response
+    try:
+        master = get_ticker_master()
+        symbol = ticker.strip().upper()
+        entry = master.get(symbol)
+        if entry:
             return {
                 "success": True,
-                "ticker": ticker.upper(),
+                "ticker": entry.ticker,
                 "valid": True,
-                "message": f"Ticker {ticker.upper()} is valid. Use get_transcript to fetch earnings calls."
+                "status": "valid",
+                "company_name": entry.name,
+                "share_classes": master.share_classes(entry.ticker),
+                "message": f"Ticker {entry.ticker} is {entry.name}. Use get_transcript to fetch earnings calls."
             }
-            
-        except Exception as e:
+
+        renamed = master.renamed_to(symbol)
+        if renamed:
             return {
-                "success": False,
-                "error": f"Failed to validate ticker: {str(e)}"
+                "success": True,
+                "ticker": symbol,
+                "valid": False,
+                "status": "renamed",
+                "renamed_to": renamed,
+                "company_name": master.get(renamed).name,
+                "message": f"Ticker {symbol} now trades as {renamed}."
             }
 
-@mcp.custom_route("/health", methods=["GET"], include_in_schema=False)
-async def health_check(request):
-    """Health check endpoint for the MCP server."""
-    
-    # Check backend health
-    backend_healthy = False
-    backend_info = {}
+        suggestions = master.resolve(ticker, limit=3)
+        if master.complete:
+            return {
+                "success": True,
+                "ticker": symbol,
+                "valid": False,
+                "status": "invalid",
+                "suggestions": suggestions,
+                "message": f"Ticker {symbol} is not an SEC-registered ticker."
+            }
+        return {
+            "success": True,
+            "ticker": symbol,
+            "valid": None,
+            "status": "unknown",
+            "suggestions": suggestions,
+            "message": (
+                f"Ticker {symbol} is not in the local ticker master, which only lists major companies, "
+                f"so it may still be valid. Use it if it is the ticker the user asked for."
+            )
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to validate ticker: {str(e)}"
+        }
+
+@mcp.tool(name="resolve_ticker")
+async def resolve_ticker(
+    query: str = Field(..., description="Company name, former name, alias or ticker (e.g., 'Alphabet', 'Facebook', 'msft')"),
+    limit: int = Field(5, description="Maximum number of matches to return")
+) -> Dict[str, Any]:
+    """
+    Resolves a company name to its stock ticker(s) using the local ticker master.
+    Matches are ranked by score; companies with several share classes (e.g.
+    GOOG/GOOGL) list all of them. `confident` is false when no match clearly
+    identifies the company, e.g. because it is missing from a partial master.
+    """
     
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{BACKEND_API_URL}/health")
-            if response.status_code == 200:
-                backend_healthy = True
-                backend_info = response.json()
-    except:
-        pass
+        master = get_ticker_master()
+        matches = master.resolve(query, limit=max(1, min(limit, 20)))
+        confident = bool(matches) and matches[0]["score"] >= SCORE_CONFIDENT
+        if confident:
+            message = f"Best match: {matches[0]['ticker']} ({matches[0]['name']})"
+        elif master.complete:
+            message = f"No SEC-registered company clearly matches '{query}'"
+        else:
+            message = (
+                f"No confident match for '{query}' in the local ticker master, which only lists major "
+                f"companies. Use the company's ticker if you know it; otherwise ask the user."
+            )
+        return {
+            "success": True,
+            "query": query,
+            "confident": confident,
+            "matches": matches,
+            "message": message
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to resolve ticker: {str(e)}"
+        }
+
+@mcp.custom_route("/health", methods=["GET"], include_in_schema=False)
+async def health_check(request):
+    """Health check endpoint for the MCP server, served from the background monitor's snapshot."""
     
     return JSONResponse({
         "status": "ok",
         "service": "earnings-call-mcp-server",
         "version": "2.0.0",
         "backend": {
-            "url": BACKEND_API_URL,
-            "healthy": backend_healthy,
-            "info": backend_info
+            "urls": backend.base_urls,
+            "healthy": health_monitor.healthy,
+            "replicas": health_monitor.snapshot(),
+            "info": health_monitor.backend_info()
         },
+        "transcript_cache": transcript_cache.stats(),
         "capabilities": [
             "Multi-source transcript fetching",
             "Automatic fallback mechanism",
@@ -207,38 +605,68 @@ async def health_check(request):
 async def debug_sources(request):
     """Debug endpoint to check which transcript sources are configured."""
     
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{BACKEND_API_URL}/health")
-            if response.status_code == 200:
-                data = response.json()
-                return JSONResponse({
-                    "backend_connected": True,
-                    "configured_sources": data.get("configured_services", {}),
-                    "message": "Check backend logs for detailed source testing"
-                })
-    except:
-        pass
+    if health_monitor.healthy:
+        return JSONResponse({
+            "backend_connected": True,
+            "configured_sources": health_monitor.backend_info().get("configured_services", {}),
+            "message": "Check backend logs for detailed source testing"
+        })
     
     return JSONResponse({
         "backend_connected": False,
+        "replicas": health_monitor.snapshot(),
         "message": "Cannot reach backend service"
     })
 
+def build_http_app(middleware):
+    """
+    Builds the MCP HTTP app and ties the shared backend client's lifetime to
+    it: the pool is opened and the health monitor started at startup, and both
+    are stopped on shutdown.
+    """
+    if settings.MCP_TRANSPORT == "streamable-http":
+        app = mcp.http_app(
+            path="/mcp",
+            middleware=middleware,
+            transport="streamable-http",
+            stateless_http=settings.MCP_STATELESS_HTTP,
+        )
+    else:
+        app = mcp.http_app(path="/mcp", middleware=middleware, transport="sse")
+    mcp_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app):
+        await backend.start()
+        await health_monitor.start()
+        try:
+            async with mcp_lifespan(app):
+                yield
+        finally:
+            await health_monitor.stop()
+            await backend.aclose()
+
+    app.router.lifespan_context = lifespan
+    return app
+
 def main():
     """Main function to run the enhanced MCP server."""
-    host = "127.0.0.1"
-    port = 8001  # MCP server port
+    host = settings.MCP_SERVER_HOST
+    port = settings.EARNINGS_CALL_MCP_PORT_INTERNAL
     
-    logger.info(f"Starting Enhanced Earnings Call MCP server at http://{host}:{port}/mcp")
-    print(f"Enhanced MCP Server running at http://{host}:{port}/mcp", file=sys.stderr)
+    logger.info(f"Starting Enhanced Earnings Call MCP server at http://{host}:{port}/mcp ({settings.MCP_TRANSPORT})")
+    print(f"Enhanced MCP Server running at http://{host}:{port}/mcp ({settings.MCP_TRANSPORT})", file=sys.stderr)
     print("Features:", file=sys.stderr)
     print("  - Official source search via Gemini", file=sys.stderr)
     print("  - Financial Modeling Prep API integration", file=sys.stderr)
     print("  - Automatic Motley Fool search", file=sys.stderr)
     print("  - Intelligent fallback mechanism", file=sys.stderr)
     
-    mcp.run(transport="sse", host=host, port=port, path="/mcp")
+    middleware = []
+    if settings.HTTP_COMPRESSION_ENABLED:
+        middleware.append(Middleware(CompressionMiddleware, minimum_size=settings.HTTP_COMPRESSION_MIN_BYTES))
+    
+    uvicorn.run(build_http_app(middleware), host=host, port=port, log_level=settings.LOG_LEVEL.lower())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
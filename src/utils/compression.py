@@ -0,0 +1,147 @@
+"""
+Negotiated HTTP response compression for the backend, MCP and A2A services:
+    - An ASGI middleware that compresses responses with zstd (when the optional
+      `zstandard` package is installed) or gzip, based on the client's
+      Accept-Encoding header.
+    - Event streams (SSE) are never compressed, since buffering would delay events.
+"""
+import logging
+import zlib
+from typing import Optional, List, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+SUPPORTED_ENCODINGS = ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Picks the best supported encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: The raw header value, e.g. "gzip, zstd;q=0.9".
+
+    Returns:
+        "zstd", "gzip", or None if the client accepts neither.
+    """
+    accepted: List[Tuple[str, float]] = []
+    for item in accept_encoding.split(","):
+        token, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted.append((token.strip().lower(), quality))
+
+    qualities = dict(accepted)
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    # SUPPORTED_ENCODINGS is in server preference order, so ties keep the earlier one
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class _Compressor:
+    """Uniform streaming interface over zlib (gzip) and zstandard."""
+
+    def __init__(self, encoding: str, gzip_level: int, zstd_level: int):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._obj = zstandard.ZstdCompressor(level=zstd_level).compressobj()
+        else:
+            self._obj = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        out = self._obj.compress(data)
+        if final:
+            return out + self._obj.flush()
+        # Flush so streamed chunks reach the client without waiting for more data
+        if self.encoding == "zstd":
+            return out + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return out + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """ASGI middleware that compresses HTTP responses per the client's Accept-Encoding."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, zstd_level: int = 3):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                # Hold the headers until the first body chunk tells us whether to compress
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                content_type = headers.get("content-type", "")
+                if (
+                    "content-encoding" in headers
+                    or content_type.startswith("text/event-stream")
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding, self.gzip_level, self.zstd_level)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del headers["Content-Length"]
+                    body = compressor.compress(body, final=False)
+                else:
+                    body = compressor.compress(body, final=True)
+                    headers["Content-Length"] = str(len(body))
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                return
+
+            await send({
+                "type": "http.response.body",
+                "body": compressor.compress(body, final=not more_body),
+                "more_body": more_body,
+            })
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,62 @@
+"""
+JSON encoding helpers shared by the backend, MCP and A2A services:
+    - Uses orjson when it is installed (several times faster on large transcript
+      payloads) and falls back to the standard library encoder otherwise.
+"""
+import json
+import logging
+from typing import Any, Union
+
+from starlette.responses import JSONResponse
+
+from config.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+HAS_ORJSON = orjson is not None and settings.FAST_JSON_ENABLED
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serializes `obj` to UTF-8 JSON bytes.
+
+    Args:
+        obj: Any JSON-serializable value.
+
+    Returns:
+        The encoded JSON document.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects some types the stdlib accepts (e.g. ints > 64 bits)
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Parses a JSON document.
+
+    Args:
+        data: The encoded JSON as bytes or str.
+
+    Returns:
+        The decoded Python value.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """Starlette JSON response rendered with the fast codec."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,229 @@
+"""
+Local ticker master: ticker validation and company name -> ticker resolution.
+
+The master is loaded once from a local file (the bundled CSV, or the SEC
+`company_tickers.json` export for full coverage) into in-memory indexes:
+    - a dict of tickers (and former tickers) for exact lookups,
+    - a sorted array of normalized names, aliases and former names, plus every
+      word-suffix of them, for prefix search with `bisect`,
+    - share-class groups (GOOG/GOOGL, BRK.A/BRK.B) keyed by issuer.
+Fuzzy matching with difflib only runs when exact and prefix matching find nothing.
+
+The bundled CSV only lists major companies, so a ticker or name missing from it
+is "unknown", not invalid. Only a master loaded from the SEC export is
+`complete`, i.e. covers every SEC-registered ticker.
+"""
+
+import csv
+import difflib
+import json
+import logging
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from config.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Corporate suffixes that carry no identifying information
+_SUFFIXES = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "companies", "ltd",
+    "limited", "plc", "llc", "lp", "holdings", "holding", "group", "sa", "nv", "ag", "se",
+}
+_CLASS_RE = re.compile(r"\bclass [a-z]\b")
+
+# Match scores; higher ranks first
+SCORE_TICKER = 1.0
+SCORE_NAME = 0.97
+SCORE_FORMER = 0.9
+SCORE_TICKER_PREFIX = 0.8
+SCORE_NAME_PREFIX = 0.75
+SCORE_WORD_PREFIX = 0.7
+SCORE_FUZZY = 0.6
+# A top match scoring at least this identifies the company; below it, callers should not rely on it
+SCORE_CONFIDENT = SCORE_FORMER
+
+
+def normalize_name(name: str) -> str:
+    """Lowercases a company name and strips punctuation, share classes and corporate suffixes."""
+    text = name.lower().replace("&", " and ")
+    text = _CLASS_RE.sub(" ", text)
+    words = re.findall(r"[a-z0-9]+", text.replace(".com", " "))
+    if words and words[0] == "the":
+        words = words[1:]
+    while len(words) > 1 and words[-1] in _SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+@dataclass(frozen=True)
+class TickerEntry:
+    ticker: str
+    name: str
+    issuer: str
+    aliases: Tuple[str, ...] = field(default_factory=tuple)
+    former_names: Tuple[str, ...] = field(default_factory=tuple)
+    former_tickers: Tuple[str, ...] = field(default_factory=tuple)
+
+
+class TickerMaster:
+    """In-memory ticker and company name index."""
+
+    def __init__(self, entries: List[TickerEntry], complete: bool = False):
+        self.complete = complete
+        self.entries: Dict[str, TickerEntry] = {entry.ticker: entry for entry in entries}
+        self._former_tickers: Dict[str, str] = {}
+        self._issuers: Dict[str, List[str]] = {}
+        # (normalized key, ticker, match kind, score); sorted for bisect prefix search
+        index: List[Tuple[str, str, str, float]] = []
+
+        for entry in entries:
+            self._issuers.setdefault(entry.issuer, []).append(entry.ticker)
+            for former in entry.former_tickers:
+                self._former_tickers.setdefault(former, entry.ticker)
+
+            names = [(entry.name, "name", SCORE_NAME)]
+            names += [(alias, "alias", SCORE_NAME) for alias in entry.aliases]
+            names += [(former, "former_name", SCORE_FORMER) for former in entry.former_names]
+            for name, kind, score in names:
+                key = normalize_name(name)
+                if not key:
+                    continue
+                index.append((key, entry.ticker, kind, score))
+                words = key.split()
+                for i in range(1, len(words)):
+                    index.append((" ".join(words[i:]), entry.ticker, "word", SCORE_WORD_PREFIX))
+
+        index.sort()
+        self._keys = [row[0] for row in index]
+        self._index = index
+        self._tickers = sorted(self.entries)
+        self._fuzzy_keys = sorted({row[0] for row in index if row[2] != "word"})
+        logger.info(
+            f"Ticker master loaded: {len(self.entries)} tickers, {len(index)} name keys"
+            f"{' (complete SEC list)' if complete else ''}"
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "TickerMaster":
+        """Loads the master from a CSV file or an SEC `company_tickers.json` export (complete)."""
+        path = Path(path)
+        if path.suffix.lower() == ".json":
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            rows = data.values() if isinstance(data, dict) else data
+            entries = [
+                TickerEntry(
+                    ticker=row["ticker"].upper().replace("-", "."),
+                    name=row["title"],
+                    issuer=str(row.get("cik_str") or row["ticker"]),
+                )
+                for row in rows
+            ]
+        else:
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                entries = [
+                    TickerEntry(
+                        ticker=row["ticker"].strip().upper(),
+                        name=row["name"].strip(),
+                        issuer=(row.get("issuer") or row["ticker"]).strip(),
+                        aliases=_split(row.get("aliases")),
+                        former_names=_split(row.get("former_names")),
+                        former_tickers=tuple(t.upper() for t in _split(row.get("former_tickers"))),
+                    )
+                    for row in csv.DictReader(f)
+                ]
+        # The SEC export lists every registered ticker; the CSV is a curated subset
+        return cls(entries, complete=path.suffix.lower() == ".json")
+
+    def get(self, ticker: str) -> Optional[TickerEntry]:
+        return self.entries.get(ticker.strip().upper().replace("-", "."))
+
+    def renamed_to(self, ticker: str) -> Optional[str]:
+        """Current ticker for a former ticker (e.g. FB -> META), if known."""
+        return self._former_tickers.get(ticker.strip().upper())
+
+    def share_classes(self, ticker: str) -> List[str]:
+        """All listed share classes of the ticker's issuer, including the ticker itself."""
+        entry = self.get(ticker)
+        return list(self._issuers.get(entry.issuer, [entry.ticker])) if entry else []
+
+    def resolve(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Resolves a ticker or company name to ranked ticker matches.
+
+        Args:
+            query: A ticker ("msft"), company name ("Microsoft Corp"), alias, former
+                name ("Facebook") or prefix of any of them ("goldm").
+            limit: Maximum number of matches to return.
+
+        Returns:
+            Matches ordered by score, each with the ticker, company name, score,
+            match kind, matched text and the issuer's share classes.
+        """
+        raw = query.strip()
+        if not raw:
+            return []
+        symbol = raw.upper().replace("-", ".")
+        key = normalize_name(raw)
+        best: Dict[str, Tuple[float, str, str]] = {}
+
+        def offer(ticker: str, score: float, kind: str, matched: str) -> None:
+            if ticker not in best or best[ticker][0] < score:
+                best[ticker] = (score, kind, matched)
+
+        if symbol in self.entries:
+            offer(symbol, SCORE_TICKER, "ticker", symbol)
+        if symbol in self._former_tickers:
+            offer(self._former_tickers[symbol], SCORE_FORMER, "former_ticker", symbol)
+
+        if len(symbol) <= 5:
+            i = bisect_left(self._tickers, symbol)
+            while i < len(self._tickers) and self._tickers[i].startswith(symbol):
+                offer(self._tickers[i], SCORE_TICKER_PREFIX, "ticker_prefix", self._tickers[i])
+                i += 1
+
+        if key:
+            i = bisect_left(self._keys, key)
+            while i < len(self._keys) and self._keys[i].startswith(key):
+                name_key, ticker, kind, score = self._index[i]
+                if name_key != key:
+                    # Prefix hits rank below exact ones, longer completions lowest
+                    score = min(score, SCORE_NAME_PREFIX) * (len(key) / len(name_key)) ** 0.5
+                offer(ticker, score, kind, name_key)
+                i += 1
+
+        if key and not best:
+            for name_key in difflib.get_close_matches(key, self._fuzzy_keys, n=limit, cutoff=0.75):
+                ratio = difflib.SequenceMatcher(None, key, name_key).ratio()
+                j = bisect_left(self._keys, name_key)
+                while j < len(self._keys) and self._keys[j] == name_key:
+                    offer(self._index[j][1], SCORE_FUZZY * ratio, "fuzzy", name_key)
+                    j += 1
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], len(item[0]), item[0]))[:limit]
+        return [
+            {
+                "ticker": ticker,
+                "name": self.entries[ticker].name,
+                "score": round(score, 3),
+                "match": kind,
+                "matched": matched,
+                "share_classes": self.share_classes(ticker),
+            }
+            for ticker, (score, kind, matched) in ranked
+        ]
+
+
+def _split(value: Optional[str]) -> Tuple[str, ...]:
+    return tuple(part.strip() for part in (value or "").split("|") if part.strip())
+
+
+@lru_cache(maxsize=1)
+def get_ticker_master() -> TickerMaster:
+    """The process-wide ticker master, loaded from `TICKER_MASTER_PATH` on first use."""
+    return TickerMaster.load(settings.TICKER_MASTER_PATH)
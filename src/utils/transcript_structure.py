@@ -0,0 +1,69 @@
+"""
+Structure of plain-text earnings call transcripts: speaker turns and sections.
+
+Transcripts from every source are plain text with each speaker turn starting on
+its own line, either as a speaker header ("Satya Nadella -- Chief Executive
+Officer", "Operator") or inline ("Amy Hood: Thank you..."). Motley Fool pages
+also mark sections with lines such as "Prepared Remarks:" and "Questions &
+Answers:".
+"""
+
+import re
+from typing import List, Tuple
+
+_SPEAKER_HEADER_RE = re.compile(r"^([A-Z][\w.'\-]*(?: [A-Z][\w.'\-]*){0,4}) -- .{2,80}$")
+_INLINE_SPEAKER_RE = re.compile(r"^([A-Z][\w.'\-]*(?: [A-Z][\w.'\-]*){0,4}):\s")
+_LINE_RE = re.compile(r"^.*$", re.MULTILINE)
+
+_SECTION_MARKERS = [
+    (re.compile(r"^prepared remarks:?$", re.IGNORECASE), "prepared_remarks"),
+    (re.compile(r"^(?:questions? (?:&|and) answers?|question-and-answer session):?$", re.IGNORECASE), "qa"),
+    (re.compile(r"^call participants:?$", re.IGNORECASE), "participants"),
+]
+
+
+def find_speaker_turns(text: str) -> List[Tuple[int, str]]:
+    """
+    Finds the speaker turns in a transcript.
+
+    Returns:
+        (start offset, speaker) for each turn, in order. Text before the first
+        turn (title, participant list) is reported as a turn with speaker "".
+    """
+    turns = [(0, "")]
+    for match in _LINE_RE.finditer(text):
+        line = match.group(0).strip()
+        if not line or len(line) > 120:
+            continue
+        if line == "Operator":
+            speaker = line
+        else:
+            match_speaker = _SPEAKER_HEADER_RE.match(line) or _INLINE_SPEAKER_RE.match(line)
+            if not match_speaker:
+                continue
+            speaker = match_speaker.group(1)
+        if match.start() == 0:
+            turns[0] = (0, speaker)
+        else:
+            turns.append((match.start(), speaker))
+    return turns
+
+
+def find_sections(text: str) -> List[Tuple[int, str]]:
+    """
+    Finds the sections of a transcript.
+
+    Returns:
+        (start offset, section) in order; text before any marker is "prepared_remarks".
+    """
+    sections = [(0, "prepared_remarks")]
+    for match in _LINE_RE.finditer(text):
+        line = match.group(0).strip()
+        if not line or len(line) > 40:
+            continue
+        for pattern, section in _SECTION_MARKERS:
+            if pattern.match(line):
+                sections.append((match.start(), section))
+                break
+    return sections
+
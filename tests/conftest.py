@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+# Modules import each other as top-level packages from src/ (see run_*.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+@pytest.fixture(params=["fallback", "porter"])
+def stemmer(request, monkeypatch):
+    """Runs a test with the built-in suffix stripper and, if NLTK is installed, the Porter stemmer."""
+    from backend_api import transcript_search
+
+    if request.param == "fallback":
+        monkeypatch.setattr(transcript_search, "_porter", None)
+    else:
+        porter = pytest.importorskip("nltk.stem").PorterStemmer()
+        monkeypatch.setattr(transcript_search, "_porter", porter)
+    return request.param
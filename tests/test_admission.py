@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from backend_api.admission import AdmissionController, DeadlineExceeded, Overloaded, RequestDeadline
+
+
+def test_spent_deadline_is_not_reported_as_overload():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=0, queue_timeout=5)
+        async with controller.admit(RequestDeadline(5)):
+            with pytest.raises(DeadlineExceeded):
+                async with controller.admit(RequestDeadline(0)):
+                    pass
+        return controller.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["expired_total"] == 1 and stats["rejected_total"] == 0
+
+
+def test_deadline_running_out_in_the_queue_is_a_deadline_error():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=1, queue_timeout=5)
+        async with controller.admit(RequestDeadline(5)):
+            with pytest.raises(DeadlineExceeded):
+                async with controller.admit(RequestDeadline(0.05)):
+                    pass
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_is_rejected_as_overloaded():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=0, queue_timeout=5)
+        async with controller.admit(RequestDeadline(5)):
+            with pytest.raises(Overloaded) as rejected:
+                async with controller.admit(RequestDeadline(5)):
+                    pass
+        return rejected.value.status_code
+
+    assert asyncio.run(scenario()) == 429
@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+from backend_api.availability_index import AvailabilityIndex
+from backend_api.transcript_cache import TranscriptCache, make_cache_key
+
+
+def test_cached_flag_follows_cache_expiry(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = TranscriptCache(db_path, ttl_hours=0)
+    index = AvailabilityIndex(db_path)
+    result = {"success": True, "transcript": "Operator: Welcome.", "source": "fmp"}
+
+    cache.put(make_cache_key("MSFT", 2023, 4), result, "MSFT", 2023, 4)
+    index.record("MSFT", 2023, 4, "fmp", cached=True)
+    assert index.lookup("MSFT")[0]["cached"] is False
+
+    cache.ttl = timedelta(hours=1)
+    cache.put(make_cache_key("MSFT", 2023, 4), result, "MSFT", 2023, 4)
+    assert index.lookup("MSFT")[0]["cached"] is True
+    index.close()
+    cache.close()
@@ -0,0 +1,13 @@
+import pytest
+
+from backend_api.page_verifier import verify_page_head
+
+
+@pytest.mark.parametrize("ticker,title,expected", [
+    ("AAPL", "Apple (AAPL) Q1 2024 Earnings Call Transcript", True),
+    ("AAPL", "Advance Auto Parts (AAP) Q1 2024 Earnings Call Transcript", False),
+    ("GOOGL", "Alphabet (GOOG) Q1 2024 Earnings Call Transcript", True),
+    ("BRK.B", "Berkshire Hathaway (BRK.A) Q1 2024 Earnings Call Transcript", True),
+])
+def test_page_head_matches_the_ticker_or_its_share_classes(ticker, title, expected):
+    assert verify_page_head(f"<title>{title}</title>", ticker, 2024, 1) is expected
@@ -0,0 +1,14 @@
+from mcp_server.response_cache import ResponseCache, handle_to_key, key_to_handle, make_request_key
+
+
+def test_url_handle_keeps_the_url_as_given():
+    url = "https://example.com/earnings/call-transcript/"
+    key = make_request_key(url=url)
+    assert handle_to_key(key_to_handle(key)) == ("url", url)
+
+
+def test_trailing_slash_shares_a_cache_entry():
+    cache = ResponseCache(max_bytes=1000, ttl_seconds=60)
+    cache.put(make_request_key(url="https://example.com/transcript/"), {"success": True}, 10)
+    assert cache.get(make_request_key(url="https://example.com/transcript")) == {"success": True}
+    assert cache.stats()["entries"] == 1
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+from google.adk.events import Event
+from google.genai import types
+
+from earnings_call_transcript_agent.session_service import BoundedSessionService, SessionStore
+
+APP, USER = "app", "user"
+
+
+def event(author: str, role: str, text: str) -> Event:
+    return Event(invocation_id="inv", author=author, content=types.Content(role=role, parts=[types.Part.from_text(text=text)]))
+
+
+async def open_sessions(service: BoundedSessionService, *session_ids: str) -> None:
+    for session_id in session_ids:
+        await service.create_session(app_name=APP, user_id=USER, session_id=session_id)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"), ttl_hours=1)
+    yield store
+    store.close()
+
+
+async def run_turn_with_concurrent_sessions(service: BoundedSessionService) -> None:
+    """Appends a two-event turn to s1 while other sessions push it over the limits."""
+    key = (APP, USER, "s1")
+    session = await service.pin_session(APP, USER, "s1")
+    try:
+        await service.append_event(session, event("user", "user", "Get the transcript"))
+        await open_sessions(service, "s2", "s3")
+        await service.append_event(session, event("agent", "model", "Here it is. " * 50))
+    finally:
+        service.unpin(key)
+
+
+def test_pinned_session_survives_count_eviction_mid_run():
+    async def scenario():
+        service = BoundedSessionService(max_sessions=2, max_bytes=10**9, idle_ttl_seconds=3600)
+        await run_turn_with_concurrent_sessions(service)
+        session = await service.get_session(app_name=APP, user_id=USER, session_id="s1")
+        assert session is not None and len(session.events) == 2
+        assert service.metrics()["evicted_sessions"] >= 1
+
+    asyncio.run(scenario())
+
+
+def test_pinned_session_survives_byte_eviction_mid_run():
+    async def scenario():
+        service = BoundedSessionService(max_sessions=100, max_bytes=1, idle_ttl_seconds=3600)
+        await run_turn_with_concurrent_sessions(service)
+        session = await service.get_session(app_name=APP, user_id=USER, session_id="s1")
+        assert session is not None and len(session.events) == 2
+
+    asyncio.run(scenario())
+
+
+def test_session_evicted_after_run_is_persisted_complete(store):
+    async def scenario():
+        service = BoundedSessionService(max_sessions=2, max_bytes=10**9, idle_ttl_seconds=3600, store=store)
+        await run_turn_with_concurrent_sessions(service)
+        # Once unpinned, s1 is the least recently used session and goes to the store
+        await open_sessions(service, "s4", "s5")
+        assert (APP, USER, "s1") not in service._lru
+        restored = await service.get_session(app_name=APP, user_id=USER, session_id="s1")
+        assert restored is not None and len(restored.events) == 2
+        assert service.metrics()["restored_sessions"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_pinned_session_does_not_expire():
+    async def scenario():
+        service = BoundedSessionService(max_sessions=10, max_bytes=10**9, idle_ttl_seconds=0)
+        key = (APP, USER, "s1")
+        session = await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+        service.pin(key)
+        await service.get_session(app_name=APP, user_id=USER, session_id="other")
+        await service.append_event(session, event("agent", "model", "done"))
+        assert len(service._stored_session(key).events) == 1
+        service.unpin(key)
+        await service.get_session(app_name=APP, user_id=USER, session_id="other")
+        assert service._stored_session(key) is None
+
+    asyncio.run(scenario())
+
+
+@pytest.fixture
+def shared_db(tmp_path):
+    return str(tmp_path / "shared.db")
+
+
+def worker_service(db_path: str) -> BoundedSessionService:
+    store = SessionStore(db_path, ttl_hours=1)
+    return BoundedSessionService(max_sessions=10, max_bytes=10**9, idle_ttl_seconds=3600, store=store, shared=True)
+
+
+async def run_turn(service: BoundedSessionService, question: str, answer: str) -> list:
+    """Runs one turn the way the executor does and returns the history the run started from."""
+    session = await service.pin_session(APP, USER, "s1")
+    try:
+        history = [e.content.parts[0].text for e in session.events]
+        await service.append_event(session, event("user", "user", question))
+        await service.append_event(session, event("agent", "model", answer))
+    finally:
+        service.unpin((APP, USER, "s1"))
+    return history
+
+
+def texts(session) -> list:
+    return [e.content.parts[0].text for e in session.events]
+
+
+def test_shared_turn_starts_from_history_written_by_another_worker(shared_db):
+    async def scenario():
+        worker_a, worker_b = worker_service(shared_db), worker_service(shared_db)
+        assert await run_turn(worker_a, "q1", "a1") == []
+        assert await run_turn(worker_b, "q2", "a2") == ["q1", "a1"]
+        # Worker A still holds its own, now stale, copy in memory
+        assert await run_turn(worker_a, "q3", "a3") == ["q1", "a1", "q2", "a2"]
+        session = await worker_b.pin_session(APP, USER, "s1")
+        worker_b.unpin((APP, USER, "s1"))
+        assert texts(session) == ["q1", "a1", "q2", "a2", "q3", "a3"]
+        assert worker_a.metrics()["reloaded_sessions"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_shared_session_is_not_reloaded_under_a_local_run(shared_db):
+    async def scenario():
+        worker_a, worker_b = worker_service(shared_db), worker_service(shared_db)
+        await run_turn(worker_a, "q1", "a1")
+        session = await worker_a.pin_session(APP, USER, "s1")
+        await worker_a.append_event(session, event("user", "user", "q2"))
+        await run_turn(worker_b, "other", "answer")
+        # The runner re-reads the session mid-run; it must get the copy it is appending to
+        current = await worker_a.get_session(app_name=APP, user_id=USER, session_id="s1")
+        assert texts(current) == ["q1", "a1", "q2"]
+        worker_a.unpin((APP, USER, "s1"))
+
+    asyncio.run(scenario())
@@ -0,0 +1,57 @@
+import pytest
+
+from backend_api import term_trends
+from backend_api.term_trends import TermTrendAnalyzer, TermVector
+
+PERIODS = [
+    ("Q1 2024", "We raised price once. Demand was steady."),
+    ("Q2 2024", "Pricing improved and we priced two tiers. Price increases stuck."),
+]
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    analyzer = TermTrendAnalyzer(str(tmp_path / "vectors.db"))
+    yield analyzer
+    analyzer.close()
+
+
+def periods():
+    return [(label, TermVector.from_text(text), lambda text=text: text) for label, text in PERIODS]
+
+
+def test_pricing_trend_counts_price_variants_together(stemmer, analyzer):
+    row, = analyzer.trend(periods(), ["pricing"])["terms"]
+    assert row["counts"] == [1, 3]
+
+
+def test_unstemmed_trend_counts_exact_word(analyzer):
+    row, = analyzer.trend(periods(), ["pricing"], use_stems=False)["terms"]
+    assert row["counts"] == [0, 1]
+
+
+def test_hyphenated_terms_count_their_parts(analyzer):
+    vector = TermVector.from_text("AI-driven growth and AI-powered search")
+    row, = analyzer.trend([("Q1 2024", vector, lambda: "")], ["AI"], use_stems=False)["terms"]
+    assert row["counts"] == [2]
+
+
+def test_vectors_from_an_older_tokenizer_are_rebuilt(analyzer):
+    conn = analyzer._connect()
+    conn.execute(
+        "INSERT INTO transcript_term_vectors (id, cached_at, total_words, counts, tokenizer) VALUES (?, ?, ?, ?, 1)",
+        ("t1", "2024-01-01", 1, '{"ai-driven": 1}'),
+    )
+    conn.commit()
+    vector = analyzer.vector_for("t1", "2024-01-01", lambda: "AI-driven")
+    assert vector.counts.get("ai") == 1 and analyzer.computed == 1
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_matrix_sums_term_columns_over_the_shared_vocabulary(use_numpy, monkeypatch):
+    if not use_numpy:
+        monkeypatch.setattr(term_trends, "np", None)
+    elif term_trends.np is None:
+        pytest.skip("NumPy is not installed")
+    matrix = term_trends.DocumentTermMatrix([TermVector.from_text(text) for _, text in PERIODS])
+    assert matrix.column_sums([["price", "priced"], ["demand"], ["missing"]]) == [[1, 1, 0], [2, 0, 0]]
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from config.config import settings
+from utils.ticker_master import SCORE_CONFIDENT, TickerMaster
+
+
+@pytest.fixture(scope="module")
+def bundled():
+    return TickerMaster.load(settings.TICKER_MASTER_PATH)
+
+
+def test_bundled_master_is_partial(bundled):
+    assert not bundled.complete
+
+
+@pytest.mark.parametrize("name", ["Lululemon", "Chipotle", "Etsy", "Roku", "Lucid"])
+def test_companies_outside_the_bundled_list_are_not_confident(bundled, name):
+    matches = bundled.resolve(name)
+    assert not matches or matches[0]["score"] < SCORE_CONFIDENT
+
+
+@pytest.mark.parametrize("query, ticker", [("Microsoft", "MSFT"), ("Facebook", "META"), ("msft", "MSFT")])
+def test_listed_companies_resolve_confidently(bundled, query, ticker):
+    top = bundled.resolve(query)[0]
+    assert top["ticker"] == ticker and top["score"] >= SCORE_CONFIDENT
+
+
+def test_sec_export_is_complete(tmp_path):
+    path = tmp_path / "company_tickers.json"
+    path.write_text(json.dumps({
+        "0": {"cik_str": 1397187, "ticker": "LULU", "title": "lululemon athletica inc."},
+        "1": {"cik_str": 1058090, "ticker": "CMG", "title": "CHIPOTLE MEXICAN GRILL INC"},
+    }))
+    master = TickerMaster.load(str(path))
+    assert master.complete
+    assert master.get("lulu").name == "lululemon athletica inc."
+    top = master.resolve("Chipotle Mexican Grill")[0]
+    assert top["ticker"] == "CMG" and top["score"] >= SCORE_CONFIDENT
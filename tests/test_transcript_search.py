@@ -0,0 +1,42 @@
+import pytest
+
+from backend_api.transcript_search import PositionalIndex, TranscriptSearcher, stem, tokenize
+
+TRANSCRIPT = """Prepared Remarks:
+Jane Doe -- Chief Executive Officer
+Our AI-driven roadmap and AI-powered assistants lead the year. AI demand is strong.
+Questions and Answers:
+John Roe -- Analyst
+How are you thinking about price? Pricing held up and we priced the new tier higher.
+"""
+
+
+def test_hyphenated_compounds_are_split():
+    assert tokenize("AI-driven and AI-powered") == ["AI", "driven", "and", "AI", "powered"]
+
+
+def test_search_for_ai_finds_hyphenated_mentions():
+    result = TranscriptSearcher().search("key", TRANSCRIPT, ["AI"])
+    assert result["terms"][0]["total"] == 3
+
+
+def test_hyphenated_query_matches_as_phrase():
+    index = PositionalIndex(TRANSCRIPT)
+    (start, end), = index.find("AI-driven")
+    assert TRANSCRIPT[start:end] == "AI-driven"
+    assert len(index.find("ai powered")) == 1
+
+
+def test_price_inflections_share_a_stem(stemmer):
+    assert stem("price") == stem("prices") == stem("priced") == stem("pricing")
+
+
+@pytest.mark.parametrize("query", ["price", "pricing", "priced"])
+def test_stemmed_search_matches_all_price_inflections(stemmer, query):
+    result = TranscriptSearcher().search("key", TRANSCRIPT, [query], use_stems=True)
+    assert result["terms"][0]["total"] == 3
+
+
+def test_unstemmed_search_is_exact():
+    result = TranscriptSearcher().search("key", TRANSCRIPT, ["price"])
+    assert result["terms"][0]["total"] == 1
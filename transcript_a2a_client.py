@@ -226,6 +226,15 @@ async def interactive_loop(client: A2AClient, user_id: str) -> None:
                 print(full_response)
                 print("=" * 60)
                 
+                # Transcripts arrive as task artifacts rather than in the message
+                for artifact in final.artifacts or []:
+                    artifact_text = "".join(
+                        p.root.text for p in artifact.parts if isinstance(p.root, TextPart) and p.root.text
+                    )
+                    print(f"\n📄 {artifact.name or 'Artifact'}:")
+                    print(artifact_text)
+                    print("=" * 60)
+                
                 # Show task completion status
                 if final.status.state == TaskState.completed:
                     print("✅ Request completed successfully")
@@ -282,8 +291,8 @@ async def run_client_interaction(agent_url: str, user_id: str) -> None:
         print(f"❌ Cannot connect to agent at {agent_url}")
         print("\nMake sure all services are running:")
         print("  1. python run_backend.py    # Backend API (port 8082)")
-        print("  2. python run_mcp.py        # MCP Server (port 8001)")
-        print("  3. python run_a2a.py        # A2A Server (port 8081)")
+        print("  2. python run_mcp.py        # MCP Server (port 8081)")
+        print("  3. python run_a2a.py        # A2A Server (port 8080)")
         print("\nThen run this client again.")
         
     except Exception as exc: